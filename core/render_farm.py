@@ -0,0 +1,286 @@
+import os
+import sys
+import json
+import time
+import argparse
+import fnmatch
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+# Script is in core/, but intended to be run from root: python core/render_farm.py
+# Every job is a separate `python -m manim` process, so the pool below only
+# has to schedule and watch them; the actual rendering runs on all cores.
+REGISTRY_PATH = "scene_registry.json"
+LOG_DIR = os.path.join("media", "render_farm")
+QUALITIES = ["l", "m", "h", "p", "k"]
+FORMATS = ["mp4", "mov", "webm", "gif", "png"]
+
+STATUS_STYLE = {
+    "queued": "dim",
+    "running": "yellow",
+    "retrying": "magenta",
+    "done": "green",
+    "failed": "bold red",
+}
+
+
+def load_registry(path=REGISTRY_PATH):
+    if not os.path.exists(path):
+        print(f"Error: Registry file '{path}' not found.")
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def select_entries(registry, selectors):
+    # No selectors means the whole catalog. A selector matches an entry id, a
+    # keyword, a class name or a title case-insensitively, either exactly or
+    # as a glob pattern: "Graph" only selects the scene called "Graph", while
+    # "Graph*" also selects "GraphTheoryIntro".
+    if not selectors:
+        return list(registry)
+
+    wanted = [s.lower() for s in selectors]
+    selected = []
+    for item in registry:
+        names = [str(item["id"]), item["class_name"], item["title"]]
+        names += item.get("keywords", [])
+        names = [name.lower() for name in names]
+        if any(fnmatch.filter(names, sel) for sel in wanted):
+            selected.append(item)
+    return selected
+
+
+class RenderJob:
+    def __init__(self, entry, quality, fmt, retries):
+        self.id = str(entry["id"])
+        self.file_path = entry["file_path"]
+        self.class_name = entry["class_name"]
+        # Registry entries may pin their own settings, e.g. a short intro
+        # that should always be rendered in high quality.
+        self.quality = entry.get("quality", quality)
+        self.format = entry.get("format", fmt)
+        self.retries = entry.get("retries", retries)
+        self.status = "queued"
+        self.attempts = 0
+        self.returncode = None
+        self.wall_time = 0.0
+        self.started_at = None
+        self.log_path = os.path.join(LOG_DIR, f"{self.id}_{self.class_name}.log")
+
+    def command(self, extra_args):
+        return [
+            sys.executable,
+            "-m",
+            "manim",
+            "render",
+            f"-q{self.quality}",
+            "--format",
+            self.format,
+            "--progress_bar",
+            "none",
+            *extra_args,
+            self.file_path,
+            self.class_name,
+        ]
+
+    def elapsed(self):
+        if self.started_at is not None and self.status in ("running", "retrying"):
+            return time.perf_counter() - self.started_at
+        return self.wall_time
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "file_path": self.file_path,
+            "class_name": self.class_name,
+            "quality": self.quality,
+            "format": self.format,
+            "status": self.status,
+            "attempts": self.attempts,
+            "returncode": self.returncode,
+            "wall_time": round(self.wall_time, 3),
+            "log": self.log_path,
+        }
+
+
+def run_job(job, extra_args, lock):
+    with lock:
+        job.status = "running"
+        job.started_at = time.perf_counter()
+
+    while True:
+        with lock:
+            job.attempts += 1
+        with open(job.log_path, "a", encoding="utf-8") as log:
+            log.write(f"$ {' '.join(job.command(extra_args))}\n")
+            log.flush()
+            proc = subprocess.run(
+                job.command(extra_args),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        with lock:
+            job.returncode = proc.returncode
+            if proc.returncode == 0:
+                job.status = "done"
+                break
+            if job.attempts > job.retries:
+                job.status = "failed"
+                break
+            job.status = "retrying"
+
+    with lock:
+        job.wall_time = time.perf_counter() - job.started_at
+    return job
+
+
+def build_table(jobs, lock, started_at):
+    table = Table(title=f"Aegis Render Farm ({time.perf_counter() - started_at:.1f}s)")
+    table.add_column("ID", justify="right")
+    table.add_column("Scene")
+    table.add_column("Quality")
+    table.add_column("Format")
+    table.add_column("Status")
+    table.add_column("Attempt", justify="right")
+    table.add_column("Time", justify="right")
+    with lock:
+        for job in jobs:
+            style = STATUS_STYLE[job.status]
+            table.add_row(
+                job.id,
+                job.class_name,
+                job.quality,
+                job.format,
+                f"[{style}]{job.status}[/{style}]",
+                str(job.attempts),
+                f"{job.elapsed():.1f}s",
+            )
+    return table
+
+
+def render_all(jobs, workers, extra_args=(), console=None):
+    os.makedirs(LOG_DIR, exist_ok=True)
+    lock = threading.Lock()
+    started_at = time.perf_counter()
+    console = console or Console()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job, list(extra_args), lock) for job in jobs]
+        with Live(
+            build_table(jobs, lock, started_at),
+            console=console,
+            refresh_per_second=4,
+        ) as live:
+            while not all(f.done() for f in futures):
+                live.update(build_table(jobs, lock, started_at))
+                time.sleep(0.25)
+            live.update(build_table(jobs, lock, started_at))
+        for f in futures:
+            # Surface unexpected errors (e.g. missing python executable).
+            f.result()
+
+    return time.perf_counter() - started_at
+
+
+def load_previous_times(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {job["id"]: job["wall_time"] for job in json.load(f)["jobs"]}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def write_summary(jobs, total_time, workers, path):
+    summary = {
+        "workers": workers,
+        "wall_time": round(total_time, 3),
+        "sum_of_scene_times": round(sum(job.wall_time for job in jobs), 3),
+        "succeeded": sum(job.status == "done" for job in jobs),
+        "failed": sum(job.status == "failed" for job in jobs),
+        "jobs": [job.as_dict() for job in jobs],
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Aegis Parallel Render Farm",
+        usage="%(prog)s [options] [selectors ...] [-- manim render options]",
+        epilog="Arguments after '--' are passed to every `manim render` call.",
+    )
+    parser.add_argument(
+        "selectors",
+        nargs="*",
+        help="Registry ids, keywords, class names or titles to render, glob "
+        "patterns allowed (default: the whole registry)",
+    )
+    parser.add_argument("--registry", default=REGISTRY_PATH, help="Path to scene_registry.json")
+    parser.add_argument(
+        "--quality", "-q", choices=QUALITIES, default="l",
+        help="Default render quality for entries without their own 'quality'",
+    )
+    parser.add_argument(
+        "--format", "-f", choices=FORMATS, default="mp4",
+        help="Default output format for entries without their own 'format'",
+    )
+    parser.add_argument(
+        "--workers", "-j", type=int, default=os.cpu_count() or 1,
+        help="Number of scenes rendered at the same time (default: CPU count)",
+    )
+    parser.add_argument("--retries", "-r", type=int, default=1, help="Retries per failed scene")
+    parser.add_argument(
+        "--summary", "-s", default=os.path.join(LOG_DIR, "summary.json"),
+        help="Where to write the JSON timing summary",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only list the selected jobs")
+    # Only the arguments after "--" go to manim, so that the selectors can't
+    # swallow the values of its flags, nor its flags be mistaken for ours.
+    argv = sys.argv[1:] if argv is None else list(argv)
+    extra_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra_args = argv[:split], argv[split + 1 :]
+    args = parser.parse_args(argv)
+
+    registry = load_registry(args.registry)
+    entries = select_entries(registry, args.selectors)
+    if not entries:
+        print("No registry entries match the given selectors.")
+        return 1
+
+    jobs = [RenderJob(entry, args.quality, args.format, args.retries) for entry in entries]
+    # Start the scenes that took longest last time first, so the total stays
+    # close to the slowest single scene instead of waiting on a late straggler.
+    previous = load_previous_times(args.summary)
+    jobs.sort(key=lambda job: previous.get(job.id, 0.0), reverse=True)
+
+    if args.dry_run:
+        for job in jobs:
+            print(" ".join(job.command(extra_args)))
+        return 0
+
+    workers = max(1, min(args.workers, len(jobs)))
+    total_time = render_all(jobs, workers, extra_args)
+    summary = write_summary(jobs, total_time, workers, args.summary)
+
+    print(
+        f"\nRendered {summary['succeeded']}/{len(jobs)} scenes in {summary['wall_time']:.1f}s "
+        f"(sequential would be ~{summary['sum_of_scene_times']:.1f}s)."
+    )
+    print(f"Summary written to: {args.summary}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,7 +27,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, NoReturn
 import numpy as np
 
 from manim import constants
-from manim.constants import RendererType
+from manim.constants import X264_PRESETS, RendererType
 from manim.utils.color import ManimColor
 from manim.utils.tex import TexTemplate
 
@@ -267,7 +267,10 @@ class ManimConfig(MutableMapping):
         "disable_caching_warning",
         "dry_run",
         "enable_wireframe",
+        "encoder_threads",
         "ffmpeg_loglevel",
+        "final_movie_crf",
+        "final_movie_preset",
         "format",
         "flush_cache",
         "frame_height",
@@ -276,6 +279,8 @@ class ManimConfig(MutableMapping):
         "frame_x_radius",
         "frame_y_radius",
         "from_animation_number",
+        "global_cache_dir",
+        "global_cache_max_size",
         "images_dir",
         "input_file",
         "media_embed",
@@ -287,11 +292,16 @@ class ManimConfig(MutableMapping):
         "movie_file_extension",
         "notify_outdated_version",
         "output_file",
+        "parallel_plays",
+        "partial_movie_crf",
         "partial_movie_dir",
+        "partial_movie_intra_only",
+        "partial_movie_preset",
         "pixel_height",
         "pixel_width",
         "plugins",
         "preview",
+        "profile",
         "progress_bar",
         "quality",
         "save_as_gif",
@@ -301,6 +311,8 @@ class ManimConfig(MutableMapping):
         "scene_names",
         "seed",
         "show_in_file_browser",
+        "svg_cache_dir",
+        "svg_cache_max_size",
         "tex_dir",
         "tex_template",
         "tex_template_file",
@@ -596,6 +608,7 @@ class ManimConfig(MutableMapping):
             "force_window",
             "no_latex_cleanup",
             "dry_run",
+            "profile",
         ]:
             setattr(self, key, parser["CLI"].getboolean(key, fallback=False))
 
@@ -604,6 +617,9 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "global_cache_max_size",
+            "svg_cache_max_size",
+            "parallel_plays",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
@@ -624,7 +640,9 @@ class ManimConfig(MutableMapping):
             "images_dir",
             "text_dir",
             "tex_dir",
+            "svg_cache_dir",
             "partial_movie_dir",
+            "global_cache_dir",
             "input_file",
             "output_file",
             "movie_file_extension",
@@ -683,6 +701,21 @@ class ManimConfig(MutableMapping):
         if val:
             self.ffmpeg_loglevel = val
 
+        self.partial_movie_preset = parser["ffmpeg"].get(
+            "partial_movie_preset", fallback=""
+        )
+        self.partial_movie_crf = parser["ffmpeg"].getint(
+            "partial_movie_crf", fallback=23
+        )
+        self.partial_movie_intra_only = parser["ffmpeg"].getboolean(
+            "partial_movie_intra_only", fallback=False
+        )
+        self.final_movie_preset = parser["ffmpeg"].get(
+            "final_movie_preset", fallback=""
+        )
+        self.final_movie_crf = parser["ffmpeg"].getint("final_movie_crf", fallback=23)
+        self.encoder_threads = parser["ffmpeg"].getint("threads", fallback=0)
+
         try:
             val = parser["jupyter"].getboolean("media_embed")
         except ValueError:
@@ -758,6 +791,7 @@ class ManimConfig(MutableMapping):
             "disable_caching",
             "format",
             "flush_cache",
+            "global_cache_dir",
             "progress_bar",
             "transparent",
             "scene_names",
@@ -772,9 +806,15 @@ class ManimConfig(MutableMapping):
             "enable_wireframe",
             "force_window",
             "dry_run",
+            "profile",
             "no_latex_cleanup",
             "preview_command",
             "seed",
+            "parallel_plays",
+            "partial_movie_preset",
+            "partial_movie_intra_only",
+            "final_movie_preset",
+            "encoder_threads",
         ]:
             if hasattr(args, key):
                 attr = getattr(args, key)
@@ -831,6 +871,7 @@ class ManimConfig(MutableMapping):
                 "images_dir",
                 "text_dir",
                 "tex_dir",
+                "svg_cache_dir",
                 "log_dir",
                 "partial_movie_dir",
             ]:
@@ -1075,6 +1116,68 @@ class ManimConfig(MutableMapping):
         )
         logging.getLogger("libav").setLevel(self.ffmpeg_loglevel)
 
+    @property
+    def partial_movie_preset(self) -> str:
+        """x264 preset for the partial movie files, e.g. ``ultrafast``. Empty for the encoder's default."""
+        return self._d["partial_movie_preset"]
+
+    @partial_movie_preset.setter
+    def partial_movie_preset(self, value: str) -> None:
+        self._set_from_list("partial_movie_preset", value, ["", *X264_PRESETS])
+
+    @property
+    def partial_movie_crf(self) -> int:
+        """x264 constant rate factor of the partial movie files. ``0`` is lossless."""
+        return self._d["partial_movie_crf"]
+
+    @partial_movie_crf.setter
+    def partial_movie_crf(self, value: int) -> None:
+        self._set_int_between("partial_movie_crf", value, 0, 51)
+
+    @property
+    def partial_movie_intra_only(self) -> bool:
+        """Whether every frame of the partial movie files is a key frame.
+
+        Intra-only files are larger, but fast to encode and to cut. Combined
+        with ``partial_movie_crf = 0``, this is a good setting for drafts.
+        """
+        return self._d["partial_movie_intra_only"]
+
+    @partial_movie_intra_only.setter
+    def partial_movie_intra_only(self, value: bool) -> None:
+        self._set_boolean("partial_movie_intra_only", value)
+
+    @property
+    def final_movie_preset(self) -> str:
+        """x264 preset used to transcode the combined movie once.
+
+        Empty (the default) concatenates the partial movie files without
+        re-encoding them.
+        """
+        return self._d["final_movie_preset"]
+
+    @final_movie_preset.setter
+    def final_movie_preset(self, value: str) -> None:
+        self._set_from_list("final_movie_preset", value, ["", *X264_PRESETS])
+
+    @property
+    def final_movie_crf(self) -> int:
+        """x264 constant rate factor of the transcoded final movie."""
+        return self._d["final_movie_crf"]
+
+    @final_movie_crf.setter
+    def final_movie_crf(self, value: int) -> None:
+        self._set_int_between("final_movie_crf", value, 0, 51)
+
+    @property
+    def encoder_threads(self) -> int:
+        """Number of threads used by the video encoder. ``0`` lets the encoder decide."""
+        return self._d["encoder_threads"]
+
+    @encoder_threads.setter
+    def encoder_threads(self, value: int) -> None:
+        self._set_pos_number("encoder_threads", value, False)
+
     @property
     def media_embed(self) -> bool:
         """Whether to embed videos in Jupyter notebook."""
@@ -1222,6 +1325,45 @@ class ManimConfig(MutableMapping):
     def max_files_cached(self, value: int) -> None:
         self._set_pos_number("max_files_cached", value, True)
 
+    @property
+    def global_cache_dir(self) -> str:
+        """Directory of the partial movie file store shared by all scenes.
+
+        An empty string disables the store (``--global_cache_dir``). See
+        :mod:`~.utils.cache_store`.
+        """
+        return self._d["global_cache_dir"]
+
+    @global_cache_dir.setter
+    def global_cache_dir(self, value: str | Path) -> None:
+        self._set_dir("global_cache_dir", value)
+
+    @property
+    def global_cache_max_size(self) -> int:
+        """Size of the global partial movie file store in MiB, above which the
+        least recently used files are evicted. Use -1 for infinity (no flag).
+        """
+        return self._d["global_cache_max_size"]
+
+    @global_cache_max_size.setter
+    def global_cache_max_size(self, value: int) -> None:
+        self._set_pos_number("global_cache_max_size", value, True)
+
+    @property
+    def parallel_plays(self) -> int:
+        """Number of worker processes rendering the plays of a scene in parallel.
+
+        ``0`` or ``1`` renders the plays one after another, ``-1`` uses one
+        worker per CPU core (``--parallel_plays``).
+        """
+        return self._d["parallel_plays"]
+
+    @parallel_plays.setter
+    def parallel_plays(self, value: int) -> None:
+        if value == -1:
+            value = os.cpu_count() or 1
+        self._set_pos_number("parallel_plays", value, False)
+
     @property
     def window_monitor(self) -> int:
         """The monitor on which the scene will be rendered."""
@@ -1333,6 +1475,15 @@ class ManimConfig(MutableMapping):
             self.save_last_frame = False
             self.format = None
 
+    @property
+    def profile(self) -> bool:
+        """Whether to record where renders spend their time, see :mod:`.profiler`."""
+        return self._d["profile"]
+
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        self._set_boolean("profile", value)
+
     @property
     def renderer(self) -> RendererType:
         """The currently active renderer.
@@ -1620,6 +1771,7 @@ class ManimConfig(MutableMapping):
             "images_dir",
             "text_dir",
             "tex_dir",
+            "svg_cache_dir",
             "log_dir",
             "input_file",
             "output_file",
@@ -1719,6 +1871,31 @@ class ManimConfig(MutableMapping):
     def tex_dir(self, value: str | Path) -> None:
         self._set_dir("tex_dir", value)
 
+    @property
+    def svg_cache_dir(self) -> str:
+        """Directory to place the mobjects imported from SVG files (no flag).
+
+        An empty string disables this cache. See :mod:`~.utils.svg_cache`
+        and :meth:`ManimConfig.get_dir`.
+        """
+        return self._d["svg_cache_dir"]
+
+    @svg_cache_dir.setter
+    def svg_cache_dir(self, value: str | Path) -> None:
+        self._set_dir("svg_cache_dir", value)
+
+    @property
+    def svg_cache_max_size(self) -> int:
+        """Size of :attr:`svg_cache_dir` in MiB, above which the least recently
+        used imported SVG files are evicted. Use -1 for infinity (no flag).
+        See :mod:`~.utils.svg_cache`.
+        """
+        return self._d["svg_cache_max_size"]
+
+    @svg_cache_max_size.setter
+    def svg_cache_max_size(self, value: int) -> None:
+        self._set_pos_number("svg_cache_max_size", value, True)
+
     @property
     def partial_movie_dir(self) -> str:
         """Directory to place partial movie files (no flag).  See :meth:`ManimConfig.get_dir`."""
@@ -46,6 +46,10 @@ from ..constants import (
     RendererType,
 )
 from ..mobject.mobject import Group, Mobject
+from ..mobject.types.vectorized_mobject import VMobject
+from ..utils import paths
+from ..utils.bezier import interpolate
+from ..utils.config_ops import _CopyOnWriteArray
 from ..utils.paths import path_along_arc, path_along_circles
 from ..utils.rate_functions import smooth, squish_rate_func
 
@@ -131,6 +135,10 @@ class Transform(Animation):
     :class:`~.ReplacementTransform`, :meth:`~.Mobject.interpolate`, :meth:`~.Mobject.align_data`
     """
 
+    # Whether the families may be interpolated all at once, see
+    # :meth:`interpolate_mobject`.
+    _batch_interpolation = True
+
     def __init__(
         self,
         mobject: Mobject | None,
@@ -208,6 +216,9 @@ class Transform(Animation):
             self.mobject.align_data_and_family(self.target_copy)
         else:
             self.mobject.align_data(self.target_copy)
+        # Packed by the first interpolation, once starting_mobject exists.
+        self._packed_families: _PackedFamilies | None = None
+        self._families_packed = False
         super().begin()
 
     def create_target(self) -> Mobject | OpenGLMobject:
@@ -238,6 +249,48 @@ class Transform(Animation):
             return zip(*(mob.get_family() for mob in mobs), strict=False)
         return zip(*(mob.family_members_with_points() for mob in mobs), strict=False)
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self._families_packed:
+            self._packed_families = self._pack_families()
+            self._families_packed = True
+        # The last frame is interpolated submobject by submobject, which
+        # leaves every submobject with arrays of its own.
+        if self._packed_families is None or alpha == 1:
+            super().interpolate_mobject(alpha)
+            return
+        self._packed_families.interpolate(self._get_sub_alphas(alpha), self.path_func)
+
+    def _pack_families(self) -> _PackedFamilies | None:
+        """Pack the families for :meth:`interpolate_mobject`, or return ``None``
+        if they must be interpolated submobject by submobject.
+        """
+        cls = type(self)
+        if (
+            config.renderer != RendererType.CAIRO
+            or not self._batch_interpolation
+            or cls.interpolate_submobject is not Transform.interpolate_submobject
+            or cls.get_all_families_zipped is not Transform.get_all_families_zipped
+            or cls.get_sub_alpha is not Animation.get_sub_alpha
+            or not _is_pointwise_path_func(self.path_func)
+            # Updaters could change the starting or target points, which are
+            # packed once.
+            or self.starting_mobject.get_family_updaters()
+            or self.target_copy.get_family_updaters()
+            or (
+                not self.suspend_mobject_updating and self.mobject.get_family_updaters()
+            )
+        ):
+            return None
+        return _PackedFamilies.pack(list(self.get_all_families_zipped()))
+
+    def _get_sub_alphas(self, alpha: float) -> np.ndarray:
+        """:meth:`get_sub_alpha` of all packed submobjects."""
+        n = len(self._packed_families.submobjects)
+        if n == 1 or self.lag_ratio == 0:
+            return np.full(n, self.get_sub_alpha(alpha, 0, n))
+        # Rate functions only take floats.
+        return np.array([self.get_sub_alpha(alpha, i, n) for i in range(n)])
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -249,6 +302,213 @@ class Transform(Animation):
         return self
 
 
+def _is_pointwise_path_func(path_func: Callable) -> bool:
+    """Whether ``path_func`` moves every point independently of the others, so
+    that it can move the points of several submobjects at once.
+
+    Only the path functions of :mod:`~.utils.paths` known to do so are, since
+    any other could depend on all the points it is given.
+    """
+    if path_func is interpolate:
+        return True
+    if getattr(path_func, "__module__", None) != paths.__name__:
+        return False
+    qualname = getattr(path_func, "__qualname__", "")
+    if qualname == f"{path_along_arc.__name__}.<locals>.path":
+        return True
+    if qualname == f"{path_along_circles.__name__}.<locals>.path":
+        # With a center per point, the points of a single submobject.
+        centers = inspect.getclosurevars(path_func).nonlocals.get("circles_centers")
+        return np.ndim(centers) <= 1
+    return False
+
+
+class _PackedFamilies:
+    """The points and styles of the submobjects of a :class:`Transform`, packed
+    into contiguous arrays, so that all submobjects are interpolated by a few
+    array operations per frame.
+
+    The arrays of the submobjects are views into the packed arrays, which are
+    updated in place. Only the style attributes which are floats are set on
+    the submobjects, and only if they change during the animation.
+    """
+
+    # The attributes interpolated by VMobject.interpolate_color.
+    ARRAY_ATTRS = (
+        "fill_rgbas",
+        "stroke_rgbas",
+        "background_stroke_rgbas",
+        "sheen_direction",
+    )
+    FLOAT_ATTRS = ("stroke_width", "background_stroke_width", "sheen_factor")
+
+    def __init__(
+        self,
+        submobjects: list[VMobject],
+        points: _PackedArrays,
+        arrays: dict[str, _PackedArrays],
+        floats: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]],
+    ) -> None:
+        self.submobjects = submobjects
+        self.points = points
+        self.arrays = arrays
+        self.floats = floats
+        # The generation of the arrays of the mobjects when last bound.
+        self.generation: int | None = None
+
+    @classmethod
+    def pack(
+        cls, families: list[tuple[Mobject, Mobject, Mobject]]
+    ) -> _PackedFamilies | None:
+        """Pack the zipped families of a :class:`Transform`, or return ``None``
+        if some submobject can't be interpolated this way.
+        """
+        if not families:
+            return None
+        for family in families:
+            for mob in family:
+                if (
+                    not isinstance(mob, VMobject)
+                    or type(mob).interpolate is not Mobject.interpolate
+                    or type(mob).interpolate_color is not VMobject.interpolate_color
+                ):
+                    return None
+        submobjects, starts, ends = (list(mobs) for mobs in zip(*families, strict=True))
+        try:
+            points = _PackedArrays(
+                [mob.points for mob in starts], [mob.points for mob in ends]
+            )
+            arrays = {
+                attr: _PackedArrays(
+                    [getattr(mob, attr) for mob in starts],
+                    [getattr(mob, attr) for mob in ends],
+                )
+                for attr in cls.ARRAY_ATTRS
+            }
+        except ValueError:
+            # Mismatching shapes, interpolate_color will report them.
+            return None
+        floats = {}
+        for attr in cls.FLOAT_ATTRS:
+            start = np.array([getattr(mob, attr) for mob in starts])
+            end = np.array([getattr(mob, attr) for mob in ends])
+            if start.ndim != 1 or end.ndim != 1 or start.dtype.kind not in "iuf":
+                return None
+            (changing,) = np.nonzero(start != end)
+            floats[attr] = (start, end, changing)
+
+        packed_families = cls(submobjects, points, arrays, floats)
+        packed_families.bind()
+        return packed_families
+
+    def bind(self) -> None:
+        """Make the arrays of the submobjects views into the packed arrays.
+
+        This is only done again once an array of some mobject was replaced,
+        as told by :attr:`.utils.config_ops._CopyOnWriteArray.generation`,
+        for instance by :meth:`~.VMobject.set_points`.
+        """
+        if self.generation == _CopyOnWriteArray.generation:
+            return
+        for attr, packed in (("points", self.points), *self.arrays.items()):
+            for i, mob in enumerate(self.submobjects):
+                if mob.__dict__.get(attr) is not packed.views[i]:
+                    setattr(mob, attr, packed.new_view(i))
+        self.generation = _CopyOnWriteArray.generation
+
+    def interpolate(self, sub_alphas: np.ndarray, path_func: Callable) -> None:
+        """Interpolate every submobject to its alpha."""
+        self.bind()
+        uniform = bool((sub_alphas == sub_alphas[0]).all())
+        alpha = float(sub_alphas[0])
+        points = self.points
+        if uniform:
+            np.copyto(points.current, path_func(points.start, points.end, alpha))
+        elif path_func is interpolate:
+            np.copyto(
+                points.current,
+                interpolate(points.start, points.end, points.get_alphas(sub_alphas)),
+            )
+        else:
+            for i, view in enumerate(points.views):
+                view[...] = path_func(
+                    points.start_views[i], points.end_views[i], float(sub_alphas[i])
+                )
+        for packed in self.arrays.values():
+            np.copyto(
+                packed.current,
+                interpolate(
+                    packed.start,
+                    packed.end,
+                    alpha if uniform else packed.get_alphas(sub_alphas),
+                ),
+            )
+        for attr, (start, end, changing) in self.floats.items():
+            if not len(changing):
+                continue
+            values = interpolate(start[changing], end[changing], sub_alphas[changing])
+            for i, value in zip(changing, values.tolist(), strict=True):
+                setattr(self.submobjects[i], attr, value)
+
+
+class _PackedArrays:
+    """The starting and target values of an array attribute of several
+    mobjects, concatenated along their first axis, and the current values the
+    mobjects hold views of.
+    """
+
+    def __init__(self, starts: list[np.ndarray], ends: list[np.ndarray]) -> None:
+        pairs = [
+            np.broadcast_arrays(
+                np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+            )
+            for start, end in zip(starts, ends, strict=True)
+        ]
+        shapes = [start.shape for start, _ in pairs]
+        self.start = np.concatenate(
+            [
+                start.reshape(-1, shape[-1])
+                for (start, _), shape in zip(pairs, shapes, strict=True)
+            ]
+        )
+        self.end = np.concatenate(
+            [
+                end.reshape(-1, shape[-1])
+                for (_, end), shape in zip(pairs, shapes, strict=True)
+            ]
+        )
+        self.current = np.empty_like(self.start)
+        counts = [int(np.prod(shape[:-1])) for shape in shapes]
+        self.owners = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.cumsum([0, *counts])
+        slices = [slice(offsets[i], offsets[i + 1]) for i in range(len(counts))]
+        self.slices = slices
+        self.shapes = shapes
+        self.views = [
+            self.current[s].reshape(shape)
+            for s, shape in zip(slices, shapes, strict=True)
+        ]
+        self.start_views = [
+            self.start[s].reshape(shape)
+            for s, shape in zip(slices, shapes, strict=True)
+        ]
+        self.end_views = [
+            self.end[s].reshape(shape) for s, shape in zip(slices, shapes, strict=True)
+        ]
+
+    def new_view(self, index: int) -> np.ndarray:
+        """Replace the view of the current values of the ``index``-th mobject,
+        and return it.
+        """
+        view = self.current[self.slices[index]].reshape(self.shapes[index])
+        self.views[index] = view
+        return view
+
+    def get_alphas(self, sub_alphas: np.ndarray) -> np.ndarray:
+        """The alpha of every row, as a column vector."""
+        return sub_alphas[self.owners][:, np.newaxis]
+
+
 class ReplacementTransform(Transform):
     """Replaces and morphs a mobject into a target mobject.
 
@@ -785,6 +1045,9 @@ class TransformAnimations(Transform):
         start_anim.mobject = self.starting_mobject
         end_anim.mobject = self.target_mobject
 
+    # The starting and target mobjects are animated, so they can't be packed.
+    _batch_interpolation = False
+
     def interpolate(self, alpha: float) -> None:
         self.start_anim.interpolate(alpha)
         self.end_anim.interpolate(alpha)
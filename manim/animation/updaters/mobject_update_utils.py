@@ -15,14 +15,18 @@ __all__ = [
 
 
 import inspect
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from types import CodeType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
 from manim.constants import DEGREES, RIGHT
 from manim.mobject.mobject import Mobject
+from manim.mobject.value_tracker import ValueTracker, record_value_tracker_reads
 from manim.opengl import OpenGLMobject
+from manim.utils.hashing import _StructuralHasher
 from manim.utils.space_ops import normalize
 
 if TYPE_CHECKING:
@@ -61,7 +65,9 @@ def f_always(method: Callable[[Mobject], None], *arg_generators, **kwargs) -> Mo
     return mobject
 
 
-def always_redraw(func: Callable[[], Mobject]) -> Mobject:
+def always_redraw(
+    func: Callable[[], Mobject], memoize: bool = False, cache_size: int = 16
+) -> Mobject:
     """Redraw the mobject constructed by a function every frame.
 
     This function returns a mobject with an attached updater that
@@ -73,6 +79,14 @@ def always_redraw(func: Callable[[], Mobject]) -> Mobject:
     func
         A function without (required) input arguments that returns
         a mobject.
+    memoize
+        Whether to skip the redraw while the inputs of ``func`` are
+        unchanged. The inputs are the value trackers read by ``func`` and
+        the mobjects it references, see :class:`_MemoizedRedraw`. Only use
+        this if ``func`` builds a new mobject and depends on no other state.
+    cache_size
+        With ``memoize``, the number of mobjects built by ``func`` which are
+        kept for reuse, e.g. when a value tracker moves back and forth.
 
     Examples
     --------
@@ -101,11 +115,147 @@ def always_redraw(func: Callable[[], Mobject]) -> Mobject:
                 self.add(ax, sine, point, tangent)
                 self.play(alpha.animate.set_value(1), rate_func=linear, run_time=2)
     """
+    if memoize:
+        return _MemoizedRedraw(func, cache_size).mobject
     mob = func()
     mob.add_updater(lambda _: mob.become(func()))
     return mob
 
 
+class _MemoizedRedraw:
+    """The updater of a mobject created by ``always_redraw(func, memoize=True)``.
+
+    The inputs of ``func`` are
+
+    - the value trackers whose value was read in the last call of ``func``,
+      see :func:`.record_value_tracker_reads`, and
+    - the mobjects ``func`` refers to: the mobjects in its closure or among
+      its global names, the ones referenced by the functions and methods it
+      refers to, and the attributes it uses of other objects, e.g.
+      ``self.axes``.
+
+    As long as the values of these trackers and the digests of these
+    mobjects are unchanged, ``func`` would build the same mobject again, so
+    the redraw is skipped. Otherwise, the mobject is looked up in a cache
+    keyed by these values before ``func`` is called.
+    """
+
+    def __init__(self, func: Callable[[], Mobject], cache_size: int) -> None:
+        self.func = func
+        self.cache_size = cache_size
+        self.cache: OrderedDict[str, Mobject] = OrderedDict()
+        self.referenced = [
+            mob
+            for mob in _find_referenced_mobjects(func)
+            if not isinstance(mob, ValueTracker)
+        ]
+        self.trackers: list[ValueTracker] = []
+        self.mobject = self.call()
+        self.key = self.get_key()
+        self.store(self.key, self.mobject.copy())
+        self.mobject.add_updater(self.update)
+
+    def call(self) -> Mobject:
+        with record_value_tracker_reads() as reads:
+            mob = self.func()
+        self.trackers = list(reads.values())
+        return mob
+
+    def get_key(self) -> str:
+        hasher = _StructuralHasher()
+        return hasher.hexdigest(
+            [
+                [(id(tracker), tracker.points) for tracker in self.trackers],
+                self.referenced,
+            ]
+        )
+
+    def update(self, mob: Mobject) -> None:
+        key = self.get_key()
+        if key == self.key:
+            return
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+        else:
+            cached = self.call()
+            # The tracker values are unchanged, but func may have read
+            # other trackers this time.
+            key = self.get_key()
+            self.store(key, cached)
+        # become aligns the families of both mobjects, which would pad the
+        # cached one with null submobjects.
+        mob.become(cached.copy())
+        self.key = key
+
+    def store(self, key: str, mob: Mobject) -> None:
+        self.cache[key] = mob
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+
+def _get_code_names(code: CodeType) -> set[str]:
+    """The global and attribute names used by some code and its nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _get_code_names(const)
+    return names
+
+
+def _find_referenced_mobjects(func: Callable[..., Any]) -> list[Mobject]:
+    """Find the mobjects referenced by a function, see :class:`_MemoizedRedraw`."""
+    mobjects: dict[int, Mobject] = {}
+    seen: set[int] = set()
+    pending: list[Any] = [func]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, (Mobject, OpenGLMobject)):
+            mobjects[id(obj)] = obj
+        elif isinstance(obj, (list, tuple)):
+            pending += obj
+        elif isinstance(obj, (FunctionType, MethodType)):
+            function = obj.__func__ if isinstance(obj, MethodType) else obj
+            if isinstance(obj, MethodType) and isinstance(
+                obj.__self__, (Mobject, OpenGLMobject)
+            ):
+                pending.append(obj.__self__)
+            if (function.__module__ or "").startswith("manim."):
+                # Functions of the library don't refer to mobjects of scenes.
+                continue
+            names = _get_code_names(function.__code__)
+            values = [
+                function.__globals__[name]
+                for name in names
+                if name in function.__globals__
+            ]
+            for cell in function.__closure__ or ():
+                try:
+                    values.append(cell.cell_contents)
+                except ValueError:
+                    # The variable is not assigned yet.
+                    continue
+            if isinstance(obj, MethodType):
+                values.append(obj.__self__)
+            for value in values:
+                if isinstance(
+                    value,
+                    (Mobject, OpenGLMobject, FunctionType, MethodType, list, tuple),
+                ):
+                    pending.append(value)
+                elif hasattr(value, "__dict__") and not isinstance(
+                    value, (type, ModuleType)
+                ):
+                    # E.g. the scene in ``lambda: Dot(self.axes.c2p(1, 2))``.
+                    pending += [
+                        value.__dict__[name] for name in names if name in value.__dict__
+                    ]
+    return list(mobjects.values())
+
+
 def always_shift(
     mobject: Mobject, direction: np.ndarray[np.float64] = RIGHT, rate: float = 0.1
 ) -> Mobject:
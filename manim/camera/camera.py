@@ -8,7 +8,8 @@ import copy
 import itertools as it
 import operator as op
 import pathlib
-from collections.abc import Callable, Iterable
+import weakref
+from collections.abc import Callable, Hashable, Iterable
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Self
 
@@ -16,7 +17,6 @@ import cairo
 import numpy as np
 import numpy.typing as npt
 from PIL import Image
-from scipy.spatial.distance import pdist
 
 from manim.typing import (
     FloatRGBA_Array,
@@ -36,7 +36,7 @@ from ..utils.color import ManimColor, ParsableManimColor, color_to_int_rgba
 from ..utils.family import extract_mobject_family_members
 from ..utils.images import get_full_raster_image_path
 from ..utils.iterables import list_difference_update
-from ..utils.space_ops import angle_of_vector
+from ..utils.profiler import profiler
 
 if TYPE_CHECKING:
     from ..mobject.types.image_mobject import AbstractImageMobject
@@ -148,6 +148,18 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context: dict[int, cairo.Context] = {}
+        # The last Cairo path of every VMobject, together with the points and
+        # the transformation matrix it was built from.
+        self.cairo_path_cache: weakref.WeakKeyDictionary[
+            VMobject, tuple[Point3D_Array, tuple[float, ...], cairo.Path]
+        ] = weakref.WeakKeyDictionary()
+        # The last resampled image of every ImageMobject, together with the
+        # key it was resampled for, a copy of the source pixels and the offset
+        # of the resampled image from the upper left corner of the mobject.
+        self.image_mobject_cache: weakref.WeakKeyDictionary[
+            AbstractImageMobject,
+            tuple[Hashable, PixelArray, Image.Image, tuple[int, int]],
+        ] = weakref.WeakKeyDictionary()
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -553,7 +565,8 @@ class Camera:
         # partition while at the same time preserving order.
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
-            self.display_funcs[group_type](list(group), self.pixel_array)
+            with profiler.span(f"display {group_type.__name__}", "camera"):
+                self.display_funcs[group_type](list(group), self.pixel_array)
 
     # Methods associated with svg rendering
 
@@ -689,10 +702,14 @@ class Camera:
         Camera
             The camera object
         """
-        self.set_cairo_context_path(ctx, vmobject)
-        self.apply_stroke(ctx, vmobject, background=True)
-        self.apply_fill(ctx, vmobject)
-        self.apply_stroke(ctx, vmobject)
+        with profiler.accumulate("path"):
+            self.set_cairo_context_path(ctx, vmobject)
+        with profiler.accumulate("stroke"):
+            self.apply_stroke(ctx, vmobject, background=True)
+        with profiler.accumulate("fill"):
+            self.apply_fill(ctx, vmobject)
+        with profiler.accumulate("stroke"):
+            self.apply_stroke(ctx, vmobject)
         return self
 
     def set_cairo_context_path(self, ctx: cairo.Context, vmobject: VMobject) -> Self:
@@ -717,17 +734,70 @@ class Camera:
             return self
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        m = ctx.get_matrix()
+        matrix = (m.xx, m.yx, m.xy, m.yy, m.x0, m.y0)
+        cached = self.cairo_path_cache.get(vmobject)
+        if (
+            cached is not None
+            and cached[1] == matrix
+            and np.array_equal(cached[0], points)
+        ):
+            # Mobjects which don't move reuse the path of the previous frame.
+            ctx.append_path(cached[2])
+            return self
+
+        self._emit_cairo_path(ctx, vmobject, points)
+        self.cairo_path_cache[vmobject] = (points.copy(), matrix, ctx.copy_path())
+        return self
+
+    def _emit_cairo_path(
+        self, ctx: cairo.Context, vmobject: VMobject, points: Point3D_Array
+    ) -> None:
+        """Build the path of ``points`` in ``ctx``.
+
+        The subpaths and the control points of their curves are extracted with
+        NumPy for the whole point array at once, so that only the calls to
+        Cairo are left in the Python loop.
+        """
+        nppcc = vmobject.n_points_per_cubic_curve
+        n_points = len(points)
+        n_curves = n_points // nppcc
+        if n_curves == 0:
+            return
+        rtol = 1.0e-5  # same as consider_points_equals_2d
+        atol = vmobject.tolerance_for_point_equality
+
+        def equal_2d(p0: Point3D_Array, p1: Point3D_Array) -> npt.NDArray[np.bool_]:
+            return np.all(
+                np.abs(p0[:, :2] - p1[:, :2]) <= atol + rtol * np.abs(p1[:, :2]), axis=1
+            )
+
+        # A new subpath starts at every curve whose first anchor differs from
+        # the last anchor of the previous curve.
+        candidates = np.arange(nppcc, n_points, nppcc)
+        splits = candidates[~equal_2d(points[candidates - 1], points[candidates])]
+        bounds = np.concatenate(([0], splits, [n_points]))
+        starts, ends = bounds[:-1], bounds[1:]
+        keep = ends - starts >= nppcc
+        starts, ends = starts[keep], ends[keep]
+        closed = equal_2d(points[starts], points[ends - 1]).tolist()
+
+        anchors = points[starts, :2].tolist()
+        curves = points[: n_curves * nppcc, :2].reshape(n_curves, 2 * nppcc)
+        handles_and_ends = curves[:, 2:].tolist()
+        first_curves = starts // nppcc
+        last_curves = first_curves + (ends - starts) // nppcc
+
+        curve_to = ctx.curve_to
+        for start, first, last, is_closed in zip(
+            anchors, first_curves.tolist(), last_curves.tolist(), closed, strict=True
+        ):
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for _p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*start)
+            for curve in handles_and_ends[first:last]:
+                curve_to(*curve)
+            if is_closed:
                 ctx.close_path()
-        return self
 
     def set_cairo_context_color(
         self, ctx: cairo.Context, rgbas: FloatRGBALike_Array, vmobject: VMobject
@@ -1008,51 +1078,130 @@ class Camera:
             The Pixel array to put the imagemobject in.
         """
         corner_coords = self.points_to_pixel_coords(image_mobject, image_mobject.points)
+        source = image_mobject.get_pixel_array()
+        origin = corner_coords[0]
+        # An upright image only has to be resized again when its size changes,
+        # other images are clipped to the frame and depend on their position.
+        key = (
+            (corner_coords - origin).tobytes()
+            if self._is_upright(corner_coords)
+            else corner_coords.tobytes(),
+            image_mobject.resampling_algorithm,
+            pixel_array.shape,
+        )
+        cached = self.image_mobject_cache.get(image_mobject)
+        if (
+            cached is not None
+            and cached[0] == key
+            and np.array_equal(cached[1], source)
+        ):
+            sub_image = cached[2]
+            ul_coords = (origin[0] + cached[3][0], origin[1] + cached[3][1])
+        else:
+            transformed = self._transform_image(
+                source,
+                corner_coords,
+                image_mobject.resampling_algorithm,
+                pixel_array.shape[:2],
+            )
+            if transformed is None:
+                return
+            sub_image, ul_coords = transformed
+            self.image_mobject_cache[image_mobject] = (
+                key,
+                source.copy(),
+                sub_image,
+                (ul_coords[0] - origin[0], ul_coords[1] - origin[1]),
+            )
+        self._blend_image(pixel_array, sub_image, ul_coords)
+
+    @staticmethod
+    def _is_upright(corner_coords: npt.NDArray[ManimInt]) -> bool:
+        """Whether an image is neither rotated, sheared nor flipped."""
+        ul_coords, ur_coords, dl_coords, _ = corner_coords
+        return bool(
+            ur_coords[1] == ul_coords[1]
+            and dl_coords[0] == ul_coords[0]
+            and ur_coords[0] > ul_coords[0]
+            and dl_coords[1] > ul_coords[1]
+        )
+
+    @staticmethod
+    def _transform_image(
+        source: PixelArray,
+        corner_coords: npt.NDArray[ManimInt],
+        resampling_algorithm: int,
+        frame_shape: tuple[int, int],
+    ) -> tuple[Image.Image, tuple[int, int]] | None:
+        """Resamples an image onto the parallelogram spanned by its upper left,
+        upper right and lower left corners in pixel coordinates.
+
+        Returns
+        -------
+        tuple[PIL.Image.Image, tuple[int, int]] | None
+            The resampled image and the pixel coordinates of its upper left
+            corner, or ``None`` if the image is degenerate or off screen.
+        """
         ul_coords, ur_coords, dl_coords, _ = corner_coords
         right_vect = ur_coords - ul_coords
         down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
-
-        sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
 
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords]).item()), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords]).item()), 1)
-        sub_image = sub_image.resize(
+        # Resizing first filters the image when it is scaled down.
+        pixel_width = max(int(np.linalg.norm(right_vect)), 1)
+        pixel_height = max(int(np.linalg.norm(down_vect)), 1)
+        sub_image = Image.fromarray(source, mode="RGBA").resize(
             (pixel_width, pixel_height),
-            resample=image_mobject.resampling_algorithm,
+            resample=resampling_algorithm,
         )
 
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle,
-                resample=image_mobject.resampling_algorithm,
-                expand=1,
-            )
-
-        # TODO, there is no accounting for a shear...
-
-        # Paste into an image as large as the camera's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.pixel_height, self.pixel_width)),
-            mode="RGBA",
-        )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
+        if Camera._is_upright(corner_coords):
+            center_coords = ul_coords + (right_vect + down_vect) / 2
+            new_ul_coords = (center_coords - np.array(sub_image.size) / 2).astype(int)
+            return sub_image, (int(new_ul_coords[0]), int(new_ul_coords[1]))
+
+        # Rotated, sheared or flipped: map every pixel of the bounding box of
+        # the parallelogram (within the frame) back onto the resized image.
+        frame_height, frame_width = frame_shape
+        x0, y0 = np.maximum(corner_coords.min(axis=0), 0)
+        x1, y1 = np.minimum(corner_coords.max(axis=0) + 1, [frame_width, frame_height])
+        matrix = np.column_stack([right_vect / pixel_width, down_vect / pixel_height])
+        if x1 <= x0 or y1 <= y0 or abs(np.linalg.det(matrix)) < 1e-9:
+            return None
+        inverse = np.linalg.inv(matrix)
+        offset = inverse @ (np.array([x0, y0]) - ul_coords)
+        if resampling_algorithm not in (
+            Image.Resampling.NEAREST,
+            Image.Resampling.BILINEAR,
+            Image.Resampling.BICUBIC,
+        ):
+            # Affine transformations only support these filters.
+            resampling_algorithm = Image.Resampling.BICUBIC
+        sub_image = sub_image.transform(
+            (int(x1 - x0), int(y1 - y0)),
+            Image.Transform.AFFINE,
+            (*inverse[0], offset[0], *inverse[1], offset[1]),
+            resample=resampling_algorithm,
         )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        return sub_image, (int(x0), int(y0))
+
+    def _blend_image(
+        self,
+        pixel_array: PixelArray,
+        image: Image.Image,
+        ul_coords: tuple[int, int],
+    ) -> None:
+        """Paints an image on top of the slice of the pixel array it covers."""
+        x0, y0 = ul_coords
+        width, height = image.size
+        frame_height, frame_width = pixel_array.shape[:2]
+        left, top = max(x0, 0), max(y0, 0)
+        right, bottom = min(x0 + width, frame_width), min(y0 + height, frame_height)
+        if right <= left or bottom <= top:
+            return
+        if (left, top, right, bottom) != (x0, y0, x0 + width, y0 + height):
+            image = image.crop((left - x0, top - y0, right - x0, bottom - y0))
+        region = pixel_array[top:bottom, left:right]
+        region[:] = np.asarray(Image.alpha_composite(self.get_image(region), image))
 
     def overlay_rgba_array(
         self, pixel_array: np.ndarray, new_array: np.ndarray
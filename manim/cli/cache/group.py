@@ -0,0 +1,119 @@
+"""Manim's cache subcommand.
+
+Manim's cache subcommand is accessed in the command-line interface via ``manim
+cache``. It inspects and maintains the global partial movie file store
+configured with ``global_cache_dir``, see :mod:`~.utils.cache_store`.
+
+"""
+
+from __future__ import annotations
+
+import time
+
+import cloup
+from rich.table import Table
+
+from manim._config import cli_ctx_settings, config, console
+from manim.constants import EPILOG
+from manim.utils.cache_store import MIB, PartialMovieCache
+
+__all__ = ["cache", "stats", "prune", "verify"]
+
+
+def _format_size(size: float) -> str:
+    return f"{size / MIB:.1f} MiB"
+
+
+def _format_time(timestamp: float | None) -> str:
+    if timestamp is None:
+        return "-"
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+
+@cloup.group(
+    context_settings=cli_ctx_settings,
+    invoke_without_command=True,
+    no_args_is_help=True,
+    epilog=EPILOG,
+    help="Manages the global cache of partial movie files.",
+)
+@cloup.option(
+    "--cache_dir",
+    default=None,
+    help="The cache directory, defaults to global_cache_dir of the config.",
+)
+@cloup.pass_context
+def cache(ctx: cloup.Context, cache_dir: str | None) -> None:
+    """Responsible for the cache subcommand."""
+    cache_dir = cache_dir or config.global_cache_dir
+    if ctx.invoked_subcommand is None:
+        return
+    if not cache_dir:
+        raise cloup.UsageError(
+            "No global cache configured. Set global_cache_dir in manim.cfg "
+            "or pass --cache_dir."
+        )
+    max_size = config.global_cache_max_size
+    ctx.obj = PartialMovieCache(
+        cache_dir, None if max_size == float("inf") else int(max_size * MIB)
+    )
+    ctx.call_on_close(ctx.obj.close)
+
+
+@cache.command(context_settings=cli_ctx_settings)
+@cloup.pass_obj
+def stats(store: PartialMovieCache) -> None:
+    """Show the size and the content of the cache."""
+    summary = store.stats()
+    budget = "unlimited" if store.max_size is None else _format_size(store.max_size)
+    console.print(f"Directory: {summary['directory']}")
+    console.print(f"Files: {summary['files']}")
+    console.print(f"Size: {_format_size(summary['size'])} (budget: {budget})")
+    console.print(f"Hits: {summary['hits']}")
+    console.print(
+        f"Last access: {_format_time(summary['oldest_access'])} "
+        f"to {_format_time(summary['newest_access'])}"
+    )
+    if not summary["scenes"]:
+        return
+    table = Table("Scene", "Files", "Size", "Hits")
+    for scene in summary["scenes"]:
+        table.add_row(
+            scene["scene"],
+            str(scene["files"]),
+            _format_size(scene["size"]),
+            str(scene["hits"]),
+        )
+    console.print(table)
+
+
+@cache.command(context_settings=cli_ctx_settings)
+@cloup.option(
+    "--max_size",
+    type=int,
+    default=None,
+    help="Budget in MiB, defaults to global_cache_max_size. 0 empties the cache.",
+)
+@cloup.pass_obj
+def prune(store: PartialMovieCache, max_size: int | None) -> None:
+    """Evict the least recently used files until the cache fits its budget."""
+    files, freed = store.prune(None if max_size is None else max_size * MIB)
+    console.print(f"Removed {files} file(s), {_format_size(freed)} freed.")
+
+
+@cache.command(context_settings=cli_ctx_settings)
+@cloup.option(
+    "--dry_run",
+    is_flag=True,
+    help="Only report problems, don't remove broken entries.",
+)
+@cloup.pass_obj
+def verify(store: PartialMovieCache, dry_run: bool) -> None:
+    """Check that the index of the cache matches the files on disk."""
+    problems = store.verify(fix=not dry_run)
+    for path, problem in problems:
+        console.print(f"[red]{problem}[/red]: {path}")
+    if not problems:
+        console.print("The cache is consistent.")
+    elif not dry_run:
+        console.print(f"Removed {len(problems)} broken entries or files.")
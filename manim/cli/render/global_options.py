@@ -80,6 +80,12 @@ global_options = option_group(
         help="Remove cached partial movie files.",
         default=None,
     ),
+    option(
+        "--global_cache_dir",
+        default=None,
+        help="Share cached partial movie files between scenes through the "
+        "store in this directory.",
+    ),
     option("--tex_template", help="Specify a custom TeX template file.", default=None),
     option(
         "-v",
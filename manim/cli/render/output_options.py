@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from cloup import IntRange, Path, option, option_group
+from cloup import Choice, IntRange, Path, option, option_group
+
+from manim.constants import X264_PRESETS
 
 __all__ = ["output_options"]
 
@@ -26,6 +28,30 @@ output_options = option_group(
         default=None,
         help="Write the video rendered with opengl to a file.",
     ),
+    option(
+        "--partial_movie_preset",
+        type=Choice(X264_PRESETS, case_sensitive=False),
+        default=None,
+        help="x264 preset for the partial movie files, e.g. ultrafast for drafts.",
+    ),
+    option(
+        "--partial_movie_intra_only",
+        is_flag=True,
+        default=None,
+        help="Encode every frame of the partial movie files as a key frame.",
+    ),
+    option(
+        "--final_movie_preset",
+        type=Choice(X264_PRESETS, case_sensitive=False),
+        default=None,
+        help="Transcode the combined movie once with this x264 preset.",
+    ),
+    option(
+        "--encoder_threads",
+        type=IntRange(min=0),
+        default=None,
+        help="Number of threads of the video encoder (0 to let it decide).",
+    ),
     option(
         "--media_dir",
         type=Path(),
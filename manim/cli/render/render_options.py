@@ -200,6 +200,20 @@ render_options = option_group(
         is_flag=True,
         help="Render scenes with alpha channel.",
     ),
+    option(
+        "--parallel_plays",
+        type=int,
+        default=None,
+        help="Render the uncached plays of a scene in this many worker processes "
+        "(-1 for one per CPU core). Cairo renderer only.",
+    ),
+    option(
+        "--profile",
+        is_flag=True,
+        default=None,
+        help="Record where the render spends its time, write a Chrome trace "
+        "to the log directory and print a summary.",
+    ),
     option(
         "--use_projection_fill_shaders",
         is_flag=True,
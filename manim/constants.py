@@ -69,6 +69,7 @@ __all__ = [
     "DEGREES",
     "QUALITIES",
     "DEFAULT_QUALITY",
+    "X264_PRESETS",
     "EPILOG",
     "CONTEXT_SETTINGS",
     "SHIFT_VALUE",
@@ -248,6 +249,20 @@ QUALITIES: dict[str, QualityDict] = {
 
 DEFAULT_QUALITY = "high_quality"
 
+# Encoder speed presets of libx264, from fastest to slowest
+X264_PRESETS = [
+    "ultrafast",
+    "superfast",
+    "veryfast",
+    "faster",
+    "fast",
+    "medium",
+    "slow",
+    "slower",
+    "veryslow",
+    "placebo",
+]
+
 EPILOG = "Made with <3 by Manim Community developers."
 SHIFT_VALUE = 65505
 CTRL_VALUE = 65507
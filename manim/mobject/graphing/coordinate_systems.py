@@ -33,7 +33,6 @@ from manim.mobject.text.tex_mobject import MathTex
 from manim.mobject.three_d.three_dimensions import Surface
 from manim.mobject.types.vectorized_mobject import (
     VDict,
-    VectorizedPoint,
     VGroup,
     VMobject,
 )
@@ -61,6 +60,7 @@ if TYPE_CHECKING:
         Point2D,
         Point2DLike,
         Point3D,
+        Point3D_Array,
         Point3DLike,
         Vector3D,
         Vector3DLike,
@@ -69,6 +69,30 @@ if TYPE_CHECKING:
     LineType = TypeVar("LineType", bound=Line)
 
 
+def _evaluate_on_array(
+    function: Callable[[float], float], values: np.ndarray
+) -> np.ndarray:
+    """Evaluate ``function`` at every value of ``values``.
+
+    ``function`` is called once on the whole array if it supports arrays,
+    which is checked against calling it on the first and last values.
+    Otherwise, it is called once per value.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            result = np.asarray(function(values), dtype=float)
+        samples = [values[0], values[-1]]
+        if result.shape == values.shape and np.allclose(
+            result[[0, -1]],
+            np.array([function(x) for x in samples], dtype=float),
+            equal_nan=True,
+        ):
+            return result
+    except Exception:
+        pass
+    return np.array([function(x) for x in values], dtype=float)
+
+
 class CoordinateSystem:
     r"""Abstract base class for Axes and NumberPlane.
 
@@ -735,8 +759,13 @@ class CoordinateSystem:
         # tick frequency.  But for functions, it indicates a
         # sample frequency
 
+        def from_underlying_function(
+            function: Callable[[float], float],
+        ) -> Callable[[float], Point3D]:
+            return lambda t: self.coords_to_point(t, function(t))
+
         graph = ParametricFunction(
-            lambda t: self.coords_to_point(t, function(t)),
+            from_underlying_function(function),
             t_range=t_range,
             scaling=self.x_axis.scaling,
             use_vectorized=use_vectorized,
@@ -744,6 +773,7 @@ class CoordinateSystem:
         )
 
         graph.underlying_function = function
+        graph._from_underlying_function = from_underlying_function
 
         if colorscale:
             if type(colorscale[0]) in (list, tuple):
@@ -885,12 +915,19 @@ class CoordinateSystem:
                     self.add(ax, cardioid)
         """
         dim = self.dimension
+
+        def from_underlying_function(
+            function: Callable[[float], np.ndarray],
+        ) -> Callable[[float], Point3D]:
+            return lambda t: self.coords_to_point(*function(t)[:dim])
+
         graph = ParametricFunction(
-            lambda t: self.coords_to_point(*function(t)[:dim]),
+            from_underlying_function(function),
             use_vectorized=use_vectorized,
             **kwargs,
         )
         graph.underlying_function = function
+        graph._from_underlying_function = from_underlying_function
         return graph
 
     def plot_polar_graph(
@@ -924,12 +961,19 @@ class CoordinateSystem:
                     self.add(plane, graph)
         """
         theta_range = theta_range if theta_range is not None else [0, 2 * PI]
+
+        def from_underlying_function(
+            r_func: Callable[[float], float],
+        ) -> Callable[[float], Point3D]:
+            return lambda th: self.pr2pt(r_func(th), th)
+
         graph = ParametricFunction(
-            function=lambda th: self.pr2pt(r_func(th), th),
+            function=from_underlying_function(r_func),
             t_range=theta_range,
             **kwargs,
         )
         graph.underlying_function = r_func
+        graph._from_underlying_function = from_underlying_function
         return graph
 
     def plot_surface(
@@ -1186,6 +1230,25 @@ class CoordinateSystem:
 
     # calculus
 
+    def _inputs_to_graph_points(
+        self, x_values: np.ndarray, graph: ParametricFunction | VMobject
+    ) -> Point3D_Array:
+        """:meth:`input_to_graph_point` of every value of ``x_values``.
+
+        For graphs of :meth:`plot`, the function is evaluated on all values
+        at once when it supports arrays, and the points are computed by a
+        single call to :meth:`coords_to_point`.
+        """
+        if hasattr(graph, "underlying_function"):
+            y_values = _evaluate_on_array(graph.underlying_function, x_values)
+            if y_values.shape == x_values.shape:
+                points = self.coords_to_point(x_values, y_values).T
+                # Polar graphs, for instance, map x to another point.
+                ends = [graph.function(x) for x in x_values[[0, -1]]]
+                if np.allclose(points[[0, -1]], ends):
+                    return points
+        return np.array([self.input_to_graph_point(x, graph) for x in x_values])
+
     def get_riemann_rectangles(
         self,
         graph: ParametricFunction,
@@ -1200,6 +1263,7 @@ class CoordinateSystem:
         bounded_graph: ParametricFunction | None = None,
         blend: bool = False,
         width_scale_factor: float = 1.001,
+        rectangles: VGroup | None = None,
     ) -> VGroup:
         """Generates a :class:`~.VGroup` of the Riemann Rectangles for a given curve.
 
@@ -1231,6 +1295,10 @@ class CoordinateSystem:
             If a secondary graph is specified, encloses the area between the two curves.
         width_scale_factor
             The factor by which the width of the rectangles is scaled.
+        rectangles
+            Rectangles returned by a previous call, which are updated in place
+            instead of creating new ones, e.g. in an updater. Rectangles are
+            added or removed if their number changed.
 
         Returns
         -------
@@ -1290,50 +1358,71 @@ class CoordinateSystem:
 
         x_range = [*x_range[:2], dx]
 
-        rectangles = VGroup()
         x_range_array = np.arange(*x_range)
+        num_rects = len(x_range_array)
+        if rectangles is None:
+            rectangles = VGroup()
+        if not num_rects:
+            return rectangles.remove(*rectangles.submobjects)
 
         if isinstance(color, (list, tuple)):
             color = [ManimColor(c) for c in color]
         else:
             color = [ManimColor(color)]
 
-        colors = color_gradient(color, len(x_range_array))
+        colors = color_gradient(color, num_rects)
 
-        for x, color in zip(x_range_array, colors, strict=False):
-            if input_sample_type == "left":
-                sample_input = x
-            elif input_sample_type == "right":
-                sample_input = x + dx
-            elif input_sample_type == "center":
-                sample_input = x + 0.5 * dx
-            else:
-                raise ValueError("Invalid input sample type")
-            graph_point = self.input_to_graph_point(sample_input, graph)
+        if input_sample_type == "left":
+            sample_inputs = x_range_array
+        elif input_sample_type == "right":
+            sample_inputs = x_range_array + dx
+        elif input_sample_type == "center":
+            sample_inputs = x_range_array + 0.5 * dx
+        else:
+            raise ValueError("Invalid input sample type")
+        graph_points = self._inputs_to_graph_points(sample_inputs, graph)
 
-            if bounded_graph is None:
-                y_point = self._origin_shift(self.y_range)
-            else:
-                y_point = bounded_graph.underlying_function(x)
-
-            points = VGroup(
-                *list(
-                    map(
-                        VectorizedPoint,
-                        [
-                            self.coords_to_point(x, y_point),
-                            self.coords_to_point(x + width_scale_factor * dx, y_point),
-                            graph_point,
-                        ],
-                    ),
-                )
+        if bounded_graph is None:
+            y_points = np.full(num_rects, self._origin_shift(self.y_range))
+        else:
+            y_points = _evaluate_on_array(
+                bounded_graph.underlying_function, x_range_array
             )
 
-            rect = Rectangle().replace(points, stretch=True)
-            rectangles.add(rect)
-
-            # checks if the rectangle is under the x-axis
-            if self.p2c(graph_point)[1] < y_point and show_signed_area:
+        # Every rectangle spans the bounding box of its two corners on the
+        # base line and its point on the graph, with shape (num_rects, 3, 3).
+        corners = np.stack(
+            [
+                self.coords_to_point(x_range_array, y_points).T,
+                self.coords_to_point(
+                    x_range_array + width_scale_factor * dx, y_points
+                ).T,
+                graph_points,
+            ],
+            axis=1,
+        )
+        lower, upper = corners.min(axis=1), corners.max(axis=1)
+        centers = (lower + upper) / 2
+        half_sizes = (upper - lower) / 2
+        half_sizes[:, 2] = 0
+        unit_points = Rectangle(width=2, height=2).points
+        rect_points = centers[:, None] + unit_points * half_sizes[:, None]
+
+        # checks if the rectangles are under the x-axis
+        below = np.zeros(num_rects, dtype=bool)
+        if show_signed_area:
+            below = self.point_to_coords(graph_points)[:, 1] < y_points
+
+        if len(rectangles) < num_rects:
+            rectangles.add(*(Rectangle() for _ in range(num_rects - len(rectangles))))
+        elif len(rectangles) > num_rects:
+            rectangles.remove(*rectangles.submobjects[num_rects:])
+
+        for rect, points, color, is_below in zip(
+            rectangles, rect_points, colors, below, strict=True
+        ):
+            rect.set_points(points)
+            if is_below:
                 color = invert_color(color)
 
             # blends rectangles smoothly
@@ -1356,6 +1445,7 @@ class CoordinateSystem:
         color: ParsableManimColor | Iterable[ParsableManimColor] = (BLUE, GREEN),
         opacity: float = 0.3,
         bounded_graph: ParametricFunction | None = None,
+        area: Polygon | None = None,
         **kwargs: Any,
     ) -> Polygon:
         """Returns a :class:`~.Polygon` representing the area under the graph passed.
@@ -1372,6 +1462,11 @@ class CoordinateSystem:
             The opacity of the area.
         bounded_graph
             If a secondary :attr:`graph` is specified, encloses the area between the two curves.
+        area
+            An area returned by a previous call, whose points are updated in
+            place instead of creating a new :class:`~.Polygon`, e.g. in an
+            updater. Its style is kept, so :attr:`color`, :attr:`opacity` and
+            :attr:`kwargs` are ignored.
         kwargs
             Additional parameters passed to :class:`~.Polygon`.
 
@@ -1420,20 +1515,35 @@ class CoordinateSystem:
             a = max(a, bounded_graph.t_min)
             b = min(b, bounded_graph.t_max)
 
+        def points_in_range(g: ParametricFunction) -> Point3D_Array:
+            if not len(g.points):
+                return g.points
+            x_values = self.point_to_coords(g.points)[:, 0]
+            return g.points[(a <= x_values) & (x_values <= b)]
+
         if bounded_graph is None:
-            points = (
-                [self.c2p(a), graph.function(a)]
-                + [p for p in graph.points if a <= self.p2c(p)[0] <= b]
-                + [graph.function(b), self.c2p(b)]
+            points = np.vstack(
+                [
+                    self.c2p(a),
+                    graph.function(a),
+                    points_in_range(graph),
+                    graph.function(b),
+                    self.c2p(b),
+                ]
             )
         else:
-            graph_points, bounded_graph_points = (
-                [g.function(a)]
-                + [p for p in g.points if a <= self.p2c(p)[0] <= b]
-                + [g.function(b)]
-                for g in (graph, bounded_graph)
+            points = np.vstack(
+                [
+                    graph.function(a),
+                    points_in_range(graph),
+                    graph.function(b),
+                    bounded_graph.function(b),
+                    points_in_range(bounded_graph)[::-1],
+                    bounded_graph.function(a),
+                ]
             )
-            points = graph_points + bounded_graph_points[::-1]
+        if area is not None:
+            return area.set_points_as_corners(np.vstack([points, points[:1]]))
         return Polygon(*points, **kwargs).set_opacity(opacity).set_color(color)
 
     def angle_of_tangent(
@@ -15,11 +15,12 @@ from manim import config
 from manim.mobject.graphing.scale import LinearBase, _ScaleBase
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 from manim.mobject.types.vectorized_mobject import VMobject
+from manim.utils.bezier import get_smooth_cubic_bezier_handle_points, interpolate
 
 if TYPE_CHECKING:
     from typing import Any, Self
 
-    from manim.typing import Point3D, Point3DLike
+    from manim.typing import Point3D, Point3D_Array, Point3DLike
     from manim.utils.color import ParsableManimColor
 
 from manim.utils.color import YELLOW
@@ -48,6 +49,14 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         Values of t at which the function experiences discontinuity.
     dt
         The left and right tolerance for the discontinuities.
+    use_adaptive_sampling
+        Whether to add samples where the curve bends. The intervals of
+        ``t_step`` are bisected (up to 8 times) until the middle of every
+        interval is closer than ``adaptive_tolerance`` to the chord, so a large
+        ``t_step`` suffices for curves which are straight in most places.
+    adaptive_tolerance
+        The largest distance, in scene units, between the curve and the line
+        segments approximating it when using adaptive sampling.
 
 
     Examples
@@ -103,6 +112,15 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
                 self.add(ax1, ax2, incorrect, correct)
     """
 
+    # The key and the result of the last get_sample_times call.
+    _sample_times: tuple[tuple, list[tuple[np.ndarray, np.ndarray]]] | None = None
+    # Turns the underlying function of a graph of a coordinate system, such as
+    # the function of x given to CoordinateSystem.plot, into the function of
+    # the curve.
+    _from_underlying_function: (
+        Callable[[Callable[..., Any]], Callable[[float], Point3DLike]] | None
+    ) = None
+
     def __init__(
         self,
         function: Callable[[float], Point3DLike],
@@ -112,13 +130,11 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         discontinuities: Iterable[float] | None = None,
         use_smoothing: bool = True,
         use_vectorized: bool = False,
+        use_adaptive_sampling: bool = False,
+        adaptive_tolerance: float = 1e-3,
         **kwargs: Any,
     ):
-        def internal_parametric_function(t: float) -> Point3D:
-            """Wrap ``function``'s output inside a NumPy array."""
-            return np.asarray(function(t))
-
-        self.function = internal_parametric_function
+        self.set_function(function)
         if len(t_range) == 2:
             t_range = (*t_range, 0.01)
 
@@ -128,21 +144,68 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
         self.use_vectorized = use_vectorized
+        self.use_adaptive_sampling = use_adaptive_sampling
+        self.adaptive_tolerance = adaptive_tolerance
         self.t_min, self.t_max, self.t_step = t_range
 
         super().__init__(**kwargs)
 
+    def set_function(self, function: Callable[[float], Point3DLike]) -> Self:
+        """Sets the function of the curve, without updating its points.
+
+        See :meth:`replot` to update the points.
+        """
+
+        def internal_parametric_function(t: float) -> Point3D:
+            """Wrap ``function``'s output inside a NumPy array."""
+            return np.asarray(function(t))
+
+        self.function = internal_parametric_function
+        return self
+
     def get_function(self) -> Callable[[float], Point3D]:
         return self.function
 
     def get_point_from_function(self, t: float) -> Point3D:
         return self.function(t)
 
-    def generate_points(self) -> Self:
-        if self.discontinuities is not None:
+    def get_sample_times(self) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Returns the values of ``t`` at which the function is sampled.
+
+        The values are cached until :attr:`t_min`, :attr:`t_max`,
+        :attr:`t_step`, :attr:`dt`, :attr:`scaling` or :attr:`discontinuities`
+        change.
+
+        Returns
+        -------
+        list[tuple[np.ndarray, np.ndarray]]
+            For every continuous piece of the curve, the values of ``t`` before
+            and after applying :attr:`scaling`.
+        """
+        discontinuities = self.discontinuities
+        if discontinuities is not None:
+            discontinuities = tuple(discontinuities)
+            if iter(self.discontinuities) is self.discontinuities:
+                # An iterator is only read once.
+                self.discontinuities = discontinuities
+        # The values are compared rather than the objects, which can change
+        # in place.
+        key = (
+            self.t_min,
+            self.t_max,
+            self.t_step,
+            self.dt,
+            type(self.scaling),
+            repr(sorted(vars(self.scaling).items())),
+            discontinuities,
+        )
+        if self._sample_times is not None and self._sample_times[0] == key:
+            return self._sample_times[1]
+
+        if discontinuities is not None:
             discontinuities = filter(
                 lambda t: self.t_min <= t <= self.t_max,
-                self.discontinuities,
+                discontinuities,
             )
             discontinuities_array = np.array(list(discontinuities))
             boundary_times = np.array(
@@ -157,22 +220,67 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         else:
             boundary_times = [self.t_min, self.t_max]
 
+        sample_times = []
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2], strict=False):
+            t_values = np.append(np.arange(t1, t2, self.t_step), t2)
             t_range = np.array(
                 [
-                    *self.scaling.function(np.arange(t1, t2, self.t_step)),
+                    *self.scaling.function(t_values[:-1]),
                     self.scaling.function(t2),
                 ],
             )
+            sample_times.append((t_values, t_range))
+        self._sample_times = (key, sample_times)
+        return sample_times
+
+    def _evaluate(self, t_range: np.ndarray) -> Point3D_Array:
+        if self.use_vectorized:
+            x, y, z = self.function(t_range)
+            if not isinstance(z, np.ndarray):
+                z = np.zeros_like(x)
+            return np.stack([x, y, z], axis=1)
+        return np.array([self.function(t) for t in t_range])
+
+    def _sample_adaptively(
+        self, t_values: np.ndarray, t_range: np.ndarray
+    ) -> Point3D_Array:
+        points = self._evaluate(t_range)
+        # Indices of the intervals to check, bisected at most 8 times.
+        intervals = np.arange(len(t_values) - 1)
+        for _ in range(8):
+            if not len(intervals):
+                break
+            mid_values = (t_values[intervals] + t_values[intervals + 1]) / 2
+            mid_points = self._evaluate(self.scaling.function(mid_values))
+            chord_midpoints = (points[intervals] + points[intervals + 1]) / 2
+            deviations = np.linalg.norm(mid_points - chord_midpoints, axis=1)
+            bent = deviations > self.adaptive_tolerance
+            # Insert the midpoints of the bent intervals, and check both
+            # halves of them in the next round.
+            t_values = np.insert(t_values, intervals[bent] + 1, mid_values[bent])
+            points = np.insert(points, intervals[bent] + 1, mid_points[bent], axis=0)
+            split = intervals[bent] + np.arange(np.count_nonzero(bent))
+            intervals = np.stack([split, split + 1], axis=1).ravel()
+        return points
+
+    def get_sample_points(self) -> list[Point3D_Array]:
+        """Evaluates the function at the values of :meth:`get_sample_times`,
+        or adaptively if :attr:`use_adaptive_sampling` is set.
+
+        Returns
+        -------
+        list[Point3D_Array]
+            The points of every continuous piece of the curve.
+        """
+        if self.use_adaptive_sampling:
+            return [
+                self._sample_adaptively(t_values, t_range)
+                for t_values, t_range in self.get_sample_times()
+            ]
+        return [self._evaluate(t_range) for _, t_range in self.get_sample_times()]
 
-            if self.use_vectorized:
-                x, y, z = self.function(t_range)
-                if not isinstance(z, np.ndarray):
-                    z = np.zeros_like(x)
-                points = np.stack([x, y, z], axis=1)
-            else:
-                points = np.array([self.function(t) for t in t_range])
-
+    def generate_points(self) -> Self:
+        for points in self.get_sample_points():
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
@@ -180,6 +288,78 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
             self.make_smooth()
         return self
 
+    def replot(self, function: Callable[[float], Point3DLike] | None = None) -> Self:
+        """Evaluates the function again and updates the points of the curve.
+
+        The samples of ``t`` are reused, and when their number did not change,
+        the points are written into the existing array, without building a
+        new path or touching the style. This makes it a cheap updater for
+        curves depending on a :class:`~.ValueTracker`, compared to
+        :func:`~.always_redraw`.
+
+        Parameters
+        ----------
+        function
+            A new function for the curve. If ``None``, the current function
+            is evaluated again. For graphs of a coordinate system, such as
+            the ones of :meth:`~.CoordinateSystem.plot`, this replaces the
+            ``underlying_function`` and takes the same form, for instance
+            the function of ``x``.
+
+        Returns
+        -------
+        :class:`ParametricFunction`
+            ``self``
+
+        Examples
+        --------
+        .. manim:: ReplotExample
+
+            class ReplotExample(Scene):
+                def construct(self):
+                    ax = Axes()
+                    k = ValueTracker(1)
+                    graph = ax.plot(
+                        lambda x: np.sin(k.get_value() * x), use_vectorized=True
+                    )
+                    graph.add_updater(lambda graph: graph.replot())
+                    self.add(ax, graph)
+                    self.play(k.animate.set_value(3))
+        """
+        if function is not None:
+            if self._from_underlying_function is not None:
+                self.underlying_function = function
+                function = self._from_underlying_function(function)
+            self.set_function(function)
+        paths = self.get_sample_points()
+        nppcc = self.n_points_per_curve
+        sizes = [nppcc * (len(points) - 1) for points in paths]
+        if (
+            not isinstance(self, VMobject)
+            or min(sizes, default=0) == 0
+            or sum(sizes) != len(self.points)
+        ):
+            self.clear_points()
+            return self.generate_points()
+
+        start = 0
+        for points, size in zip(paths, sizes, strict=True):
+            curves = self.points[start : start + size].reshape(-1, nppcc, self.dim)
+            curves[:, 0] = points[:-1]
+            curves[:, -1] = points[1:]
+            if self.use_smoothing and len(paths) == 1:
+                curves[:, 1], curves[:, 2] = get_smooth_cubic_bezier_handle_points(
+                    points
+                )
+            else:
+                for i, t in enumerate(self._bezier_t_values[1:-1], start=1):
+                    curves[:, i] = interpolate(points[:-1], points[1:], t)
+            start += size
+        if self.use_smoothing and len(paths) > 1:
+            # The pieces may join into a single subpath when smoothing.
+            self.make_smooth()
+        return self
+
     def init_points(self) -> None:
         self.generate_points()
 
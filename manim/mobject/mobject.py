@@ -35,6 +35,7 @@ from ..utils.color import (
     color_gradient,
     interpolate_color,
 )
+from ..utils.config_ops import _CopyOnWriteArray
 from ..utils.exceptions import MultiAnimationOverrideException
 from ..utils.iterables import list_update, remove_list_redundancies
 from ..utils.paths import straight_path
@@ -51,6 +52,7 @@ if TYPE_CHECKING:
         PathFuncType,
         PixelArray,
         Point3D,
+        Point3D_Array,
         Point3DLike,
         Point3DLike_Array,
         Vector3DLike,
@@ -85,6 +87,9 @@ class Mobject:
 
     animation_overrides = {}
 
+    # Shared with the copies of the mobject until either accesses it.
+    points: _CopyOnWriteArray[Point3D_Array] = _CopyOnWriteArray()
+
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
@@ -398,8 +403,15 @@ class Mobject:
         cls = self.__class__
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, clone_from_id))
+        # The values aren't bound to a variable before being shared, since
+        # _CopyOnWriteArray.share counts the references to them.
+        for k in list(self.__dict__):
+            descriptor = getattr(cls, k, None)
+            if isinstance(descriptor, _CopyOnWriteArray) and descriptor.share(
+                self, result
+            ):
+                continue
+            setattr(result, k, copy.deepcopy(self.__dict__[k], clone_from_id))
         result.original_id = str(id(self))
         return result
 
@@ -848,6 +860,13 @@ class Mobject:
         """Create and return an identical copy of the :class:`Mobject` including all
         :attr:`submobjects`.
 
+        The :attr:`points` (and the colors of :class:`~.VMobject` and
+        :class:`~.PMobject`) are not copied right away: the copy shares them
+        with the original until either of them accesses them, and only the
+        copy then copies them. The arrays of the original stay writable, and
+        arrays which are views or are referenced elsewhere are copied right
+        away.
+
         Returns
         -------
         :class:`Mobject`
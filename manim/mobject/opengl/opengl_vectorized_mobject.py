@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import itertools as it
 import operator as op
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Sequence
 from functools import reduce, wraps
 from typing import Any, Self
@@ -49,13 +50,19 @@ __all__ = [
 def triggers_refreshed_triangulation(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        old_points = np.empty((0, 3))
-        for mob in self.family_members_with_points():
-            old_points = np.concatenate((old_points, mob.points), axis=0)
+        old_points = np.concatenate(
+            [
+                np.empty((0, 3)),
+                *(mob.points for mob in self.family_members_with_points()),
+            ]
+        )
         func(self, *args, **kwargs)
-        new_points = np.empty((0, 3))
-        for mob in self.family_members_with_points():
-            new_points = np.concatenate((new_points, mob.points), axis=0)
+        new_points = np.concatenate(
+            [
+                np.empty((0, 3)),
+                *(mob.points for mob in self.family_members_with_points()),
+            ]
+        )
         if not np.array_equal(new_points, old_points):
             self.refresh_triangulation()
             self.refresh_unit_normal()
@@ -64,6 +71,48 @@ def triggers_refreshed_triangulation(func):
     return wrapper
 
 
+# The number of triangulations shared between mobjects with the same shape,
+# such as the glyphs of a text.
+TRIANGULATION_CACHE_SIZE = 1024
+_triangulation_cache: OrderedDict[tuple, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+
+def _are_affine_images(verts1: np.ndarray | None, verts2: np.ndarray) -> bool:
+    """Whether ``verts2`` is the image of ``verts1`` by an orientation-preserving
+    affine map of the xy plane, in which case both have the same triangulations.
+    """
+    if verts1 is None or len(verts1) != len(verts2):
+        return False
+    xy1 = verts1[:, :2] - verts1[:, :2].mean(0)
+    xy2 = verts2[:, :2] - verts2[:, :2].mean(0)
+    if not xy1.any():
+        return not xy2.any()
+    # The linear part of the affine map best mapping verts1 to verts2.
+    matrix, _, rank, _ = np.linalg.lstsq(xy1, xy2, rcond=None)
+    if rank < 2 or np.linalg.det(matrix) <= 0:
+        return False
+    return np.abs(xy2 - xy1 @ matrix).max() <= 1e-6 * np.abs(xy2).max()
+
+
+def _earclip_triangulation_cached(
+    verts: np.ndarray, rings: np.ndarray, topology: tuple
+) -> np.ndarray:
+    """:func:`~.earclip_triangulation`, reusing the result for identical shapes."""
+    offsets = verts[:, :2] - verts[0, :2]
+    scale = np.abs(offsets).max() or 1.0
+    # Adding zero turns the negative zeros into positive ones.
+    key = (*topology, (np.round(offsets / scale, 6) + 0.0).tobytes())
+    entry = _triangulation_cache.get(key)
+    if entry is not None and _are_affine_images(entry[0], verts):
+        _triangulation_cache.move_to_end(key)
+        return entry[1]
+    tri_indices = np.asarray(earclip_triangulation(verts, rings), dtype=int)
+    _triangulation_cache[key] = (verts, tri_indices)
+    if len(_triangulation_cache) > TRIANGULATION_CACHE_SIZE:
+        _triangulation_cache.popitem(last=False)
+    return tri_indices
+
+
 class OpenGLVMobject(OpenGLMobject):
     """A vectorized mobject."""
 
@@ -149,6 +198,8 @@ class OpenGLVMobject(OpenGLMobject):
 
         self.needs_new_triangulation = True
         self.triangulation = np.zeros(0, dtype="i4")
+        self._triangulation_topology: tuple | None = None
+        self._triangulated_verts: np.ndarray | None = None
         self.orientation = 1
 
         self.fill_data = None
@@ -1418,6 +1469,7 @@ class OpenGLVMobject(OpenGLMobject):
 
         if len(points) <= 1:
             self.triangulation = np.zeros(0, dtype="i4")
+            self._triangulation_topology = self._triangulated_verts = None
             self.needs_new_triangulation = False
             return self.triangulation
 
@@ -1433,14 +1485,15 @@ class OpenGLVMobject(OpenGLMobject):
         v12s = b2s - b1s
 
         crosses = cross2d(v01s, v12s)
-        convexities = np.sign(crosses)
 
         atol = self.tolerance_for_point_equality
         end_of_loop = np.zeros(len(b0s), dtype=bool)
         end_of_loop[:-1] = (np.abs(b2s[:-1] - b0s[1:]) > atol).any(1)
         end_of_loop[-1] = True
 
-        concave_parts = convexities < 0
+        # The cross products of straight curves are rounding errors, which
+        # must not make them concave.
+        concave_parts = crosses < -atol
 
         # These are the vertices to which we'll apply a polygon triangulation
         inner_vert_indices = np.hstack(
@@ -1453,14 +1506,26 @@ class OpenGLVMobject(OpenGLMobject):
         inner_vert_indices.sort()
         rings = np.arange(1, len(inner_vert_indices) + 1)[inner_vert_indices % 3 == 2]
 
-        # Triangulate
+        # The triangulation only depends on which vertices bound the interior,
+        # so it is kept as long as these are moved by an affine map which
+        # doesn't flip them.
+        topology = (len(points), concave_parts.tobytes(), end_of_loop.tobytes())
         inner_verts = points[inner_vert_indices]
+        if topology == self._triangulation_topology and _are_affine_images(
+            self._triangulated_verts, inner_verts
+        ):
+            self.needs_new_triangulation = False
+            return self.triangulation
+
+        # Triangulate
         inner_tri_indices = inner_vert_indices[
-            earclip_triangulation(inner_verts, rings)
+            _earclip_triangulation_cached(inner_verts, rings, topology)
         ]
 
         tri_indices = np.hstack([indices, inner_tri_indices])
         self.triangulation = tri_indices
+        self._triangulation_topology = topology
+        self._triangulated_verts = inner_verts
         self.needs_new_triangulation = False
         return tri_indices
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import os
 from pathlib import Path
 from typing import Any
@@ -17,6 +18,7 @@ from ...constants import RIGHT
 from ...utils.bezier import get_quadratic_approximation_of_cubic
 from ...utils.images import get_full_vector_image_path
 from ...utils.iterables import hash_obj
+from ...utils.svg_cache import SVGCache
 from ..geometry.arc import Circle
 from ..geometry.line import Line
 from ..geometry.polygram import Polygon, Rectangle, RoundedRectangle
@@ -89,7 +91,9 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         will be used as a key and a copy of the created mobject will
         be saved using that key to be quickly retrieved if the same
         inputs need be processed later. For large SVGs which are used
-        only once, this can be omitted to improve performance.
+        only once, this can be omitted to improve performance. This
+        doesn't affect the cache in the ``svg_cache_dir`` of the config,
+        shared by all renders, see :mod:`~.utils.svg_cache`.
     kwargs
         Further arguments passed to the parent class.
     """
@@ -161,6 +165,14 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         """Checks whether the SVG has already been imported and
         generates it if not.
 
+        Unless ``svg_cache_dir`` is empty in the config, the points and the
+        style arrays of the imported submobjects are also saved in that
+        directory, so that later renders don't parse the SVG file again, see
+        :mod:`~.utils.svg_cache`. This only applies to SVG files whose
+        submobjects are all instances of :meth:`get_mobject_type_class`,
+        such as polylines; paths, lines, rectangles and ellipses are always
+        parsed into their own classes.
+
         See also
         --------
         :meth:`.SVGMobject.generate_mobject`
@@ -172,7 +184,19 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
                 self.add(*mob)
                 return
 
-        self.generate_mobject()
+        svg_cache = SVGCache.from_config()
+        cache_key = None if svg_cache is None else self.get_cache_key()
+        if svg_cache is None or cache_key is None:
+            self.generate_mobject()
+        else:
+            cached = svg_cache.load(cache_key)
+            if cached is not None:
+                self.add_cached_submobjects(*cached)
+            else:
+                self.generate_mobject()
+                arrays = self.get_cache_arrays()
+                if arrays is not None:
+                    svg_cache.store(cache_key, *arrays)
         if use_svg_cache:
             SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
 
@@ -191,17 +215,129 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
             config.renderer,
         )
 
+    def get_cache_key(self) -> str | None:
+        """The address of the imported submobjects in the SVG cache.
+
+        It is a digest of :attr:`hash_seed` and of the content of the SVG
+        file, so that an edited file is imported again.
+
+        Returns
+        -------
+        :class:`str` | None
+            The key, or ``None`` if no file is specified.
+        """
+        if self.file_name is None:
+            return None
+        seed = repr(self.hash_seed).encode() + self.get_file_path().read_bytes()
+        return SVGCache.make_key(seed)
+
+    def get_cached_style_attributes(self) -> dict[str, tuple[int, ...]]:
+        """The style attributes of the submobjects saved in the SVG cache.
+
+        Returns
+        -------
+        dict[str, tuple[int, ...]]
+            The shape every attribute is given back, ``()`` for a float.
+        """
+        if config.renderer == "opengl":
+            return {
+                "fill_rgba": (-1, 4),
+                "stroke_rgba": (-1, 4),
+                "stroke_width": (-1, 1),
+                "gloss": (),
+                "shadow": (),
+            }
+        return {
+            "fill_rgbas": (-1, 4),
+            "stroke_rgbas": (-1, 4),
+            "background_stroke_rgbas": (-1, 4),
+            "stroke_width": (),
+            "background_stroke_width": (),
+            "sheen_factor": (),
+            "sheen_direction": (3,),
+        }
+
+    def get_cache_arrays(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """Describe the submobjects for the SVG cache.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None
+            The points of all submobjects, the index after the last point of
+            every submobject, the values of the attributes in
+            :meth:`get_cached_style_attributes` of all submobjects, and the
+            index after the last value of every attribute of every
+            submobject, with one row per submobject. ``None`` if some
+            submobject can't be cached.
+        """
+        # Only plain submobjects are described completely by their points
+        # and style, e.g. a Circle would lose its radius.
+        vmobject_class = self.get_mobject_type_class()
+        if any(
+            type(mob) is not vmobject_class or mob.submobjects
+            for mob in self.submobjects
+        ):
+            return None
+        attributes = self.get_cached_style_attributes()
+        values = [
+            np.asarray(getattr(mob, name), dtype=float).ravel()
+            for mob in self.submobjects
+            for name in attributes
+        ]
+        points = [mob.points for mob in self.submobjects]
+        return (
+            np.concatenate(points) if points else np.zeros((0, 3)),
+            np.cumsum([len(mob_points) for mob_points in points], dtype=int),
+            np.concatenate(values) if values else np.zeros(0),
+            np.cumsum([len(value) for value in values], dtype=int).reshape(
+                -1, len(attributes)
+            ),
+        )
+
+    def add_cached_submobjects(
+        self,
+        points: np.ndarray,
+        ends: np.ndarray,
+        styles: np.ndarray,
+        style_ends: np.ndarray,
+    ) -> None:
+        """Add the submobjects described by :meth:`get_cache_arrays`, as
+        instances of :meth:`get_mobject_type_class` like the parsed ones.
+        """
+        vmobject_class = self.get_mobject_type_class()
+        attributes = self.get_cached_style_attributes()
+        starts = np.concatenate([[0], ends])[:-1].astype(int)
+        style_starts = np.concatenate([[0], style_ends.ravel()])[:-1].astype(int)
+        style_starts = style_starts.reshape(style_ends.shape)
+        for start, end, value_starts, value_ends in zip(
+            starts, ends, style_starts, style_ends, strict=True
+        ):
+            mob = vmobject_class()
+            mob.set_points(points[start:end])
+            for (name, shape), value_start, value_end in zip(
+                attributes.items(), value_starts, value_ends, strict=True
+            ):
+                value = styles[value_start:value_end]
+                setattr(
+                    mob,
+                    name,
+                    float(value[0]) if shape == () else np.array(value).reshape(shape),
+                )
+            self.add(mob)
+
     def generate_mobject(self) -> None:
         """Parse the SVG and translate its elements to submobjects."""
         file_path = self.get_file_path()
         element_tree = ET.parse(file_path)
         new_tree = self.modify_xml_tree(element_tree)  # type: ignore[arg-type]
-        # Create a temporary svg file to dump modified svg to be parsed
-        modified_file_path = file_path.with_name(f"{file_path.stem}_{file_path.suffix}")
-        new_tree.write(modified_file_path)
-
-        svg = se.SVG.parse(modified_file_path)
-        modified_file_path.unlink()
+        # The modified tree is parsed from memory, so that renders importing
+        # the same file at the same time don't race for a temporary file.
+        modified_svg = io.BytesIO()
+        new_tree.write(modified_svg)
+        modified_svg.seek(0)
+        svg = se.SVG.parse(modified_svg)
 
         mobjects = self.get_mobjects_from(svg)
         self.add(*mobjects)
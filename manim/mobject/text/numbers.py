@@ -11,7 +11,12 @@ import numpy as np
 from manim import config
 from manim.constants import *
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
-from manim.mobject.text.tex_mobject import MathTex, SingleStringMathTex, Tex
+from manim.mobject.text.tex_mobject import (
+    MathTex,
+    SingleStringMathTex,
+    Tex,
+    prefetch_tex,
+)
 from manim.mobject.text.text_mobject import Text
 from manim.mobject.types.vectorized_mobject import VMobject
 from manim.mobject.value_tracker import ValueTracker
@@ -157,6 +162,8 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
         self.submobjects = []
 
         num_string = self._get_num_string(number)
+        if self.mob_class is MathTex:
+            prefetch_tex(*(c for c in num_string if c not in string_to_mob_map))
         self.add(*(map(self._string_to_mob, num_string)))
 
         # Add non-numerical bits
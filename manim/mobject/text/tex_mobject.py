@@ -20,6 +20,7 @@ __all__ = [
     "Tex",
     "BulletedList",
     "Title",
+    "prefetch_tex",
 ]
 
 
@@ -37,7 +38,7 @@ from manim.mobject.geometry.line import Line
 from manim.mobject.svg.svg_mobject import SVGMobject
 from manim.mobject.types.vectorized_mobject import VGroup, VMobject
 from manim.utils.tex import TexTemplate
-from manim.utils.tex_file_writing import tex_to_svg_file
+from manim.utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files
 
 
 class SingleStringMathTex(SVGMobject):
@@ -123,13 +124,15 @@ class SingleStringMathTex(SVGMobject):
             # font_size does not depend on current size.
             self.scale(font_val / self.font_size)
 
-    def _get_modified_expression(self, tex_string: str) -> str:
+    @classmethod
+    def _get_modified_expression(cls, tex_string: str) -> str:
         result = tex_string
         result = result.strip()
-        result = self._modify_special_strings(result)
+        result = cls._modify_special_strings(result)
         return result
 
-    def _modify_special_strings(self, tex: str) -> str:
+    @classmethod
+    def _modify_special_strings(cls, tex: str) -> str:
         tex = tex.strip()
         should_add_filler = reduce(
             op.or_,
@@ -170,7 +173,7 @@ class SingleStringMathTex(SVGMobject):
             tex = tex.replace("\\left", "\\big")
             tex = tex.replace("\\right", "\\big")
 
-        tex = self._remove_stray_braces(tex)
+        tex = cls._remove_stray_braces(tex)
 
         for context in ["array"]:
             begin_in = ("\\begin{%s}" % context) in tex  # noqa: UP031
@@ -182,7 +185,8 @@ class SingleStringMathTex(SVGMobject):
                 tex = ""
         return tex
 
-    def _remove_stray_braces(self, tex: str) -> str:
+    @staticmethod
+    def _remove_stray_braces(tex: str) -> str:
         r"""
         Makes :class:`~.MathTex` resilient to unmatched braces.
 
@@ -221,6 +225,50 @@ class SingleStringMathTex(SVGMobject):
         return self
 
 
+def prefetch_tex(
+    *tex_strings: str,
+    tex_environment: str | None = "align*",
+    tex_template: TexTemplate | None = None,
+) -> None:
+    r"""Compile the LaTeX of mobjects before creating them.
+
+    Every :class:`~.SingleStringMathTex` compiles its string when it is
+    created, which starts LaTeX and dvisvgm for every new string. Declaring
+    the strings of a scene up front compiles all of them at once instead, see
+    :func:`~.tex_to_svg_files`. Strings which were compiled before are skipped.
+
+    Parameters
+    ----------
+    tex_strings
+        The strings of the mobjects, like they are passed to
+        :class:`~.SingleStringMathTex` or, when they are not split into parts,
+        to :class:`~.MathTex`.
+    tex_environment
+        The environment of the mobjects, ``"center"`` for :class:`~.Tex`.
+    tex_template
+        The template of the mobjects, defaults to ``config["tex_template"]``.
+
+    Examples
+    --------
+    ::
+
+        class Powers(Scene):
+            def construct(self):
+                prefetch_tex(*(f"2^{{{n}}}" for n in range(50)))
+                prefetch_tex("Powers of two", tex_environment="center")
+                self.add(Tex("Powers of two").to_edge(UP))
+                for n in range(50):
+                    self.add(MathTex(f"2^{{{n}}}"))
+                    self.wait(0.1)
+    """
+    if len(tex_strings) > 1:
+        tex_to_svg_files(
+            [SingleStringMathTex._get_modified_expression(s) for s in tex_strings],
+            environment=tex_environment,
+            tex_template=tex_template,
+        )
+
+
 class MathTex(SingleStringMathTex):
     r"""A string compiled with LaTeX in math mode.
 
@@ -274,6 +322,13 @@ class MathTex(SingleStringMathTex):
         self.brace_notation_split_occurred = False
         self.tex_strings = self._break_up_tex_strings(tex_strings)
         try:
+            # The whole string and each of its parts are compiled together.
+            prefetch_tex(
+                self.arg_separator.join(self.tex_strings),
+                *self.tex_strings,
+                tex_environment=self.tex_environment,
+                tex_template=self.tex_template,
+            )
             super().__init__(
                 self.arg_separator.join(self.tex_strings),
                 tex_environment=self.tex_environment,
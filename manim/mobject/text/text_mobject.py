@@ -62,23 +62,26 @@ from contextlib import contextmanager
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree as ET
 
 import manimpango
 import numpy as np
+import svgelements as se
 from manimpango import MarkupUtils, PangoUtils, TextSetting
 
 from manim import config, logger
 from manim.constants import *
 from manim.mobject.geometry.arc import Dot
-from manim.mobject.svg.svg_mobject import SVGMobject
+from manim.mobject.svg.svg_mobject import SVGMobject, VMobjectFromSVGPath
 from manim.mobject.types.vectorized_mobject import VGroup, VMobject
 from manim.typing import Point3D
 from manim.utils.color import ManimColor, ParsableManimColor, color_gradient
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
     from typing import Self
 
-    from manim.typing import Point3D
+    from manim.typing import Point3D, Point3D_Array
 
 TEXT_MOB_SCALE_FACTOR = 0.05
 DEFAULT_LINE_SPACING_SCALE = 0.3
@@ -86,6 +89,12 @@ TEXT2SVG_ADJUSTMENT_FACTOR = 4.8
 
 __all__ = ["Text", "Paragraph", "MarkupText", "register_font"]
 
+GLYPH_OUTLINE_CACHE: dict[tuple[Hashable, ...], Point3D_Array] = {}
+
+# Replaces the outlines of the glyphs before svgelements parses the SVG.
+# Once placed by svgelements, its points locate the glyph in the text.
+_GLYPH_PLACEHOLDER = "M 0 0 M 1 0 M 0 1"
+
 
 def remove_invisible_chars(mobject: VMobject) -> VMobject:
     """Function to remove unwanted invisible characters from some mobjects.
@@ -296,7 +305,124 @@ class Paragraph(VGroup):
             )
 
 
-class Text(SVGMobject):
+class _PangoSVGMobject(SVGMobject):
+    """A mobject imported from an SVG file written by Pango.
+
+    Pango writes the outline of every glyph of the text once, as a
+    ``<symbol>``, and places it with ``<use>`` elements. These outlines are
+    parsed and closed only once per process: they are kept in
+    :data:`GLYPH_OUTLINE_CACHE`, keyed by their path data, so that the glyphs
+    of a new string in an already used font, weight, slant and size are
+    copied rather than parsed again.
+    """
+
+    def generate_mobject(self) -> None:
+        # Maps the ids of the replaced outlines to their path data.
+        self._glyph_outlines: dict[str, str] = {}
+        super().generate_mobject()
+        del self._glyph_outlines
+
+    def modify_xml_tree(self, element_tree: ET.ElementTree) -> ET.ElementTree:
+        new_tree = super().modify_xml_tree(element_tree)
+        for symbol in new_tree.iter():
+            if symbol.tag.rpartition("}")[2] != "symbol":
+                continue
+            paths = [
+                path for path in symbol.iter() if path.tag.rpartition("}")[2] == "path"
+            ]
+            for index, path in enumerate(paths):
+                glyph_id = f"{symbol.get('id')}-outline-{index}"
+                self._glyph_outlines[glyph_id] = path.get("d", "")
+                path.set("id", glyph_id)
+                path.set("d", _GLYPH_PLACEHOLDER)
+        return new_tree
+
+    def path_to_mobject(self, path: se.Path) -> VMobjectFromSVGPath:
+        mob = super().path_to_mobject(path)
+        path_data = self._glyph_outlines.get(path.id)
+        if path_data is None:
+            if mob.has_points():
+                mob.points = self._close_outline(mob.points, self.n_points_per_curve)
+            return mob
+        outline = self._get_glyph_outline(path_data)
+        if len(outline):
+            origin, x_end, y_end = (np.array([*segment.end, 0.0]) for segment in path)
+            mob.points = origin + outline @ np.array(
+                [x_end - origin, y_end - origin, OUT]
+            )
+        return mob
+
+    def _get_glyph_outline(self, path_data: str) -> Point3D_Array:
+        """The closed outline of a glyph, in the coordinates of its symbol."""
+        key = (
+            path_data,
+            config.renderer,
+            tuple(sorted(self.path_string_config.items())),
+        )
+        outline = GLYPH_OUTLINE_CACHE.get(key)
+        if outline is None:
+            outline = super().path_to_mobject(se.Path(path_data)).points
+            if len(outline):
+                outline = self._close_outline(outline, self.n_points_per_curve)
+            GLYPH_OUTLINE_CACHE[key] = outline
+        return outline
+
+    @staticmethod
+    def _close_outline(points: Point3D_Array, nppc: int) -> Point3D_Array:
+        curve_start = points[0]
+        # Some of the glyphs in this text might not be closed,
+        # so we close them by identifying when one curve ends
+        # but it is not where the next curve starts.
+        # It is more efficient to temporarily create a list
+        # of points and add them one at a time, then turn them
+        # into a numpy array at the end, rather than creating
+        # new numpy arrays every time a point or fixing line
+        # is added (which is O(n^2) for numpy arrays).
+        closed_curve_points: list[Point3D] = []
+        # OpenGL has points be part of quadratic Bezier curves;
+        # Cairo uses cubic Bezier curves.
+        if nppc == 3:  # RendererType.OPENGL
+
+            def add_line_to(end: Point3D) -> None:
+                nonlocal closed_curve_points
+                start = closed_curve_points[-1]
+                closed_curve_points += [
+                    start,
+                    (start + end) / 2,
+                    end,
+                ]
+
+        else:  # RendererType.CAIRO
+
+            def add_line_to(end: Point3D) -> None:
+                nonlocal closed_curve_points
+                start = closed_curve_points[-1]
+                closed_curve_points += [
+                    start,
+                    (start + start + end) / 3,
+                    (start + end + end) / 3,
+                    end,
+                ]
+
+        for index, point in enumerate(points):
+            closed_curve_points.append(point)
+            if (
+                index != len(points) - 1
+                and (index + 1) % nppc == 0
+                and any(point != points[index + 1])
+            ):
+                # Add straight line from last point on this curve to the
+                # start point on the next curve. We represent the line
+                # as a cubic bezier curve where the two control points
+                # are half-way between the start and stop point.
+                add_line_to(curve_start)
+                curve_start = points[index + 1]
+        # Make sure last curve is closed
+        add_line_to(curve_start)
+        return np.array(closed_curve_points, ndmin=2)
+
+
+class Text(_PangoSVGMobject):
     r"""Display (non-LaTeX) text rendered using `Pango <https://pango.org/>`_.
 
     Text objects behave like a :class:`.VGroup`-like iterable of all characters
@@ -528,63 +654,6 @@ class Text(SVGMobject):
             self.submobjects = [*self._gen_chars()]
         self.chars = self.get_group_class()(*self.submobjects)
         self.text = text_without_tabs.replace(" ", "").replace("\n", "")
-        nppc = self.n_points_per_curve
-        for each in self:
-            if len(each.points) == 0:
-                continue
-            points = each.points
-            curve_start = points[0]
-            assert len(curve_start) == self.dim, curve_start
-            # Some of the glyphs in this text might not be closed,
-            # so we close them by identifying when one curve ends
-            # but it is not where the next curve starts.
-            # It is more efficient to temporarily create a list
-            # of points and add them one at a time, then turn them
-            # into a numpy array at the end, rather than creating
-            # new numpy arrays every time a point or fixing line
-            # is added (which is O(n^2) for numpy arrays).
-            closed_curve_points: list[Point3D] = []
-            # OpenGL has points be part of quadratic Bezier curves;
-            # Cairo uses cubic Bezier curves.
-            if nppc == 3:  # RendererType.OPENGL
-
-                def add_line_to(end: Point3D) -> None:
-                    nonlocal closed_curve_points
-                    start = closed_curve_points[-1]
-                    closed_curve_points += [
-                        start,
-                        (start + end) / 2,
-                        end,
-                    ]
-
-            else:  # RendererType.CAIRO
-
-                def add_line_to(end: Point3D) -> None:
-                    nonlocal closed_curve_points
-                    start = closed_curve_points[-1]
-                    closed_curve_points += [
-                        start,
-                        (start + start + end) / 3,
-                        (start + end + end) / 3,
-                        end,
-                    ]
-
-            for index, point in enumerate(points):
-                closed_curve_points.append(point)
-                if (
-                    index != len(points) - 1
-                    and (index + 1) % nppc == 0
-                    and any(point != points[index + 1])
-                ):
-                    # Add straight line from last point on this curve to the
-                    # start point on the next curve. We represent the line
-                    # as a cubic bezier curve where the two control points
-                    # are half-way between the start and stop point.
-                    add_line_to(curve_start)
-                    curve_start = points[index + 1]
-            # Make sure last curve is closed
-            add_line_to(curve_start)
-            each.points = np.array(closed_curve_points, ndmin=2)
         # anti-aliasing
         if height is None and width is None:
             self.scale(TEXT_MOB_SCALE_FACTOR)
@@ -836,7 +905,7 @@ class Text(SVGMobject):
         return self
 
 
-class MarkupText(SVGMobject):
+class MarkupText(_PangoSVGMobject):
     r"""Display (non-LaTeX) text rendered using `Pango <https://pango.org/>`_.
 
     Text objects behave like a :class:`.VGroup`-like iterable of all characters
@@ -1226,62 +1295,6 @@ class MarkupText(SVGMobject):
         self.chars = self.get_group_class()(*self.submobjects)
         self.text = text_without_tabs.replace(" ", "").replace("\n", "")
 
-        nppc = self.n_points_per_curve
-        for each in self:
-            if len(each.points) == 0:
-                continue
-            points = each.points
-            curve_start = points[0]
-            assert len(curve_start) == self.dim, curve_start
-            # Some of the glyphs in this text might not be closed,
-            # so we close them by identifying when one curve ends
-            # but it is not where the next curve starts.
-            # It is more efficient to temporarily create a list
-            # of points and add them one at a time, then turn them
-            # into a numpy array at the end, rather than creating
-            # new numpy arrays every time a point or fixing line
-            # is added (which is O(n^2) for numpy arrays).
-            closed_curve_points: list[Point3D] = []
-            # OpenGL has points be part of quadratic Bezier curves;
-            # Cairo uses cubic Bezier curves.
-            if nppc == 3:  # RendererType.OPENGL
-
-                def add_line_to(end: Point3D) -> None:
-                    nonlocal closed_curve_points
-                    start = closed_curve_points[-1]
-                    closed_curve_points += [
-                        start,
-                        (start + end) / 2,
-                        end,
-                    ]
-
-            else:  # RendererType.CAIRO
-
-                def add_line_to(end: Point3D) -> None:
-                    nonlocal closed_curve_points
-                    start = closed_curve_points[-1]
-                    closed_curve_points += [
-                        start,
-                        (start + start + end) / 3,
-                        (start + end + end) / 3,
-                        end,
-                    ]
-
-            for index, point in enumerate(points):
-                closed_curve_points.append(point)
-                if (
-                    index != len(points) - 1
-                    and (index + 1) % nppc == 0
-                    and any(point != points[index + 1])
-                ):
-                    # Add straight line from last point on this curve to the
-                    # start point on the next curve.
-                    add_line_to(curve_start)
-                    curve_start = points[index + 1]
-            # Make sure last curve is closed
-            add_line_to(curve_start)
-            each.points = np.array(closed_curve_points, ndmin=2)
-
         if self.gradient:
             self.set_color_by_gradient(*self.gradient)
         for col in colormap:
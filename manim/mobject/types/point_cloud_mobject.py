@@ -25,6 +25,7 @@ from ...utils.color import (
     color_to_rgba,
     rgba_to_color,
 )
+from ...utils.config_ops import _CopyOnWriteArray
 from ...utils.iterables import stretch_array_to_length
 
 __all__ = ["PMobject", "Mobject1D", "Mobject2D", "PGroup", "PointCloudDot", "Point"]
@@ -73,6 +74,9 @@ class PMobject(Mobject, metaclass=ConvertToOpenGL):
 
     """
 
+    # Shared with the copies of the mobject until either accesses it.
+    rgbas: _CopyOnWriteArray[FloatRGBA_Array] = _CopyOnWriteArray()
+
     def __init__(self, stroke_width: int = DEFAULT_STROKE_WIDTH, **kwargs: Any) -> None:
         self.stroke_width = stroke_width
         super().__init__(**kwargs)
@@ -14,7 +14,7 @@ __all__ = [
 import itertools as it
 import sys
 from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import numpy as np
 from PIL.Image import Image
@@ -38,6 +38,7 @@ from manim.utils.bezier import (
     proportions_along_bezier_curve_for_point,
 )
 from manim.utils.color import BLACK, WHITE, ManimColor, ParsableManimColor
+from manim.utils.config_ops import _CopyOnWriteArray
 from manim.utils.iterables import (
     make_even,
     resize_array,
@@ -103,6 +104,13 @@ class VMobject(Mobject):
     """
 
     sheen_factor = 0.0
+    # Shared with the copies of the mobject until either accesses them.
+    fill_rgbas: _CopyOnWriteArray[FloatRGBA_Array] = _CopyOnWriteArray()
+    stroke_rgbas: _CopyOnWriteArray[FloatRGBA_Array] = _CopyOnWriteArray()
+    background_stroke_rgbas: _CopyOnWriteArray[FloatRGBA_Array] = _CopyOnWriteArray()
+    # The sample count, the points and the result of the last
+    # get_cumulative_curve_lengths call.
+    _arc_length_table: tuple[int, Point3D_Array, npt.NDArray[ManimFloat]] | None = None
 
     def __init__(
         self,
@@ -1448,9 +1456,57 @@ class VMobject(Mobject):
         length : :class:`float`
             The length of the nth curve.
         """
-        _, length = self.get_nth_curve_function_with_length(n, sample_points)
+        cumulative_lengths = self.get_cumulative_curve_lengths(sample_points)
+        return cumulative_lengths[n + 1] - cumulative_lengths[n]
 
-        return length
+    def get_cumulative_curve_lengths(
+        self, sample_points: int | None = None
+    ) -> npt.NDArray[ManimFloat]:
+        """Returns the (approximate) length of the path up to the end of every curve.
+
+        The lengths of all curves are computed at once, by sampling every curve
+        at ``sample_points`` values of ``t`` like
+        :meth:`get_nth_curve_length_pieces`. The table is cached until the points
+        of the :class:`VMobject` change.
+
+        Parameters
+        ----------
+        sample_points
+            The number of points to sample on every curve to find its length.
+
+        Returns
+        -------
+        npt.NDArray[ManimFloat]
+            An array of ``get_num_curves() + 1`` lengths, starting with ``0``.
+        """
+        if sample_points is None:
+            sample_points = 10
+        cached = self._arc_length_table
+        if (
+            cached is not None
+            and cached[0] == sample_points
+            and np.array_equal(cached[1], self.points)
+        ):
+            return cached[2]
+
+        nppcc = self.n_points_per_cubic_curve
+        num_curves = self.get_num_curves()
+        # Shape (nppcc, num_curves, 3), evaluated for all curves at once by bezier.
+        control_points = (
+            self.points[: nppcc * num_curves]
+            .reshape(num_curves, nppcc, 3)
+            .swapaxes(0, 1)
+        )
+        curves = bezier(control_points)
+        # Shape (num_curves, sample_points, 3).
+        samples = np.stack(
+            [curves(t) for t in np.linspace(0, 1, sample_points)], axis=1
+        )
+        lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+        cumulative_lengths = np.concatenate([[0.0], np.cumsum(lengths)])
+
+        self._arc_length_table = (sample_points, self.points.copy(), cumulative_lengths)
+        return cumulative_lengths
 
     def get_nth_curve_function_with_length(
         self,
@@ -1525,18 +1581,32 @@ class VMobject(Mobject):
         for n in range(num_curves):
             yield self.get_nth_curve_function_with_length(n, **kwargs)
 
-    def point_from_proportion(self, alpha: float) -> Point3D:
+    @overload
+    def point_from_proportion(self, alpha: float) -> Point3D: ...
+
+    @overload
+    def point_from_proportion(
+        self, alpha: npt.NDArray[ManimFloat]
+    ) -> Point3D_Array: ...
+
+    def point_from_proportion(
+        self, alpha: float | npt.NDArray[ManimFloat]
+    ) -> Point3D | Point3D_Array:
         """Gets the point at a proportion along the path of the :class:`VMobject`.
 
+        The curve is looked up in the table of :meth:`get_cumulative_curve_lengths`.
+
         Parameters
         ----------
         alpha
-            The proportion along the the path of the :class:`VMobject`.
+            The proportion along the the path of the :class:`VMobject`, or an
+            array of proportions.
 
         Returns
         -------
         :class:`numpy.ndarray`
-            The point on the :class:`VMobject`.
+            The point on the :class:`VMobject`, or an array with the point of
+            every proportion.
 
         Raises
         ------
@@ -1561,32 +1631,40 @@ class VMobject(Mobject):
                                 line.point_from_proportion(proportion)
                         ))
         """
-        if alpha < 0 or alpha > 1:
+        alphas = np.asarray(alpha, dtype=float)
+        if np.any((alphas < 0) | (alphas > 1)):
             raise ValueError(f"Alpha {alpha} not between 0 and 1.")
 
         self.throw_error_if_no_points()
-        if alpha == 1:
+        if alphas.ndim == 0 and alpha == 1:
             return self.points[-1]
 
-        curves_and_lengths = tuple(self.get_curve_functions_with_lengths())
-
-        target_length = alpha * sum(length for _, length in curves_and_lengths)
-        current_length = 0
-
-        for curve, length in curves_and_lengths:
-            if current_length + length >= target_length:
-                if length != 0:
-                    residue = (target_length - current_length) / length
-                else:
-                    residue = 0
-
-                return curve(residue)
-
-            current_length += length
-        raise Exception(
-            "Not sure how you reached here, please file a bug report at https://github.com/ManimCommunity/manim/issues/new/choose"
+        cumulative_lengths = self.get_cumulative_curve_lengths()
+        if len(cumulative_lengths) == 1:
+            raise Exception(
+                "Not sure how you reached here, please file a bug report at https://github.com/ManimCommunity/manim/issues/new/choose"
+            )
+        target_lengths = np.atleast_1d(alphas) * cumulative_lengths[-1]
+        # The first curve ending at or after the target length.
+        indices = np.searchsorted(cumulative_lengths[1:], target_lengths)
+        indices = np.minimum(indices, len(cumulative_lengths) - 2)
+        start_lengths = cumulative_lengths[indices]
+        lengths = cumulative_lengths[indices + 1] - start_lengths
+        residues = np.divide(
+            target_lengths - start_lengths,
+            lengths,
+            out=np.zeros_like(lengths),
+            where=lengths != 0,
         )
 
+        nppcc = self.n_points_per_cubic_curve
+        curve_points = self.points[nppcc * indices[:, None] + np.arange(nppcc)]
+        points = bezier(curve_points.swapaxes(0, 1))(residues[:, None])
+        points[np.atleast_1d(alphas) == 1] = self.points[-1]
+        if alphas.ndim == 0:
+            return points[0]
+        return points
+
     def proportion_from_point(
         self,
         point: Point3DLike,
@@ -1621,25 +1699,37 @@ class VMobject(Mobject):
         # Then, divide ``target_length`` by the total arc length of the shape to get
         # the proportion along the ``VMobject`` the point is at.
 
+        cumulative_lengths = self.get_cumulative_curve_lengths()
+        nppcc = self.n_points_per_cubic_curve
         num_curves = self.get_num_curves()
-        total_length = self.get_arc_length()
-        target_length = 0
-        for n in range(num_curves):
-            control_points = self.get_nth_curve_points(n)
-            length = self.get_nth_curve_length(n)
+        curves = self.points[: nppcc * num_curves].reshape(num_curves, nppcc, 3)
+        # A curve lies within the bounding box of its control points, so only
+        # the curves whose box contains the point are solved for it.
+        margin = 1e-5
+        coords = np.asarray(point)
+        candidates = np.flatnonzero(
+            np.all(
+                (curves.min(axis=1) - margin <= coords)
+                & (coords <= curves.max(axis=1) + margin),
+                axis=1,
+            )
+        )
+        for n in candidates:
             proportions_along_bezier = proportions_along_bezier_curve_for_point(
                 point,
-                control_points,
+                curves[n],
             )
             if len(proportions_along_bezier) > 0:
                 proportion_along_nth_curve = max(proportions_along_bezier)
-                target_length += length * proportion_along_nth_curve
+                length = cumulative_lengths[n + 1] - cumulative_lengths[n]
+                target_length = (
+                    cumulative_lengths[n] + length * proportion_along_nth_curve
+                )
                 break
-            target_length += length
         else:
             raise ValueError(f"Point {point} does not lie on this curve.")
 
-        alpha = target_length / total_length
+        alpha = target_length / cumulative_lengths[-1]
 
         return alpha
 
@@ -1712,12 +1802,7 @@ class VMobject(Mobject):
         float
             The length of the :class:`VMobject`.
         """
-        return sum(
-            length
-            for _, length in self.get_curve_functions_with_lengths(
-                sample_points=sample_points_per_curve,
-            )
-        )
+        return self.get_cumulative_curve_lengths(sample_points_per_curve)[-1]
 
     # Alignment
     def align_points(self, vmobject: VMobject) -> Self:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 __all__ = ["ValueTracker", "ComplexValueTracker"]
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -17,6 +19,37 @@ if TYPE_CHECKING:
 
     from manim.typing import PathFuncType
 
+# The value trackers read by the functions being evaluated, see
+# :func:`record_value_tracker_reads`.
+_tracker_reads: list[dict[int, ValueTracker]] = []
+
+
+@contextmanager
+def record_value_tracker_reads() -> Iterator[dict[int, ValueTracker]]:
+    """Record the value trackers whose value is read within a block.
+
+    Yields
+    ------
+    dict[int, ValueTracker]
+        Filled with the trackers whose value was read, keyed by their id.
+
+    Examples
+    --------
+    ::
+
+        >>> a, b = ValueTracker(1), ValueTracker(2)
+        >>> with record_value_tracker_reads() as reads:
+        ...     _ = a.get_value() + 1
+        >>> list(reads.values()) == [a]
+        True
+    """
+    reads: dict[int, ValueTracker] = {}
+    _tracker_reads.append(reads)
+    try:
+        yield reads
+    finally:
+        _tracker_reads.remove(reads)
+
 
 class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
     """A mobject that can be used for tracking (real-valued) parameters.
@@ -82,6 +115,8 @@ class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
 
     def get_value(self) -> float:
         """Get the current value of this ValueTracker."""
+        for reads in _tracker_reads:
+            reads[id(self)] = self
         value: float = self.points[0, 0]
         return value
 
@@ -233,6 +268,8 @@ class ComplexValueTracker(ValueTracker):
 
     def get_value(self) -> complex:  # type: ignore [override]
         """Get the current value of this ComplexValueTracker as a complex number."""
+        for reads in _tracker_reads:
+            reads[id(self)] = self
         return complex(*self.points[0, :2])
 
     def set_value(self, value: complex | float) -> Self:
@@ -12,7 +12,7 @@ import itertools as it
 import random
 from collections.abc import Callable, Iterable, Sequence
 from math import ceil, floor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from PIL import Image
@@ -25,7 +25,7 @@ from .. import config
 from ..animation.composition import AnimationGroup, Succession
 from ..animation.creation import Create
 from ..animation.indication import ShowPassingFlash
-from ..constants import OUT, RIGHT, UP, RendererType
+from ..constants import RIGHT, RendererType
 from ..mobject.mobject import Mobject
 from ..mobject.types.vectorized_mobject import VGroup
 from ..mobject.utils import get_vectorized_mobject_class
@@ -44,6 +44,8 @@ from ..utils.rate_functions import ease_out_sine, linear
 from ..utils.simple_functions import sigmoid
 
 if TYPE_CHECKING:
+    from typing import Self
+
     from manim.typing import (
         FloatRGB,
         FloatRGB_Array,
@@ -55,6 +57,52 @@ if TYPE_CHECKING:
 DEFAULT_SCALAR_FIELD_COLORS: list = [BLUE_E, GREEN, YELLOW, RED]
 
 
+def _rows_function(
+    func: Callable[[np.ndarray], Any], values: np.ndarray
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Return a function applying ``func`` to every row of an array.
+
+    ``func`` is called once on the whole array if it supports arrays of rows,
+    which is checked on a few rows of ``values`` against calling it on single
+    rows, unless it only supports arrays. Otherwise, it is called once per
+    row.
+    """
+
+    def map_rows(rows: np.ndarray) -> np.ndarray:
+        return np.array([func(row) for row in rows], dtype=float)
+
+    def call_on_rows(rows: np.ndarray) -> np.ndarray:
+        return np.asarray(func(rows), dtype=float)
+
+    if not len(values):
+        return map_rows
+    try:
+        with np.errstate(all="ignore"):
+            result = call_on_rows(values)
+    except Exception:
+        return map_rows
+    if result.shape[:1] != (len(values),):
+        return map_rows
+    samples = np.unique(np.linspace(0, len(values) - 1, 8).astype(int))
+    try:
+        expected = map_rows(values[samples])
+    except Exception:
+        # ``func`` only supports arrays of rows.
+        return call_on_rows
+    if result.shape[1:] == expected.shape[1:] and np.allclose(
+        result[samples], expected, equal_nan=True
+    ):
+        return call_on_rows
+    return map_rows
+
+
+def _map_rows(func: Callable[[np.ndarray], Any], values: np.ndarray) -> np.ndarray:
+    """Apply ``func`` to every row of ``values``, see :func:`_rows_function`."""
+    if not len(values):
+        return np.zeros(0)
+    return _rows_function(func, values)(values)
+
+
 class VectorField(VGroup):
     """A vector field.
 
@@ -98,10 +146,12 @@ class VectorField(VGroup):
             if color_scheme is None:
 
                 def color_scheme(vec: Vector3D) -> float:
-                    return np.linalg.norm(vec)
+                    return np.linalg.norm(vec, axis=-1)
 
             self.color_scheme = color_scheme  # TODO maybe other default for direction?
             self.rgbs: FloatRGB_Array = np.array(list(map(color_to_rgb, colors)))
+            self.min_color_scheme_value = min_color_scheme_value
+            self.max_color_scheme_value = max_color_scheme_value
 
             def pos_to_rgb(pos: Point3D) -> FloatRGB:
                 vec = self.func(pos)
@@ -419,9 +469,19 @@ class VectorField(VGroup):
         y_array.repeat(pw, axis=1)  # TODO why not y_array = y_array.repeat(...)?
         points_array[:, :, 0] = x_array
         points_array[:, :, 1] = y_array
-        rgbs = np.apply_along_axis(self.pos_to_rgb, 2, points_array)
+        points = points_array.reshape(-1, 3)
+        values = _map_rows(self.color_scheme, _map_rows(self.func, points))
+        rgbs = self._values_to_rgbas(values)[:, :3].reshape(points_array.shape)
         return Image.fromarray((rgbs * 255).astype("uint8"))
 
+    def _values_to_rgbas(self, values: np.ndarray) -> FloatRGBA_Array:
+        """The colors of the values of the color scheme, like :attr:`pos_to_rgb`."""
+        return self.get_vectorized_rgba_gradient_function(
+            self.min_color_scheme_value,
+            self.max_color_scheme_value,
+            [rgb_to_color(rgb) for rgb in self.rgbs],
+        )(values)
+
     def get_vectorized_rgba_gradient_function(
         self,
         start: float,
@@ -568,18 +628,19 @@ class ArrowVectorField(VectorField):
         vector_config: dict | None = None,
         **kwargs,
     ):
-        self.x_range = x_range or [
+        # The ranges are copied, as they are extended below.
+        self.x_range = list(x_range or []) or [
             floor(-config["frame_width"] / 2),
             ceil(config["frame_width"] / 2),
         ]
-        self.y_range = y_range or [
+        self.y_range = list(y_range or []) or [
             floor(-config["frame_height"] / 2),
             ceil(config["frame_height"] / 2),
         ]
         self.ranges = [self.x_range, self.y_range]
 
         if three_dimensions or z_range:
-            self.z_range = z_range or self.y_range.copy()
+            self.z_range = list(z_range or self.y_range)
             self.ranges += [self.z_range]
         else:
             self.ranges += [[0, 0]]
@@ -611,12 +672,8 @@ class ArrowVectorField(VectorField):
         x_range = np.arange(*self.x_range)
         y_range = np.arange(*self.y_range)
         z_range = np.arange(*self.z_range)
-        self.add(
-            *[
-                self.get_vector(x * RIGHT + y * UP + z * OUT)
-                for x, y, z in it.product(x_range, y_range, z_range)
-            ]
-        )
+        points = np.array(list(it.product(x_range, y_range, z_range)), dtype=float)
+        self.add(*self.get_vectors(points.reshape(-1, 3)))
         self.set_opacity(self.opacity)
 
     def get_vector(self, point: np.ndarray):
@@ -644,6 +701,174 @@ class ArrowVectorField(VectorField):
             vect.set_color(self.pos_to_color(point))
         return vect
 
+    def get_vectors(self, points: np.ndarray) -> list[Vector]:
+        """Creates the vectors rooted in each of the given points.
+
+        The result is the same as calling :meth:`get_vector` for every point,
+        but :attr:`func`, :attr:`length_func` and the color scheme are
+        evaluated on all points at once when they support arrays, and the
+        vectors lying in the xy plane are copies of a template vector, whose
+        points are computed at once for all vectors.
+
+        Parameters
+        ----------
+        points
+            The root points of the vectors, as an array of shape ``(n, 3)``.
+        """
+        return self._place_vectors(np.asarray(points, dtype=float))
+
+    def update_vectors(self) -> Self:
+        """Recomputes the vectors in place, after a change of :attr:`func`.
+
+        The vectors keep their root points and their opacity, which makes
+        animating the function of the field with an updater affordable.
+
+        Examples
+        --------
+        ::
+
+            vector_field = ArrowVectorField(lambda pos: pos)
+            tracker = ValueTracker(0)
+            vector_field.func = lambda pos: rotate_vector(pos, tracker.get_value())
+            vector_field.add_updater(lambda mob: mob.update_vectors())
+        """
+        vectors = self.submobjects
+        if vectors:
+            points = np.array([vector.get_start() for vector in vectors])
+            self._place_vectors(points, vectors)
+        return self
+
+    def _place_vectors(
+        self, points: np.ndarray, vectors: list[Vector] | None = None
+    ) -> list[Vector]:
+        """Compute the vectors rooted in ``points``, either as new vectors or
+        by changing ``vectors`` in place.
+        """
+        if not len(points):
+            return []
+        outputs = _map_rows(self.func, points)
+        if not self.single_color:
+            color_values = _map_rows(self.color_scheme, outputs)
+            rgbas = self._values_to_rgbas(color_values)
+        # Like Vector, accept functions returning vectors in the xy plane.
+        if outputs.shape[1] < 3:
+            outputs = np.pad(outputs, ((0, 0), (0, 3 - outputs.shape[1])))
+        norms = np.linalg.norm(outputs, axis=1)
+        nonzero = norms != 0
+        lengths = np.zeros_like(norms)
+        lengths[nonzero] = _map_rows(self.length_func, norms[nonzero])
+
+        # Vectors lying in the xy plane are rotated copies of a vector
+        # pointing to the right, whose points depend linearly on the length
+        # as long as the tip keeps growing with it, or as long as it doesn't.
+        threshold, templates = self._get_vector_templates()
+        regimes = (lengths >= threshold).astype(int)
+        stamped = (lengths > 0) & (outputs[:, 2] == 0)
+        stamped &= np.array([template is not None for template in templates])[regimes]
+        buffers = {}
+        for regime, template in enumerate(templates):
+            rows = np.flatnonzero(stamped & (regimes == regime))
+            if template is None or not len(rows):
+                continue
+            base_length, base_points, slope, _, _ = template
+            template_points = (
+                base_points + (lengths[rows] - base_length)[:, None, None] * slope
+            )
+            angles = np.arctan2(outputs[rows, 1], outputs[rows, 0])
+            cos, sin = np.cos(angles)[:, None], np.sin(angles)[:, None]
+            stamp = np.empty_like(template_points)
+            stamp[..., 0] = (
+                cos * template_points[..., 0] - sin * template_points[..., 1]
+            )
+            stamp[..., 1] = (
+                sin * template_points[..., 0] + cos * template_points[..., 1]
+            )
+            stamp[..., 2] = template_points[..., 2]
+            stamp += points[rows, None, :]
+            buffers.update(zip(rows, stamp, strict=True))
+
+        result = []
+        for i, point in enumerate(points):
+            vect = None if vectors is None else vectors[i]
+            if i not in buffers:
+                new_vect = self.get_vector(point)
+                if vect is None:
+                    result.append(new_vect)
+                else:
+                    result.append(vect.become(new_vect).set_opacity(self.opacity))
+                continue
+            _, _, _, sizes, template_vector = templates[regimes[i]]
+            if vect is None:
+                vect = template_vector.copy()
+            members = vect.family_members_with_points()
+            if [len(member.points) for member in members] != sizes:
+                vect.become(template_vector)
+                members = vect.family_members_with_points()
+            stamp = buffers[i]
+            start = 0
+            for member, size in zip(members, sizes, strict=True):
+                member.points = stamp[start : start + size]
+                start += size
+            vect._set_stroke_width_from_length()
+            if self.single_color:
+                vect.set_color(self.color)
+            else:
+                vect.set_color(rgb_to_color(rgbas[i, :3]))
+            result.append(vect)
+        return result
+
+    def _get_vector_templates(self) -> tuple[float, list[tuple | None]]:
+        """The vectors pointing to the right which the vectors in the xy plane
+        are copied from.
+
+        Returns
+        -------
+        tuple[float, list[tuple | None]]
+            The length from which the tip of the vectors stops growing, and
+            a template for the shorter and for the longer vectors. Each holds
+            the length and the points of a vector, the derivative of its
+            points along its length, the number of points of each of its
+            family members and the vector itself. A template is ``None`` if
+            its points don't depend linearly on the length, in which case the
+            vectors are created one by one.
+        """
+        key = repr(self.vector_config)
+        cached = getattr(self, "_vector_templates", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        vector = Vector(RIGHT, **self.vector_config)
+        ratio = vector.max_tip_length_to_length_ratio
+        threshold = vector.tip_length / ratio if ratio > 0 else np.inf
+        if np.isinf(threshold):
+            sample_lengths = [(1, 2, 3), ()]
+        else:
+            sample_lengths = [
+                (threshold / 4, threshold / 2, 3 * threshold / 4),
+                (threshold, 2 * threshold, 3 * threshold),
+            ]
+        templates = []
+        for lengths in sample_lengths:
+            samples = [
+                Vector(length * RIGHT, **self.vector_config) for length in lengths
+            ]
+            families = [sample.family_members_with_points() for sample in samples]
+            sizes = [[len(member.points) for member in family] for family in families]
+            if not samples or any(size != sizes[0] for size in sizes):
+                templates.append(None)
+                continue
+            p1, p2, p3 = (
+                np.concatenate([member.points for member in family])
+                for family in families
+            )
+            l1, l2, l3 = lengths
+            slope = (p2 - p1) / (l2 - l1)
+            if not np.allclose(p1 + (l3 - l1) * slope, p3, atol=1e-9):
+                templates.append(None)
+                continue
+            templates.append((l1, p1, slope, sizes[0], samples[0]))
+        self._vector_templates = (key, (threshold, templates))
+        return threshold, templates
+
 
 class StreamLines(VectorField):
     """StreamLines represent the flow of a :class:`VectorField` using the trace of moving agents.
@@ -687,6 +912,10 @@ class StreamLines(VectorField):
         The maximum number of anchors per line. Lines with more anchors get reduced in complexity, not in length.
     padding
         The distance agents can move out of the generation area before being terminated.
+    runge_kutta
+        Whether the agents move with steps of the fourth-order Runge-Kutta method, as
+        in :meth:`~.VectorField.nudge`, instead of Euler steps. This gives more accurate
+        trajectories for the same ``dt``, at the cost of four evaluations of ``func`` per step.
     stroke_width
         The stroke with of the stream lines.
     opacity
@@ -744,22 +973,24 @@ class StreamLines(VectorField):
         max_anchors_per_line=100,
         padding=3,
         # Determining stream line appearance:
+        runge_kutta: bool = False,
         stroke_width=1,
         opacity=1,
         **kwargs,
     ):
-        self.x_range = x_range or [
+        # The ranges are copied, as they are extended below.
+        self.x_range = list(x_range or []) or [
             floor(-config["frame_width"] / 2),
             ceil(config["frame_width"] / 2),
         ]
-        self.y_range = y_range or [
+        self.y_range = list(y_range or []) or [
             floor(-config["frame_height"] / 2),
             ceil(config["frame_height"] / 2),
         ]
         self.ranges = [self.x_range, self.y_range]
 
         if three_dimensions or z_range:
-            self.z_range = z_range or self.y_range.copy()
+            self.z_range = list(z_range or self.y_range)
             self.ranges += [self.z_range]
         else:
             self.ranges += [[0, 0]]
@@ -788,32 +1019,24 @@ class StreamLines(VectorField):
         self.virtual_time = virtual_time
         self.max_anchors_per_line = max_anchors_per_line
         self.padding = padding
+        self.runge_kutta = runge_kutta
         self.stroke_width = stroke_width
 
         half_noise = self.noise_factor / 2
         rng = np.random.default_rng(0)
-        start_points = np.array(
-            [
-                (x - half_noise) * RIGHT
-                + (y - half_noise) * UP
-                + (z - half_noise) * OUT
-                + self.noise_factor * rng.random(3)
-                for n in range(self.n_repeats)
-                for x in np.arange(*self.x_range)
-                for y in np.arange(*self.y_range)
-                for z in np.arange(*self.z_range)
-            ],
-        )
-
-        def outside_box(p):
-            return (
-                p[0] < self.x_range[0] - self.padding
-                or p[0] > self.x_range[1] + self.padding - self.x_range[2]
-                or p[1] < self.y_range[0] - self.padding
-                or p[1] > self.y_range[1] + self.padding - self.y_range[2]
-                or p[2] < self.z_range[0] - self.padding
-                or p[2] > self.z_range[1] + self.padding - self.z_range[2]
-            )
+        grid = np.array(
+            list(
+                it.product(
+                    np.arange(*self.x_range),
+                    np.arange(*self.y_range),
+                    np.arange(*self.z_range),
+                )
+            ),
+            dtype=float,
+        ).reshape(-1, 3)
+        grid = np.tile(grid, (self.n_repeats, 1))
+        start_points = (grid - half_noise) + self.noise_factor * rng.random(grid.shape)
+        func_on_rows = _rows_function(self.func, start_points)
 
         max_steps = ceil(virtual_time / dt) + 1
         if not self.single_color:
@@ -824,19 +1047,11 @@ class StreamLines(VectorField):
                     max_color_scheme_value,
                     colors,
                 )
-        for point in start_points:
-            points = [point]
-            for _ in range(max_steps):
-                last_point = points[-1]
-                new_point = last_point + dt * func(last_point)
-                if outside_box(new_point):
-                    break
-                points.append(new_point)
-            step = max_steps
-            if not step:
-                continue
+        for points in self._get_stream_line_points(
+            func_on_rows, start_points, dt, max_steps
+        ):
             line = get_vectorized_mobject_class()()
-            line.duration = step * dt
+            line.duration = max_steps * dt
             step = max(1, int(len(points) / self.max_anchors_per_line))
             line.set_points_smoothly(points[::step])
             if self.single_color:
@@ -847,9 +1062,7 @@ class StreamLines(VectorField):
                 if config.renderer == RendererType.OPENGL:
                     # scaled for compatibility with cairo
                     line.set_stroke(width=self.stroke_width / 4.0)
-                    norms = np.array(
-                        [np.linalg.norm(self.func(point)) for point in line.points],
-                    )
+                    norms = np.linalg.norm(func_on_rows(line.points), axis=1)
                     line.set_rgba_array_direct(
                         self.values_to_rgbas(norms, opacity),
                         name="stroke_rgba",
@@ -865,6 +1078,62 @@ class StreamLines(VectorField):
             self.add(line)
         self.stream_lines = [*self.submobjects]
 
+    def _get_stream_line_points(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        start_points: np.ndarray,
+        dt: float,
+        max_steps: int,
+    ) -> Iterable[np.ndarray]:
+        """Move the agents along the vector field, all at once.
+
+        Parameters
+        ----------
+        func
+            The function of the vector field, applied to arrays of points.
+        start_points
+            The starting points of the agents, as an array of shape ``(n, 3)``.
+        dt
+            The duration of a step.
+        max_steps
+            The number of steps after which the agents stop.
+
+        Yields
+        ------
+        np.ndarray
+            The points an agent went through until it left the padded box of
+            the vector field, for every agent.
+        """
+        lower = np.array([r[0] - self.padding for r in self.ranges])
+        upper = np.array([r[1] + self.padding - r[2] for r in self.ranges])
+        # The trajectories are held in one array per batch of agents, whose
+        # size is bounded.
+        batch_size = max(1, 2**21 // (max_steps + 1))
+        for batch_start in range(0, len(start_points), batch_size):
+            batch = start_points[batch_start : batch_start + batch_size]
+            trajectories = np.empty((max_steps + 1, *batch.shape))
+            trajectories[0] = batch
+            lengths = np.ones(len(batch), dtype=int)
+            active = np.arange(len(batch))
+            for step in range(1, max_steps + 1):
+                points = trajectories[step - 1, active]
+                if self.runge_kutta:
+                    k_1 = func(points)
+                    k_2 = func(points + dt * (k_1 * 0.5))
+                    k_3 = func(points + dt * (k_2 * 0.5))
+                    k_4 = func(points + dt * k_3)
+                    new_points = points + dt / 6.0 * (k_1 + 2.0 * k_2 + 2.0 * k_3 + k_4)
+                else:
+                    new_points = points + dt * func(points)
+                inside = ((new_points >= lower) & (new_points <= upper)).all(axis=1)
+                active = active[inside]
+                if not len(active):
+                    break
+                trajectories[step, active] = new_points[inside]
+                lengths[active] += 1
+            for i, length in enumerate(lengths):
+                yield trajectories[:length, i]
+
     def create(
         self,
         lag_ratio: float | None = None,
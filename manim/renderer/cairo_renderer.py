@@ -12,7 +12,11 @@ from ..camera.camera import Camera
 from ..mobject.mobject import Mobject, _AnimationBuilder
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.exceptions import EndSceneEarlyException
+from ..utils.file_ops import write_to_movie
 from ..utils.iterables import list_update
+from ..utils.profiler import profiler
+from .layer_compositor import LayerCompositor
+from .parallel_plays import can_render_in_workers, render_plays_in_parallel
 
 if TYPE_CHECKING:
     from manim.animation.animation import Animation
@@ -40,6 +44,7 @@ class CairoRenderer:
         file_writer_class: type[SceneFileWriter] = SceneFileWriter,
         camera_class: type[Camera] | None = None,
         skip_animations: bool = False,
+        plays_to_render: set[int] | None = None,
         **kwargs: Any,
     ):
         # All of the following are set to EITHER the value passed via kwargs,
@@ -54,12 +59,38 @@ class CairoRenderer:
         self.num_plays = 0
         self.time = 0.0
         self.static_image: PixelArray | None = None
+        self.layer_compositor = (
+            LayerCompositor(self.camera)
+            if LayerCompositor.is_supported(self.camera)
+            else None
+        )
+        # Set in the worker processes of a parallel render: only these plays
+        # are rendered, all others are fast-forwarded.
+        self.plays_to_render = plays_to_render
+        # Maps the index of every play left for the worker processes to its
+        # run time, see :mod:`.parallel_plays`.
+        self.planned_plays: dict[int, float] = {}
+        self.plan_plays = False
 
     def init_scene(self, scene: Scene) -> None:
         self.file_writer: Any = self._file_writer_class(
             self,
             scene.__class__.__name__,
         )
+        self.plan_plays = (
+            config.parallel_plays > 1
+            and self.plays_to_render is None
+            and write_to_movie()
+            and not config.save_last_frame
+            and not config.dry_run
+        )
+        if self.plan_plays and not can_render_in_workers(type(scene)):
+            logger.warning(
+                "%(scene)s is not defined in the input file, so its animations "
+                "are rendered without worker processes.",
+                {"scene": type(scene).__name__},
+            )
+            self.plan_plays = False
 
     def play(
         self,
@@ -74,10 +105,14 @@ class CairoRenderer:
 
         scene.compile_animation_data(*args, **kwargs)
 
+        # Fast-forwarded plays only advance the state of the scene, without
+        # rasterizing even a single frame.
+        fast_forward = False
         if self.skip_animations:
             logger.debug(f"Skipping animation {self.num_plays}")
             hash_current_animation = None
             self.time += scene.duration
+            fast_forward = self.plays_to_render is not None
         else:
             if config["disable_caching"]:
                 logger.info("Caching disabled.")
@@ -97,6 +132,12 @@ class CairoRenderer:
                     )
                     self.skip_animations = True
                     self.time += scene.duration
+            if self.plan_plays and not self.skip_animations:
+                # The frames of this play are rendered later by a worker process.
+                self.planned_plays[self.num_plays] = scene.duration
+                self.skip_animations = True
+                self.time += scene.duration
+                fast_forward = True
         # adding None as a partial movie file will make file_writer ignore the latter.
         self.file_writer.add_partial_movie_file(hash_current_animation)
         self.animations_hashes.append(hash_current_animation)
@@ -108,17 +149,24 @@ class CairoRenderer:
         self.file_writer.begin_animation(not self.skip_animations)
         scene.begin_animations()
 
-        # Save a static image, to avoid rendering non moving objects.
-        self.save_static_frame_data(scene, scene.static_mobjects)
-
-        if scene.is_current_animation_frozen_frame():
-            self.update_frame(scene, mobjects=scene.moving_mobjects)
-            # self.duration stands for the total run time of all the animations.
-            # In this case, as there is only a wait, it will be the length of the wait.
-            self.freeze_current_frame(scene.duration)
+        if fast_forward:
+            if not scene.is_current_animation_frozen_frame():
+                scene.play_internal(skip_rendering=True)
         else:
-            scene.play_internal()
+            # Save a static image, to avoid rendering non moving objects.
+            self.save_static_frame_data(scene, scene.static_mobjects)
+
+            if scene.is_current_animation_frozen_frame():
+                self.update_frame(scene, mobjects=scene.moving_mobjects)
+                # self.duration stands for the total run time of all the animations.
+                # In this case, as there is only a wait, it will be the length of the wait.
+                self.freeze_current_frame(scene.duration)
+            else:
+                scene.play_internal()
         self.file_writer.end_animation(not self.skip_animations)
+        if self.num_plays in self.planned_plays:
+            # Behave like a rendered play until the next one, e.g. for add_sound().
+            self.skip_animations = False
 
         self.num_plays += 1
 
@@ -128,6 +176,7 @@ class CairoRenderer:
         mobjects: Iterable[Mobject] | None = None,
         include_submobjects: bool = True,
         ignore_skipping: bool = True,
+        composite_layers: bool = False,
         **kwargs: Any,
     ) -> None:
         """Update the frame.
@@ -143,6 +192,10 @@ class CairoRenderer:
 
         ignore_skipping
 
+        composite_layers
+            Whether to reuse the rasters of static layers drawn in the
+            previous frame, see :mod:`.layer_compositor`.
+
         **kwargs
         """
         if self.skip_animations and not ignore_skipping:
@@ -157,6 +210,14 @@ class CairoRenderer:
         else:
             self.camera.reset()
 
+        if (
+            composite_layers
+            and self.layer_compositor is not None
+            and include_submobjects
+            and not kwargs
+        ):
+            self.layer_compositor.capture_mobjects(scene, mobjects)
+            return
         kwargs["include_submobjects"] = include_submobjects
         self.camera.capture_mobjects(mobjects, **kwargs)
 
@@ -166,8 +227,11 @@ class CairoRenderer:
         time: float,
         moving_mobjects: Iterable[Mobject] | None = None,
     ) -> None:
-        self.update_frame(scene, moving_mobjects)
-        self.add_frame(self.get_frame())
+        with profiler.span("capture frame"):
+            self.update_frame(scene, moving_mobjects, composite_layers=True)
+        with profiler.span("write frame"):
+            # No copy needed: the file writer copies the frame into its ring buffer.
+            self.add_frame(self.camera.pixel_array)
 
     def get_frame(self) -> PixelArray:
         """Gets the current frame as NumPy array.
@@ -186,7 +250,8 @@ class CairoRenderer:
         Parameters
         ----------
         frame
-            The frame to add, as a pixel array.
+            The frame to add, as a pixel array. The file writer copies it
+            before returning, so this may be the camera's own pixel array.
         num_frames
             The number of times to add frame.
         """
@@ -206,7 +271,7 @@ class CairoRenderer:
         """
         dt = 1 / self.camera.frame_rate
         self.add_frame(
-            self.get_frame(),
+            self.camera.pixel_array,
             num_frames=int(duration / dt),
         )
 
@@ -267,8 +332,23 @@ class CairoRenderer:
         ):
             self.skip_animations = True
             raise EndSceneEarlyException()
+        if self.plays_to_render is not None:
+            if self.num_plays > max(self.plays_to_render, default=-1):
+                self.skip_animations = True
+                raise EndSceneEarlyException()
+            if self.num_plays not in self.plays_to_render:
+                self.skip_animations = True
 
     def scene_finished(self, scene: Scene) -> None:
+        if self.plays_to_render is not None:
+            # Worker of a parallel render, the parent process combines the files.
+            return
+        if self.planned_plays:
+            render_plays_in_parallel(self, scene.__class__.__name__, self.planned_plays)
+            self.planned_plays = {}
+        if self.layer_compositor is not None:
+            self.layer_compositor.reset()
+
         # If no animations in scene, render an image instead
         if self.num_plays:
             self.file_writer.finish()
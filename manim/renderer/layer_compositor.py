@@ -0,0 +1,187 @@
+"""Reuse the rasters of static layers across frames.
+
+Before every play, the :class:`.CairoRenderer` rasterizes the mobjects below
+the first moving mobject once into a static image. Everything above it is
+drawn again in every frame -- even mobjects which do not change at all, like
+the axes drawn on top of a curve updated by :func:`.always_redraw`, or the
+labels added after a :class:`.MoveAlongPath`.
+
+The :class:`LayerCompositor` splits the mobjects drawn in every frame into
+*layers*: consecutive runs, in drawing order, of either dynamic mobjects
+(the family of an animated mobject or of a mobject with updaters) or static
+ones. A static layer whose content did not change since the previous frame
+is rasterized once into a transparent buffer, which is then composited onto
+the following frames instead of drawing the layer again. Layers are
+identified by a digest of their mobjects and of the camera, so a layer which
+changes after all is simply drawn again. For the same reason, the rasters are
+kept from one play to the next, and only dropped at the end of the scene.
+
+"""
+
+from __future__ import annotations
+
+import itertools as it
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import cairo
+import numpy as np
+
+from ..camera.camera import Camera
+from ..camera.moving_camera import MovingCamera
+from ..mobject.types.vectorized_mobject import VMobject
+from ..utils.hashing import _StructuralHasher
+from ..utils.profiler import profiler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from manim.mobject.mobject import Mobject
+    from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+    from manim.scene.scene import Scene
+
+    from ..typing import PixelArray
+
+__all__ = ["LayerCompositor"]
+
+
+class LayerCompositor:
+    """Draws the moving mobjects of a frame, reusing rasters of static layers.
+
+    Parameters
+    ----------
+    camera
+        The camera rasterizing the frames.
+
+    Attributes
+    ----------
+    max_cached_layers : int
+        The number of rasters kept. Every raster is as large as a frame.
+    min_layer_points : int
+        Layers with fewer points are cheaper to draw than to composite, so
+        they are always drawn.
+    """
+
+    max_cached_layers = 6
+    min_layer_points = 1000
+
+    def __init__(self, camera: Camera) -> None:
+        self.camera = camera
+        self.rasters: OrderedDict[str, tuple[PixelArray, cairo.ImageSurface]] = (
+            OrderedDict()
+        )
+        # Digests of the layers drawn in the previous frame. A layer is only
+        # rasterized once its digest was seen twice in a row, so that layers
+        # which change in every frame cost nothing but their digest.
+        self.previous_keys: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_supported(camera: Camera) -> bool:
+        """Whether the layers of ``camera`` can be rasterized separately."""
+        # Cameras which reorder or transform the mobjects while capturing
+        # them, like the ThreeDCamera, draw the whole frame at once.
+        camera_class = type(camera)
+        return (
+            camera_class.get_mobjects_to_display is Camera.get_mobjects_to_display
+            and camera_class.capture_mobjects
+            in (Camera.capture_mobjects, MovingCamera.capture_mobjects)
+        )
+
+    def reset(self) -> None:
+        """Drop all rasters, at the end of a scene."""
+        self.rasters.clear()
+        self.previous_keys = set()
+
+    def capture_mobjects(self, scene: Scene, mobjects: Iterable[Mobject]) -> None:
+        """Draw ``mobjects`` on the pixel array of the camera.
+
+        This is equivalent to ``camera.capture_mobjects(mobjects)``, except
+        that static layers drawn unchanged in the previous frame are
+        composited from their raster.
+
+        Parameters
+        ----------
+        scene
+            The scene, whose animations and updaters tell the dynamic
+            mobjects apart.
+        mobjects
+            The mobjects to draw, usually the moving mobjects of the scene.
+        """
+        camera = self.camera
+        displayed = camera.get_mobjects_to_display(mobjects)
+        dynamic = self._get_dynamic_ids(scene)
+        camera_key: str | None = None
+        keys: set[str] = set()
+
+        for is_static, group in it.groupby(
+            displayed, lambda mob: self._is_static(mob, dynamic)
+        ):
+            layer = list(group)
+            if (
+                is_static
+                and sum(len(mob.points) for mob in layer) >= self.min_layer_points
+            ):
+                if camera_key is None:
+                    camera_key = _StructuralHasher().hexdigest(camera)
+                key = camera_key + _StructuralHasher().hexdigest(layer)
+                keys.add(key)
+                if key in self.rasters:
+                    self.rasters.move_to_end(key)
+                    self.hits += 1
+                    self._composite(self.rasters[key][1])
+                    continue
+                self.misses += 1
+                if key in self.previous_keys:
+                    self._composite(self._rasterize(key, layer))
+                    continue
+            camera.capture_mobjects(layer, include_submobjects=False)
+        self.previous_keys = keys
+
+    def _get_dynamic_ids(self, scene: Scene) -> set[int]:
+        roots: list[Mobject | OpenGLMobject] = [
+            animation.mobject for animation in scene.animations or ()
+        ]
+        roots += [mob for mob in scene.get_mobject_family_members() if mob.updaters]
+        return {id(mob) for root in roots for mob in root.get_family()}
+
+    @staticmethod
+    def _is_static(mobject: Mobject, dynamic: set[int]) -> bool:
+        return (
+            id(mobject) not in dynamic
+            and isinstance(mobject, VMobject)
+            and mobject.get_background_image() is None
+        )
+
+    def _rasterize(self, key: str, layer: Sequence[Mobject]) -> cairo.ImageSurface:
+        camera = self.camera
+        frame = camera.pixel_array
+        raster = np.zeros_like(frame)
+        camera.pixel_array = raster
+        try:
+            with profiler.span("rasterize layer", "camera"):
+                camera.capture_mobjects(layer, include_submobjects=False)
+        finally:
+            camera.pixel_array = frame
+            # The cached context is keyed by the id of the raster, which may
+            # be reused by another array once the raster is evicted.
+            camera.pixel_array_to_cairo_context.pop(id(raster), None)
+
+        ph, pw = raster.shape[:2]
+        surface = cairo.ImageSurface.create_for_data(
+            raster.data, cairo.FORMAT_ARGB32, pw, ph
+        )
+        self.rasters[key] = (raster, surface)
+        while len(self.rasters) > self.max_cached_layers:
+            self.rasters.popitem(last=False)
+        return surface
+
+    def _composite(self, surface: cairo.ImageSurface) -> None:
+        ctx = self.camera.get_cairo_context(self.camera.pixel_array)
+        with profiler.span("composite layer", "camera"):
+            ctx.save()
+            ctx.identity_matrix()
+            ctx.set_source_surface(surface, 0, 0)
+            ctx.paint()
+            ctx.restore()
@@ -33,23 +33,28 @@ from ..utils.space_ops import (
     rotation_matrix_transpose,
     rotation_matrix_transpose_from_quaternion,
 )
-from .shader import Mesh, Shader
+from .shader import Shader, VertexBuffers
 from .vectorized_mobject_rendering import (
     render_opengl_vectorized_mobject_fill,
     render_opengl_vectorized_mobject_stroke,
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Self
 
     from manim.animation.animation import Animation
     from manim.mobject.mobject import Mobject
+    from manim.renderer.shader_wrapper import ShaderWrapper
     from manim.scene.scene import Scene
     from manim.typing import Point3D
 
 
 __all__ = ["OpenGLCamera", "OpenGLRenderer"]
 
+# The mobjects are drawn in world coordinates.
+_IDENTITY_MODEL_MATRIX = opengl.matrix_to_shader_input(np.eye(4))
+
 
 class OpenGLCamera(OpenGLMobject):
     euler_angles = _Data()
@@ -254,6 +259,12 @@ class OpenGLRenderer:
         # Initialize texture map.
         self.path_to_texture_id = {}
 
+        # The buffers of the shader wrappers of every mobject, kept on the
+        # GPU between frames, and those drawn during the current frame.
+        self.vertex_buffers: dict[tuple[int, str], VertexBuffers] = {}
+        self._drawn_vertex_buffers: set[tuple[int, str]] = set()
+        self.shaders: dict[Path, Shader] = {}
+
         self.background_color = config["background_color"]
 
     def init_scene(self, scene: Scene) -> None:
@@ -264,6 +275,10 @@ class OpenGLRenderer:
         )
         self.scene = scene
         self.background_color = config["background_color"]
+        # Buffers and shaders belong to the context they were created in,
+        # which is replaced below.
+        self.release_vertex_buffers()
+        self.shaders.clear()
         if self.should_create_window():
             from .opengl_renderer_window import Window
 
@@ -341,9 +356,8 @@ class OpenGLRenderer:
 
         shader_wrapper_list = mobject.get_shader_wrapper_list()
 
-        # Convert ShaderWrappers to Meshes.
         for shader_wrapper in shader_wrapper_list:
-            shader = Shader(self.context, shader_wrapper.shader_folder)
+            shader = self.get_shader(shader_wrapper.shader_folder)
 
             # Set textures.
             for name, path in shader_wrapper.texture_paths.items():
@@ -358,6 +372,7 @@ class OpenGLRenderer:
                 with contextlib.suppress(KeyError):
                     shader.set_uniform(name, value)
             try:
+                shader.set_uniform("u_model_matrix", _IDENTITY_MODEL_MATRIX)
                 shader.set_uniform(
                     "u_view_matrix", self.scene.camera.formatted_view_matrix
                 )
@@ -375,15 +390,46 @@ class OpenGLRenderer:
                 self.context.disable(moderngl.DEPTH_TEST)
 
             # Render.
-            mesh = Mesh(
-                shader,
-                shader_wrapper.vert_data,
-                indices=shader_wrapper.vert_indices,
-                use_depth_test=shader_wrapper.depth_test,
-                primitive=mobject.render_primitive,
-            )
-            mesh.set_uniforms(self)
-            mesh.render()
+            buffers = self.get_vertex_buffers(mobject, shader_wrapper)
+            buffers.write(shader, shader_wrapper.vert_data, shader_wrapper.vert_indices)
+            buffers.render(mobject.render_primitive)
+
+    def get_shader(self, shader_folder: Path) -> Shader:
+        """The shader of the programs in ``shader_folder``, built once per
+        context.
+        """
+        shader = self.shaders.get(shader_folder)
+        if shader is None:
+            shader = self.shaders[shader_folder] = Shader(self.context, shader_folder)
+        return shader
+
+    def get_vertex_buffers(
+        self, mobject: OpenGLMobject, shader_wrapper: ShaderWrapper
+    ) -> VertexBuffers:
+        """The buffers drawing ``shader_wrapper`` of ``mobject``, which are kept
+        on the GPU until ``mobject`` stops being drawn.
+        """
+        key = (id(mobject), shader_wrapper.get_id())
+        buffers = self.vertex_buffers.get(key)
+        if buffers is None:
+            buffers = self.vertex_buffers[key] = VertexBuffers(self.context)
+        self._drawn_vertex_buffers.add(key)
+        return buffers
+
+    def release_unused_vertex_buffers(self) -> None:
+        """Free the buffers which were not drawn since the last call, such as
+        those of the mobjects removed from the scene.
+        """
+        for key in self.vertex_buffers.keys() - self._drawn_vertex_buffers:
+            self.vertex_buffers.pop(key).release()
+        self._drawn_vertex_buffers.clear()
+
+    def release_vertex_buffers(self) -> None:
+        """Free the buffers of all mobjects."""
+        for buffers in self.vertex_buffers.values():
+            buffers.release()
+        self.vertex_buffers.clear()
+        self._drawn_vertex_buffers.clear()
 
     def get_texture_id(self, path):
         if repr(path) not in self.path_to_texture_id:
@@ -492,6 +538,7 @@ class OpenGLRenderer:
                 mesh.set_uniforms(self)
                 mesh.render()
 
+        self.release_unused_vertex_buffers()
         self.animation_elapsed_time = time.time() - self.animation_start_time
 
     def scene_finished(self, scene):
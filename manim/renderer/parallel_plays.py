@@ -0,0 +1,215 @@
+"""Render the plays of a single scene in several worker processes.
+
+When ``config.parallel_plays`` is larger than one, the :class:`.CairoRenderer`
+first runs :meth:`.Scene.construct` in a *plan* pass: every play is hashed as
+usual, but instead of being rasterized the scene state is only fast-forwarded
+to the end of the play. The plays whose partial movie file is not cached yet
+are then split into contiguous chunks of similar duration, and each chunk is
+handed to a worker process.
+
+A worker replays the scene from the start -- the scene state at the beginning
+of a play is reproduced by fast-forwarding through the preceding plays, exactly
+like ``-n/--from_animation_number`` does -- renders the plays of its chunk and
+stops. Finally, the parent process concatenates all partial movie files with
+:meth:`.SceneFileWriter.combine_to_movie`, like in a serial render.
+
+.. note::
+
+    Just like with ``-n``, updaters depending on ``dt`` see one large time step
+    for every fast-forwarded play. Scenes whose state accumulates through such
+    updaters may therefore differ slightly at chunk boundaries.
+
+"""
+
+from __future__ import annotations
+
+import inspect
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from .. import config, logger
+
+if TYPE_CHECKING:
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene import Scene
+
+__all__ = ["can_render_in_workers", "split_plays", "render_plays_in_parallel"]
+
+
+def can_render_in_workers(scene_class: type[Scene]) -> bool:
+    """Whether the worker processes can import a scene class.
+
+    The workers import the scene class from ``config.input_file``, so scenes
+    rendered through the Python API, in a notebook or from standard input
+    have to be rendered by the parent process.
+
+    Examples
+    --------
+    ::
+
+        >>> from manim import Scene
+        >>> can_render_in_workers(Scene)
+        False
+    """
+    if not config.input_file or str(config.input_file) == "-":
+        return False
+    try:
+        source = Path(inspect.getfile(scene_class))
+    except (TypeError, OSError):
+        return False
+    input_file = Path(config.input_file)
+    return (
+        input_file.suffix == ".py"
+        and input_file.exists()
+        and source.exists()
+        and source.samefile(input_file)
+    )
+
+
+def split_plays(durations: dict[int, float], n_chunks: int) -> list[list[int]]:
+    """Split play indices into at most ``n_chunks`` contiguous chunks.
+
+    Chunks are balanced by the total run time of their plays, so that every
+    worker has roughly the same number of frames to render.
+
+    Parameters
+    ----------
+    durations
+        Maps the index of a play to its run time.
+    n_chunks
+        The maximum number of chunks.
+
+    Returns
+    -------
+    list[list[int]]
+        The chunks, in the order of the plays.
+
+    Examples
+    --------
+    ::
+
+        >>> split_plays({0: 1.0, 1: 1.0, 2: 1.0, 5: 3.0}, 2)
+        [[0, 1, 2], [5]]
+    """
+    indices = sorted(durations)
+    if not indices:
+        return []
+    n_chunks = max(1, min(n_chunks, len(indices)))
+    # Zero-length plays still cost a bit, so they get a small weight.
+    weights = [max(durations[index], 1e-3) for index in indices]
+    total = sum(weights)
+
+    chunks: list[list[int]] = [[]]
+    accumulated = 0.0
+    for index, weight in zip(indices, weights, strict=True):
+        if (
+            chunks[-1]
+            and len(chunks) < n_chunks
+            and accumulated + weight / 2 > total * len(chunks) / n_chunks
+        ):
+            chunks.append([])
+        chunks[-1].append(index)
+        accumulated += weight
+    return chunks
+
+
+def _render_chunk(
+    config_dict: dict[str, Any], scene_name: str, plays: list[int]
+) -> dict[int, str]:
+    """Render the given plays of a scene in a worker process.
+
+    Returns
+    -------
+    dict[int, str]
+        Maps the index of every rendered play to its partial movie file.
+    """
+    from manim._config.utils import ManimConfig
+    from manim.utils.module_ops import scene_classes_from_file
+
+    # The worker process is dedicated to this chunk, so the global config can
+    # simply be overwritten with the one of the parent process.
+    worker_config = ManimConfig()
+    worker_config._d.update(config_dict)
+    worker_config.parallel_plays = 0
+    worker_config.progress_bar = "none"
+    # Opening the movie and reporting the profile are left to the parent.
+    worker_config.preview = False
+    worker_config.show_in_file_browser = False
+    worker_config.profile = False
+    config.update(worker_config)
+
+    scene_classes = scene_classes_from_file(
+        Path(config.input_file), require_single_scene=False, full_list=True
+    )
+    scene_class = next(cls for cls in scene_classes if cls.__name__ == scene_name)
+    scene = scene_class()
+    # The scene picks its own camera class, so the renderer is only told
+    # afterwards which plays it has to render.
+    renderer = cast("CairoRenderer", scene.renderer)
+    renderer.plays_to_render = set(plays)
+    scene.render()
+    return {
+        index: path
+        for index in plays
+        if (path := renderer.file_writer.partial_movie_files[index]) is not None
+    }
+
+
+def render_plays_in_parallel(
+    renderer: CairoRenderer, scene_name: str, durations: dict[int, float]
+) -> None:
+    """Render the planned plays of a scene in worker processes.
+
+    The partial movie files reported by the workers replace the ones
+    computed during the plan pass in the renderer's file writer.
+
+    Parameters
+    ----------
+    renderer
+        The renderer which ran the plan pass.
+    scene_name
+        The name of the scene class to render.
+    durations
+        Maps the index of every play which still has to be rendered to its
+        run time.
+    """
+    chunks = split_plays(durations, config.parallel_plays)
+    if not chunks:
+        return
+    logger.info(
+        "Rendering %(n)s animations in %(c)s worker processes.",
+        {"n": len(durations), "c": len(chunks)},
+    )
+
+    file_writer = renderer.file_writer
+    config_dict = dict(config._d)
+    renamed: dict[str, str] = {}
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = {
+            pool.submit(_render_chunk, config_dict, scene_name, chunk): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            chunk = futures[future]
+            for index, path in future.result().items():
+                planned = file_writer.partial_movie_files[index]
+                if planned is not None and planned != path:
+                    renamed[planned] = path
+            logger.info(
+                "Animations %(first)s to %(last)s rendered.",
+                {"first": chunk[0], "last": chunk[-1]},
+            )
+
+    # A worker may end up with a different hash than the plan pass, e.g. if
+    # a ``dt`` updater behaves differently when fast-forwarded.
+    if renamed:
+        file_writer.partial_movie_files = [
+            renamed.get(path, path) if path is not None else None
+            for path in file_writer.partial_movie_files
+        ]
+        for section in file_writer.sections:
+            section.partial_movie_files = [
+                renamed.get(path, path) if path is not None else None
+                for path in section.partial_movie_files
+            ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import inspect
 import re
 import textwrap
@@ -32,6 +33,7 @@ __all__ = [
     "Object3D",
     "Mesh",
     "Shader",
+    "VertexBuffers",
     "FullScreenQuad",
 ]
 
@@ -335,7 +337,16 @@ class Mesh(Object3D):
             renderer.camera.projection_matrix,
         )
 
-    def render(self) -> None:
+    def render(self, buffers: VertexBuffers | None = None) -> None:
+        """Draw the mesh.
+
+        Parameters
+        ----------
+        buffers
+            Buffers kept on the GPU between calls, which only receive the
+            vertex data if it changed. By default, temporary buffers are
+            created and released after drawing.
+        """
         if self.skip_render:
             return
 
@@ -344,36 +355,144 @@ class Mesh(Object3D):
         else:
             self.shader.context.disable(moderngl.DEPTH_TEST)
 
-        shader_attribute_names: list[str] = []
-        for member_name, member in self.shader.shader_program._members.items():
-            if isinstance(member, moderngl.Attribute):
-                shader_attribute_names.append(member_name)
+        if buffers is None:
+            temporary_buffers = VertexBuffers(self.shader.context)
+            temporary_buffers.write(self.shader, self.attributes, self.indices)
+            temporary_buffers.render(self.primitive)
+            temporary_buffers.release()
+        else:
+            buffers.write(self.shader, self.attributes, self.indices)
+            buffers.render(self.primitive)
+
+
+class VertexBuffers:
+    """The vertex buffer, index buffer and vertex array drawing a mesh.
+
+    The buffers are kept on the GPU between frames and the vertex data is
+    only uploaded again when it changes, which is told by a digest of the
+    data rather than by a copy of it. In that case, the storage of the
+    buffers is orphaned first, so that the driver doesn't have to wait for
+    the previous frame to finish drawing from it.
+
+    Parameters
+    ----------
+    context
+        The context owning the buffers.
+
+    Attributes
+    ----------
+    uploads : int
+        The number of times vertex data was sent to the GPU.
+    """
+
+    def __init__(self, context: moderngl.Context) -> None:
+        self.context = context
+        self.vertex_buffer_object: moderngl.Buffer | None = None
+        self.index_buffer_object: moderngl.Buffer | None = None
+        self.vertex_array_object: moderngl.VertexArray | None = None
+        self.uploads = 0
+        self._program: moderngl.Program | None = None
+        self._digest: bytes | None = None
+        self._num_vertices = 0
+
+    @staticmethod
+    def get_digest(attributes: npt.NDArray, indices: npt.NDArray | None) -> bytes:
+        """A digest of the vertex data, which changes whenever the data does."""
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (attributes, indices):
+            if array is None:
+                digest.update(b"-")
+                continue
+            array = np.ascontiguousarray(array)
+            digest.update(f"{array.dtype.descr}{array.shape}".encode())
+            digest.update(array)
+        return digest.digest()
+
+    def write(
+        self,
+        shader: Shader,
+        attributes: npt.NDArray,
+        indices: npt.NDArray | None = None,
+    ) -> None:
+        """Upload the vertex data read by ``shader``, if it changed."""
+        program = shader.shader_program
+        digest = self.get_digest(attributes, indices)
+        if (
+            digest == self._digest
+            and program is self._program
+            and self.vertex_array_object is not None
+        ):
+            return
+
+        shader_attribute_names = [
+            member_name
+            for member_name, member in program._members.items()
+            if isinstance(member, moderngl.Attribute)
+        ]
         filtered_shader_attributes = filter_attributes(
-            self.attributes, shader_attribute_names
+            attributes, shader_attribute_names
         )
-
-        vertex_buffer_object = self.shader.context.buffer(
-            filtered_shader_attributes.tobytes()
+        self.vertex_buffer_object = self._upload(
+            self.vertex_buffer_object, filtered_shader_attributes
         )
-        if self.indices is None:
-            index_buffer_object = None
+        had_indices = self.index_buffer_object is not None
+        if indices is not None and len(indices):
+            index_data = np.ascontiguousarray(indices, dtype="i4")
+            self.index_buffer_object = self._upload(
+                self.index_buffer_object, index_data
+            )
+            self._num_vertices = len(index_data)
         else:
-            vert_index_data = self.indices.astype("i4").tobytes()
-            if vert_index_data:
-                index_buffer_object = self.shader.context.buffer(vert_index_data)
-            else:
-                index_buffer_object = None
-        vertex_array_object = self.shader.context.simple_vertex_array(
-            self.shader.shader_program,
-            vertex_buffer_object,
-            *filtered_shader_attributes.dtype.names,
-            index_buffer=index_buffer_object,
-        )
-        vertex_array_object.render(self.primitive)
-        vertex_buffer_object.release()
-        vertex_array_object.release()
-        if index_buffer_object is not None:
-            index_buffer_object.release()
+            if self.index_buffer_object is not None:
+                self.index_buffer_object.release()
+                self.index_buffer_object = None
+            self._num_vertices = len(filtered_shader_attributes)
+        self._digest = digest
+        self.uploads += 1
+
+        if (
+            self.vertex_array_object is None
+            or program is not self._program
+            or had_indices != (self.index_buffer_object is not None)
+        ):
+            if self.vertex_array_object is not None:
+                self.vertex_array_object.release()
+            self.vertex_array_object = self.context.simple_vertex_array(
+                program,
+                self.vertex_buffer_object,
+                *filtered_shader_attributes.dtype.names,
+                index_buffer=self.index_buffer_object,
+            )
+            self._program = program
+
+    def _upload(
+        self, buffer: moderngl.Buffer | None, data: npt.NDArray
+    ) -> moderngl.Buffer:
+        if buffer is None:
+            return self.context.buffer(data)
+        buffer.orphan(data.nbytes)
+        buffer.write(data)
+        return buffer
+
+    def render(self, primitive: int = moderngl.TRIANGLES) -> None:
+        """Draw the vertices of the last :meth:`write`."""
+        if self.vertex_array_object is not None:
+            self.vertex_array_object.render(primitive, vertices=self._num_vertices)
+
+    def release(self) -> None:
+        """Free the buffers on the GPU."""
+        for gl_object in (
+            self.vertex_array_object,
+            self.vertex_buffer_object,
+            self.index_buffer_object,
+        ):
+            if gl_object is not None:
+                gl_object.release()
+        self.vertex_array_object = None
+        self.vertex_buffer_object = None
+        self.index_buffer_object = None
+        self._program = None
+        self._digest = None
 
 
 class Shader:
@@ -59,6 +59,8 @@ from ..utils.family_ops import restructure_list_to_exclude_certain_family_member
 from ..utils.file_ops import open_media_file
 from ..utils.iterables import list_difference_update, list_update
 from ..utils.module_ops import scene_classes_from_file
+from ..utils.profiler import profiler
+from ..utils.svg_cache import SVGCache
 
 if TYPE_CHECKING:
     from types import FrameType
@@ -254,20 +256,36 @@ class Scene:
         preview
             If true, opens scene in a file viewer.
         """
-        self.setup()
+        if config.profile:
+            profiler.reset()
+            profiler.enabled = True
         try:
-            self.construct()
-        except EndSceneEarlyException:
-            pass
-        except RerunSceneException:
-            self.remove(*self.mobjects)
-            # TODO: The CairoRenderer does not have the method clear_screen()
-            self.renderer.clear_screen()  # type: ignore[union-attr]
-            self.renderer.num_plays = 0
-            return True
-        self.tear_down()
-        # We have to reset these settings in case of multiple renders.
-        self.renderer.scene_finished(self)
+            self.setup()
+            try:
+                self.construct()
+            except EndSceneEarlyException:
+                pass
+            except RerunSceneException:
+                self.remove(*self.mobjects)
+                # TODO: The CairoRenderer does not have the method clear_screen()
+                self.renderer.clear_screen()  # type: ignore[union-attr]
+                self.renderer.num_plays = 0
+                return True
+            self.tear_down()
+            # We have to reset these settings in case of multiple renders.
+            self.renderer.scene_finished(self)
+        finally:
+            # Also when the scene raises, so that later scenes aren't profiled.
+            if config.profile:
+                profiler.enabled = False
+        # The worker processes rendering some plays of a scene in parallel
+        # leave the reports to the parent process.
+        is_parallel_worker = getattr(self.renderer, "plays_to_render", None) is not None
+        if config.profile and not is_parallel_worker:
+            profiler.report(str(self))
+        svg_cache = SVGCache.from_config()
+        if svg_cache is not None and not is_parallel_worker:
+            svg_cache.report()
 
         # Show info only if animations are rendered or to get image
         if (
@@ -1174,7 +1192,8 @@ class Scene:
             return
 
         start_time = self.time
-        self.renderer.play(self, *args, **kwargs)
+        with profiler.span("play", "scene", index=self.renderer.num_plays):
+            self.renderer.play(self, *args, **kwargs)
         run_time = self.time - start_time
         if subcaption:
             if subcaption_duration is None:
@@ -1349,9 +1368,11 @@ class Scene:
             self.duration,
         )
         for t in self.time_progression:
-            self.update_to_time(t)
-            if not skip_rendering and not self.skip_animation_preview:
-                self.renderer.render(self, t, self.moving_mobjects)
+            with profiler.span("frame", "scene", t=t):
+                self.update_to_time(t)
+                if not skip_rendering and not self.skip_animation_preview:
+                    self.renderer.render(self, t, self.moving_mobjects)
+            profiler.flush_accumulated()
             if self.stop_condition is not None and self.stop_condition():
                 self.time_progression.close()
                 break
@@ -1672,12 +1693,16 @@ class Scene:
         self.last_t = t
         assert self.animations is not None
         for animation in self.animations:
-            animation.update_mobjects(dt)
-            alpha = t / animation.run_time
-            animation.interpolate(alpha)
-        self.update_mobjects(dt)
-        self.update_meshes(dt)
-        self.update_self(dt)
+            # The name is only formatted when the span is recorded.
+            name = f"interpolate {type(animation).__name__}" if profiler.enabled else ""
+            with profiler.span(name, "scene"):
+                animation.update_mobjects(dt)
+                alpha = t / animation.run_time
+                animation.interpolate(alpha)
+        with profiler.span("updaters", "scene"):
+            self.update_mobjects(dt)
+            self.update_meshes(dt)
+            self.update_self(dt)
 
     def add_subcaption(
         self, content: str, duration: float = 1, offset: float = 0
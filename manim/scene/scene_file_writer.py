@@ -11,6 +11,7 @@ from pathlib import Path
 from queue import Queue
 from tempfile import NamedTemporaryFile, _TemporaryFileWrapper
 from threading import Thread
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 import av
@@ -24,6 +25,7 @@ from manim import __version__
 from .. import config, logger
 from .._config.logger_utils import set_file_logger
 from ..constants import RendererType
+from ..utils.cache_store import PartialMovieCache
 from ..utils.file_ops import (
     add_extension_if_not_present,
     add_version_before_extension,
@@ -33,6 +35,7 @@ from ..utils.file_ops import (
     modify_atime,
     write_to_movie,
 )
+from ..utils.profiler import profiler
 from ..utils.sounds import get_full_sound_file_path
 from .section import DefaultSectionType, Section
 
@@ -79,6 +82,103 @@ def convert_audio(
             output_audio.mux(packet)
 
 
+class FrameRingBuffer:
+    """A bounded pool of preallocated frames, shared by the renderer and the
+    thread encoding the frames.
+
+    The renderer copies every frame into a free slot with :meth:`put`, which
+    blocks while all slots are waiting to be encoded. This back-pressure
+    keeps the memory used by a render constant, no matter how far the encoder
+    falls behind. If the encoder fails, it hands its exception to :meth:`fail`,
+    which is then raised by :meth:`put` instead of waiting forever.
+
+    Parameters
+    ----------
+    capacity
+        The number of frames which can be waiting for the encoder.
+
+    Attributes
+    ----------
+    producer_stall_time : float
+        Seconds the renderer spent waiting for a free slot, i.e. for the encoder.
+    consumer_stall_time : float
+        Seconds the encoder spent waiting for a new frame, i.e. for the renderer.
+    error : Exception | None
+        The exception which stopped the encoder, if any.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.slots: list[PixelArray] = []
+        self.free_slots: Queue[int] = Queue()
+        self.filled_slots: Queue[tuple[int, int]] = Queue()
+        self.error: Exception | None = None
+        self.reset_stall_times()
+
+    def reset_stall_times(self) -> None:
+        self.producer_stall_time = 0.0
+        self.consumer_stall_time = 0.0
+
+    def allocate(self, frame: PixelArray) -> None:
+        """(Re)allocate the slots so that they can hold ``frame``."""
+        self.slots = [np.empty_like(frame) for _ in range(self.capacity)]
+        self.free_slots = Queue()
+        for index in range(self.capacity):
+            self.free_slots.put(index)
+
+    def put(self, frame: PixelArray, num_frames: int = 1) -> None:
+        """Copy ``frame`` into a free slot and queue it ``num_frames`` times."""
+        if not self.slots or self.slots[0].shape != frame.shape:
+            self.allocate(frame)
+        self.raise_error()
+        start = perf_counter()
+        index = self.free_slots.get()
+        if index < 0:
+            self.raise_error()
+        stall_time = perf_counter() - start
+        self.producer_stall_time += stall_time
+        if profiler.enabled:
+            profiler.add_span("queue wait", "encoder", start, stall_time)
+        with profiler.span("frame copy", "encoder"):
+            np.copyto(self.slots[index], frame, casting="unsafe")
+        self.filled_slots.put((index, num_frames))
+
+    def get(self) -> tuple[int, int]:
+        """Wait for the next queued frame.
+
+        Returns
+        -------
+        tuple[int, int]
+            The index of the slot and the number of times the frame has to be
+            written, or ``(-1, 0)`` once :meth:`close` was called.
+        """
+        start = perf_counter()
+        item = self.filled_slots.get()
+        self.consumer_stall_time += perf_counter() - start
+        return item
+
+    def release(self, index: int) -> None:
+        """Give back a slot which is not needed by the encoder anymore."""
+        self.free_slots.put(index)
+
+    def close(self) -> None:
+        """Tell the consumer that no more frames will come."""
+        self.filled_slots.put((-1, 0))
+
+    def fail(self, error: Exception) -> None:
+        """Record the exception which stopped the consumer and wake up the
+        producer, so that it raises ``error`` instead of waiting for a slot.
+        """
+        self.error = error
+        self.close()
+        self.free_slots.put(-1)
+
+    def raise_error(self) -> None:
+        """Raise the exception which stopped the consumer, if any."""
+        if self.error is not None:
+            raise self.error
+
+
 class SceneFileWriter:
     """SceneFileWriter is the object that actually writes the animations
     played, into video files, using FFMPEG.
@@ -108,6 +208,9 @@ class SceneFileWriter:
     """
 
     force_output_as_scene_name = False
+    # Number of rendered frames that may wait for the encoder before the
+    # renderer blocks. At 1080p, every frame takes ~8 MB.
+    max_buffered_frames = 8
 
     def __init__(
         self,
@@ -116,9 +219,12 @@ class SceneFileWriter:
         **kwargs: Any,
     ) -> None:
         self.renderer = renderer
+        self.scene_name = scene_name
+        self.global_cache: PartialMovieCache | None = None
         self.init_output_directories(scene_name)
         self.init_audio()
         self.frame_count = 0
+        self.frame_buffer = FrameRingBuffer(self.max_buffered_frames)
         self.partial_movie_files: list[str | None] = []
         self.subcaptions: list[srt.Subtitle] = []
         self.sections: list[Section] = []
@@ -198,6 +304,7 @@ class SceneFileWriter:
                     module_name=module_name,
                 ),
             )
+            self.global_cache = PartialMovieCache.from_config()
 
             if config["log_to_file"]:
                 log_dir = guarantee_existence(config.get_dir("log_dir"))
@@ -416,26 +523,42 @@ class SceneFileWriter:
             self.close_partial_movie_stream()
 
     def listen_and_write(self) -> None:
-        """For internal use only: blocks until new frame is available on the queue."""
-        while True:
-            num_frames, frame_data = self.queue.get()
-            if frame_data is None:
-                break
+        """For internal use only: blocks until new frame is available on the queue.
 
-            self.encode_and_write_frame(frame_data, num_frames)
+        An exception raised while encoding is handed to the frame buffer, to
+        be raised by the renderer.
+        """
+        try:
+            while True:
+                index, num_frames = self.frame_buffer.get()
+                if index < 0:
+                    break
+
+                with profiler.span("encode", "encoder", frames=num_frames):
+                    self.encode_and_write_frame(
+                        self.frame_buffer.slots[index], num_frames
+                    )
+                self.frame_buffer.release(index)
+        except Exception as error:
+            self.frame_buffer.fail(error)
 
     def encode_and_write_frame(self, frame: PixelArray, num_frames: int) -> None:
         """For internal use only: takes a given frame in ``np.ndarray`` format and
         writes it to the stream
         """
+        # The frame is converted to the pixel format of the stream only once.
+        # Repeated frames (e.g. of a frozen wait) reuse the converted picture
+        # and only get a new timestamp.
+        # Notes: precomputing reusing packets does not work!
+        # I.e., you cannot do `packets = encode(...)`
+        # and reuse it, as it seems that `mux(...)`
+        # consumes the packet.
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba").reformat(
+            format=self.video_stream.pix_fmt
+        )
         for _ in range(num_frames):
-            # Notes: precomputing reusing packets does not work!
-            # I.e., you cannot do `packets = encode(...)`
-            # and reuse it, as it seems that `mux(...)`
-            # consumes the packet.
-            # The same issue applies for `av_frame`,
-            # reusing it renders weird-looking frames.
-            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            av_frame.pts = self.encoded_frames
+            self.encoded_frames += 1
             for packet in self.video_stream.encode(av_frame):
                 self.video_container.mux(packet)
 
@@ -461,8 +584,9 @@ class SceneFileWriter:
                     else frame_or_renderer
                 )
 
-            msg = (num_frames, frame)
-            self.queue.put(msg)
+            # The frame is copied into the ring buffer right away, so the
+            # renderer may reuse its pixel array for the next frame.
+            self.frame_buffer.put(frame, num_frames)
 
         if is_png_format() and not config["dry_run"]:
             if isinstance(frame_or_renderer, np.ndarray):
@@ -512,19 +636,29 @@ class SceneFileWriter:
         Combines the partial movie files into the whole scene.
         If save_last_frame is True, saves the last frame in the default image directory.
         """
-        if write_to_movie():
-            self.combine_to_movie()
-            if config.save_sections:
-                self.combine_to_section_videos()
-            if config["flush_cache"]:
-                self.flush_cache_directory()
-            else:
-                self.clean_cache()
-        elif is_png_format() and not config["dry_run"]:
-            target_dir = self.image_file_path.parent / self.image_file_path.stem
-            logger.info("\n%i images ready at %s\n", self.frame_count, str(target_dir))
-        if self.subcaptions:
-            self.write_subcaption_file()
+        try:
+            if write_to_movie():
+                self.combine_to_movie()
+                if config.save_sections:
+                    self.combine_to_section_videos()
+                if config["flush_cache"]:
+                    self.flush_cache_directory()
+                else:
+                    self.clean_cache()
+                if self.global_cache is not None:
+                    self.global_cache.prune()
+            elif is_png_format() and not config["dry_run"]:
+                target_dir = self.image_file_path.parent / self.image_file_path.stem
+                logger.info(
+                    "\n%i images ready at %s\n", self.frame_count, str(target_dir)
+                )
+            if self.subcaptions:
+                self.write_subcaption_file()
+        finally:
+            # Every scene opens its own connection to the store.
+            if self.global_cache is not None:
+                self.global_cache.close()
+                self.global_cache = None
 
     def open_partial_movie_stream(self, file_path: StrPath | None = None) -> None:
         """Open a container holding a video stream.
@@ -542,18 +676,27 @@ class SceneFileWriter:
         partial_movie_file_pix_fmt = "yuv420p"
         av_options = {
             "an": "1",  # ffmpeg: -an, no audio
-            "crf": "23",  # ffmpeg: -crf, constant rate factor (improved bitrate)
+            # ffmpeg: -crf, constant rate factor (improved bitrate)
+            "crf": str(config.partial_movie_crf),
         }
+        if config.partial_movie_preset:
+            av_options["preset"] = config.partial_movie_preset
+        if config.partial_movie_intra_only:
+            av_options["g"] = "1"  # ffmpeg: -g, every frame is a key frame
+        if config.encoder_threads:
+            av_options["threads"] = str(config.encoder_threads)
 
         if config.movie_file_extension == ".webm":
             partial_movie_file_codec = "libvpx-vp9"
             av_options["-auto-alt-ref"] = "1"
+            av_options.pop("preset", None)
             if config.transparent:
                 partial_movie_file_pix_fmt = "yuva420p"
 
         elif config.transparent:
             partial_movie_file_codec = "qtrle"
             partial_movie_file_pix_fmt = "argb"
+            av_options.pop("preset", None)
 
         video_container = av.open(file_path, mode="w")
         stream = video_container.add_stream(
@@ -568,7 +711,8 @@ class SceneFileWriter:
         self.video_container: OutputContainer = video_container
         self.video_stream: Stream = stream
 
-        self.queue: Queue[tuple[int, PixelArray | None]] = Queue()
+        self.encoded_frames = 0
+        self.frame_buffer.reset_stall_times()
         self.writer_thread = Thread(target=self.listen_and_write, args=())
         self.writer_thread.start()
 
@@ -579,22 +723,38 @@ class SceneFileWriter:
         in the video stream holding a partial file, and then close
         the corresponding container.
         """
-        self.queue.put((-1, None))
+        self.frame_buffer.close()
         self.writer_thread.join()
+        self.frame_buffer.raise_error()
 
         for packet in self.video_stream.encode():
             self.video_container.mux(packet)
 
         self.video_container.close()
 
+        logger.debug(
+            f"Animation {self.renderer.num_plays} : Encoder waited %(consumer)s s for frames, "
+            "renderer waited %(producer)s s for the encoder",
+            {
+                "consumer": f"{self.frame_buffer.consumer_stall_time:.3f}",
+                "producer": f"{self.frame_buffer.producer_stall_time:.3f}",
+            },
+        )
+
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
             {"path": f"'{self.partial_movie_file_path}'"},
         )
+        if self.global_cache is not None and not config.disable_caching:
+            path = Path(self.partial_movie_file_path)
+            self.global_cache.store(path.stem, path, self.scene_name)
 
     def is_already_cached(self, hash_invocation: str) -> bool:
         """Will check if a file named with `hash_invocation` exists.
 
+        If it does not, but the global cache holds a partial movie file for
+        `hash_invocation`, the file is restored from there.
+
         Parameters
         ----------
         hash_invocation
@@ -611,7 +771,11 @@ class SceneFileWriter:
             self.partial_movie_directory
             / f"{hash_invocation}{config['movie_file_extension']}"
         )
-        return path.exists()
+        if path.exists():
+            return True
+        return self.global_cache is not None and self.global_cache.fetch(
+            hash_invocation, path
+        )
 
     def combine_files(
         self,
@@ -619,7 +783,25 @@ class SceneFileWriter:
         output_file: Path,
         create_gif: bool = False,
         includes_sound: bool = False,
+        transcode: bool = False,
     ) -> None:
+        """Concatenate the given partial movie files.
+
+        Parameters
+        ----------
+        input_files
+            The partial movie files, in order.
+        output_file
+            The file to write.
+        create_gif
+            Whether to convert the movie to a GIF.
+        includes_sound
+            Whether the partial movie files contain sound.
+        transcode
+            Whether to re-encode the video with ``config.final_movie_preset``
+            and ``config.final_movie_crf``, instead of only copying the
+            packets of the partial movie files.
+        """
         file_list = self.partial_movie_directory / "partial_movie_file_list.txt"
         logger.debug(
             f"Partial movie files to combine ({len(input_files)} files): %(p)s",
@@ -698,6 +880,36 @@ class SceneFileWriter:
             for packet in output_stream.encode():
                 output_container.mux(packet)
 
+        elif transcode:
+            av_options = {
+                "crf": str(config.final_movie_crf),
+                "preset": config.final_movie_preset,
+            }
+            if config.encoder_threads:
+                av_options["threads"] = str(config.encoder_threads)
+            frame_rate = to_av_frame_rate(config.frame_rate)
+            output_stream = output_container.add_stream(
+                "libx264",
+                rate=frame_rate,
+                options=av_options,
+            )
+            output_stream.pix_fmt = "yuv420p"
+            output_stream.width = config.pixel_width
+            output_stream.height = config.pixel_height
+
+            for frames_written, frame in enumerate(
+                partial_movies_input.decode(partial_movies_stream)
+            ):
+                # Timestamps of consecutive files are not monotonic, the
+                # frames are simply numbered in order.
+                frame.pts = frames_written
+                frame.time_base = 1 / frame_rate
+                for packet in output_stream.encode(frame):
+                    output_container.mux(packet)
+
+            for packet in output_stream.encode():
+                output_container.mux(packet)
+
         else:
             output_stream = output_container.add_stream_from_template(
                 template=partial_movies_stream,
@@ -745,6 +957,7 @@ class SceneFileWriter:
             movie_file_path,
             is_gif_format(),
             self.includes_sound,
+            transcode=self.should_transcode_final_movie(),
         )
 
         # handle sound
@@ -827,6 +1040,18 @@ class SceneFileWriter:
                 # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
                 modify_atime(file_path)
 
+    def should_transcode_final_movie(self) -> bool:
+        """Whether the combined movie is re-encoded with ``config.final_movie_preset``.
+
+        Only opaque H.264 movies (``.mp4`` and ``.mov``) are transcoded.
+        """
+        return (
+            bool(config.final_movie_preset)
+            and not is_gif_format()
+            and not config.transparent
+            and config.movie_file_extension in (".mp4", ".mov")
+        )
+
     def combine_to_section_videos(self) -> None:
         """Concatenate partial movie files for each section."""
         self.finish_last_section()
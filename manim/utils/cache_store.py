@@ -0,0 +1,353 @@
+"""A content-addressed store for partial movie files shared between scenes.
+
+Every partial movie file is cached in the ``partial_movie_dir`` of its scene,
+so a play shared by several scenes (an intro, an outro, ...) is encoded once
+per scene. When ``config.global_cache_dir`` is set, every partial movie file
+written by Manim is also added to a global store in that directory, and a
+cache miss in a ``partial_movie_dir`` is first looked up in the store before
+the play is rendered.
+
+Files are addressed by the hash of their play together with the settings
+influencing the encoded file (resolution, frame rate, container and encoder
+settings). A SQLite index keeps track of the size, the last access and the
+source scene of every file, and evicts the least recently used files once
+the store is larger than ``config.global_cache_max_size``.
+
+The store can be inspected with ``manim cache stats``, ``manim cache prune``
+and ``manim cache verify``.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from manim import __version__
+
+from .. import config, logger
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from manim.typing import StrPath
+
+__all__ = ["PartialMovieCache"]
+
+MIB = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    play_hash TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    scene TEXT NOT NULL,
+    input_file TEXT NOT NULL,
+    settings TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Place ``source`` at ``destination`` without exposing a partial file.
+
+    A hard link is used when both paths are on the same file system, as
+    partial movie files are never modified once they are written.
+    """
+    tmp = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, destination)
+
+
+class PartialMovieCache:
+    """A global, content-addressed store of partial movie files.
+
+    Parameters
+    ----------
+    directory
+        The directory holding the files and the ``index.sqlite`` index.
+    max_size
+        The size in bytes above which the least recently used files are
+        evicted by :meth:`prune`. ``None`` for no limit.
+    """
+
+    index_file_name = "index.sqlite"
+
+    def __init__(self, directory: StrPath, max_size: int | None = None) -> None:
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        # Several renders (e.g. the workers of --parallel_plays) may use the
+        # store at the same time, so writers wait for each other.
+        self.connection = sqlite3.connect(
+            self.directory / self.index_file_name, timeout=60
+        )
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls) -> Self | None:
+        """Open the store configured by ``config.global_cache_dir``.
+
+        Returns
+        -------
+        :class:`PartialMovieCache` | None
+            The store, or ``None`` if no global cache is configured.
+        """
+        if not config.global_cache_dir:
+            return None
+        max_size = config.global_cache_max_size
+        return cls(
+            config.global_cache_dir,
+            None if max_size == float("inf") else int(max_size * MIB),
+        )
+
+    @staticmethod
+    def render_settings() -> dict[str, Any]:
+        """The settings of ``config`` which affect a partial movie file but
+        not the hash of its play.
+        """
+        return {
+            "manim": __version__,
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "frame_rate": config.frame_rate,
+            "movie_file_extension": config.movie_file_extension,
+            "transparent": config.transparent,
+            "partial_movie_preset": config.partial_movie_preset,
+            "partial_movie_crf": config.partial_movie_crf,
+            "partial_movie_intra_only": config.partial_movie_intra_only,
+        }
+
+    @staticmethod
+    def make_key(play_hash: str, settings: dict[str, Any]) -> str:
+        """Compute the address of a partial movie file in the store."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(play_hash.encode())
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _path_for(self, key: str, extension: str) -> Path:
+        # Spread the files over subdirectories to keep directory listings short.
+        return self.directory / key[:2] / f"{key}{extension}"
+
+    def fetch(self, play_hash: str, destination: StrPath) -> bool:
+        """Copy the partial movie file of a play out of the store.
+
+        Parameters
+        ----------
+        play_hash
+            The hash of the play.
+        destination
+            Where the partial movie file is expected by the scene file writer.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the store held a file for the play.
+        """
+        key = self.make_key(play_hash, self.render_settings())
+        row = self.connection.execute(
+            "SELECT path FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False
+        source = self.directory / row["path"]
+        try:
+            _link_or_copy(source, Path(destination))
+        except OSError:
+            # The file was removed behind the index's back.
+            with self.connection:
+                self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return False
+        with self.connection:
+            self.connection.execute(
+                "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key),
+            )
+        logger.debug(
+            "Partial movie file %(hash)s restored from the global cache",
+            {"hash": play_hash},
+        )
+        return True
+
+    def store(self, play_hash: str, source: StrPath, scene: str) -> None:
+        """Add a partial movie file to the store.
+
+        Parameters
+        ----------
+        play_hash
+            The hash of the play.
+        source
+            The partial movie file.
+        scene
+            The name of the scene the play belongs to.
+        """
+        settings = self.render_settings()
+        key = self.make_key(play_hash, settings)
+        path = self._path_for(key, settings["movie_file_extension"])
+        path.parent.mkdir(exist_ok=True)
+        _link_or_copy(Path(source), path)
+        now = time.time()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, play_hash, path, size, created, last_access, hits, scene, "
+                "input_file, settings) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?, ?)",
+                (
+                    key,
+                    play_hash,
+                    path.relative_to(self.directory).as_posix(),
+                    path.stat().st_size,
+                    now,
+                    now,
+                    scene,
+                    str(config.input_file),
+                    json.dumps(settings, sort_keys=True),
+                ),
+            )
+
+    def total_size(self) -> int:
+        """The size in bytes of all files in the store."""
+        row = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return int(row[0])
+
+    def _delete(self, rows: list[sqlite3.Row]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM entries WHERE key = ?", [(row["key"],) for row in rows]
+            )
+        for row in rows:
+            (self.directory / row["path"]).unlink(missing_ok=True)
+
+    def prune(self, max_size: int | None = None) -> tuple[int, int]:
+        """Evict the least recently used files until the store fits the budget.
+
+        Parameters
+        ----------
+        max_size
+            The budget in bytes, defaults to the one of the store.
+
+        Returns
+        -------
+        tuple[int, int]
+            The number of evicted files and the number of freed bytes.
+        """
+        if max_size is None:
+            max_size = self.max_size
+        if max_size is None:
+            return 0, 0
+        excess = self.total_size() - max_size
+        if excess <= 0:
+            return 0, 0
+        evicted: list[sqlite3.Row] = []
+        freed = 0
+        for row in self.connection.execute(
+            "SELECT key, path, size FROM entries ORDER BY last_access"
+        ):
+            if freed >= excess:
+                break
+            evicted.append(row)
+            freed += row["size"]
+        self._delete(evicted)
+        logger.info(
+            "The global cache exceeded its budget. Therefore, manim has removed "
+            "%(n)s least recently used partial movie file(s) (%(size)s MiB).",
+            {"n": len(evicted), "size": f"{freed / MIB:.1f}"},
+        )
+        return len(evicted), freed
+
+    def verify(self, fix: bool = True) -> list[tuple[str, str]]:
+        """Check that the index and the files of the store agree.
+
+        Parameters
+        ----------
+        fix
+            Whether to remove broken entries and files unknown to the index.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The path of every problematic file with a description.
+        """
+        problems: list[tuple[str, str]] = []
+        broken: list[sqlite3.Row] = []
+        known: set[str] = set()
+        for row in self.connection.execute("SELECT key, path, size FROM entries"):
+            known.add(row["path"])
+            path = self.directory / row["path"]
+            if not path.exists():
+                problems.append((row["path"], "missing"))
+                broken.append(row)
+            elif path.stat().st_size != row["size"]:
+                problems.append((row["path"], "size mismatch"))
+                broken.append(row)
+
+        orphans = [
+            path
+            for path in self.directory.glob("??/*")
+            # Files starting with a dot are still being written.
+            if path.is_file()
+            and not path.name.startswith(".")
+            and path.relative_to(self.directory).as_posix() not in known
+        ]
+        problems.extend(
+            (path.relative_to(self.directory).as_posix(), "not indexed")
+            for path in orphans
+        )
+
+        if fix:
+            self._delete(broken)
+            for path in orphans:
+                path.unlink(missing_ok=True)
+        return problems
+
+    def stats(self) -> dict[str, Any]:
+        """Summarize the content of the store.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of files, their total size, the budget, the number of
+            cache hits and the number of files and size per scene.
+        """
+        row = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0), "
+            "MIN(last_access), MAX(last_access) FROM entries"
+        ).fetchone()
+        scenes = self.connection.execute(
+            "SELECT scene, COUNT(*) AS files, SUM(size) AS size, SUM(hits) AS hits "
+            "FROM entries GROUP BY scene ORDER BY size DESC"
+        ).fetchall()
+        return {
+            "directory": str(self.directory),
+            "files": row[0],
+            "size": row[1],
+            "max_size": self.max_size,
+            "hits": row[2],
+            "oldest_access": row[3],
+            "newest_access": row[4],
+            "scenes": [dict(scene) for scene in scenes],
+        }
+
+    def close(self) -> None:
+        """Close the connection to the index."""
+        self.connection.close()
@@ -10,8 +10,11 @@ __all__ = [
 
 
 import itertools as it
+import sys
+import weakref
 from typing import Any, Generic, Protocol, cast
 
+import numpy as np
 import numpy.typing as npt
 from typing_extensions import TypeVar
 
@@ -96,3 +99,123 @@ class _Uniforms(Generic[_Uniforms_T]):
 
     def __set__(self, obj: _HasUniforms, num: _Uniforms_T) -> None:
         obj.uniforms[self.name] = num
+
+
+# The objects sharing an array they don't own, with the names of the
+# attributes holding it, by the id of that array.
+_array_sharers: dict[
+    int, tuple[weakref.ref[Any], list[tuple[weakref.ref[Any], str]]]
+] = {}
+
+
+def _count_references(container: dict[str, Any], key: str) -> int:
+    value = container[key]
+    return sys.getrefcount(value)
+
+
+# The count of an array only referenced by the dictionary holding it.
+_UNSHARED_REFERENCES = _count_references({"array": np.empty(0)}, "array")
+
+
+def _live_sharers(array: npt.NDArray[Any]) -> list[tuple[Any, str]]:
+    """The objects still sharing ``array``, with the names of their attributes."""
+    entry = _array_sharers.get(id(array))
+    if entry is None:
+        return []
+    sharers = []
+    for ref, name in entry[1]:
+        sharer = ref()
+        if sharer is None:
+            continue
+        shared = sharer.__dict__.get(name)
+        if isinstance(shared, np.ndarray) and shared.base is array:
+            sharers.append((sharer, name))
+    return sharers
+
+
+class _CopyOnWriteArray(Generic[_Data_T]):
+    """Descriptor for an array attribute which copies may share.
+
+    The object holding an array owns it and keeps it writable. Its copies
+    get a read-only view of it instead of a copy, and the first access
+    through the attribute of a copy replaces that view with a writable copy.
+    An access through the attribute of the owner gives such a copy to the
+    objects still sharing the array first, since the owner may then modify
+    it. Either way, the array is copied at most once per copy of the object.
+
+    The array itself is stored in the ``__dict__`` of the object under the
+    name of the attribute.
+
+    Attributes
+    ----------
+    generation : int
+        The number of times an array of any object was replaced, so that
+        holders of views of these arrays can tell when to look for new ones.
+    """
+
+    generation = 0
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name: str = name
+
+    def __get__(self, obj: Any, owner: Any = None) -> _Data_T:
+        if obj is None:
+            return cast(_Data_T, self)
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if isinstance(value, np.ndarray):
+            if not value.flags.writeable:
+                value = obj.__dict__[self.name] = value.copy()
+                _CopyOnWriteArray.generation += 1
+            elif id(value) in _array_sharers:
+                for sharer, name in _live_sharers(value):
+                    sharer.__dict__[name] = sharer.__dict__[name].copy()
+                del _array_sharers[id(value)]
+                _CopyOnWriteArray.generation += 1
+        return cast(_Data_T, value)
+
+    def __set__(self, obj: Any, array: _Data_T) -> None:
+        obj.__dict__[self.name] = array
+        _CopyOnWriteArray.generation += 1
+
+    def share(self, obj: Any, copy: Any) -> bool:
+        """Let ``copy`` share the array of ``obj`` rather than copying it.
+
+        Returns
+        -------
+        bool
+            Whether the array is shared. It isn't if it holds objects, if it
+            is a view, whose base could be modified through another array, or
+            if anything else references it, as it could be modified through
+            that reference.
+        """
+        n_references = _count_references(obj.__dict__, self.name)
+        value = obj.__dict__[self.name]
+        if not isinstance(value, np.ndarray) or value.dtype.hasobject:
+            return False
+        if value.flags.writeable:
+            if value.base is not None:
+                return False
+            # The views of the copies sharing it also reference the array.
+            n_views = len(_live_sharers(value))
+            if n_references > _UNSHARED_REFERENCES + n_views:
+                return False
+            base = value
+        elif value.base is not None and id(value.base) in _array_sharers:
+            # The object shares the array of another one.
+            base = value.base
+        else:
+            return False
+        view = base.view()
+        view.flags.writeable = False
+        setattr(copy, self.name, view)
+        key = id(base)
+        if key not in _array_sharers:
+            _array_sharers[key] = (
+                weakref.ref(base, lambda _: _array_sharers.pop(key, None)),
+                [],
+            )
+        _array_sharers[key][1].append((weakref.ref(copy), self.name))
+        return True
@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import copy
+import functools
+import hashlib
 import inspect
 import json
+import weakref
 import zlib
 from collections.abc import Callable, Hashable, Iterable, Sequence
+from enum import Enum
 from time import perf_counter
-from types import FunctionType, MappingProxyType, MethodType, ModuleType
+from types import (
+    BuiltinFunctionType,
+    CodeType,
+    FunctionType,
+    MappingProxyType,
+    MethodType,
+    ModuleType,
+)
 from typing import TYPE_CHECKING, Any, overload
 
 import numpy as np
 
 from manim._config import config, logger
+from manim.utils.profiler import profiler
 
 if TYPE_CHECKING:
     from manim.animation.animation import Animation
@@ -31,6 +43,12 @@ KEYS_TO_FILTER_OUT = {
     "background",
     "pixel_array",
     "pixel_array_to_cairo_context",
+    "cairo_path_cache",
+    "image_mobject_cache",
+    "_arc_length_table",
+    "_sample_times",
+    "_packed_families",
+    "_vector_templates",
 }
 
 
@@ -330,6 +348,158 @@ def get_json(obj: Any) -> str:
     return json.dumps(obj, cls=_CustomEncoder)
 
 
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum)
+
+# Retrieving the source code of a function is by far the slowest part of
+# hashing it, and it only depends on the code object.
+_SOURCE_CACHE: weakref.WeakKeyDictionary[CodeType, bytes] = weakref.WeakKeyDictionary()
+
+
+def _get_source(func: FunctionType) -> bytes:
+    code = func.__code__
+    source = _SOURCE_CACHE.get(code)
+    if source is None:
+        try:
+            source = inspect.getsource(func).encode()
+        except (OSError, TypeError):
+            # See the corresponding comment in _CustomEncoder.default.
+            source = b""
+        _SOURCE_CACHE[code] = source
+    return source
+
+
+def _update(digest: Any, tag: bytes, payload: bytes | memoryview = b"") -> None:
+    # The length prefix keeps the streams of e.g. ["ab", "c"] and ["a", "bc"]
+    # apart.
+    digest.update(tag + b":" + str(len(payload)).encode() + b":")
+    digest.update(payload)
+
+
+class _StructuralHasher:
+    """Computes digests of arbitrary objects without serializing them.
+
+    Like :class:`_CustomEncoder`, the hasher recursively walks through the
+    attributes of objects and the content of containers, but feeds them
+    directly into a ``blake2b`` digest. NumPy arrays are hashed from their
+    raw buffer.
+
+    Every object is only walked once per hasher: further occurrences,
+    including circular references, are replaced by a reference to the
+    first one.
+
+    Parameters
+    ----------
+    ignored
+        Objects which are only hashed as references, e.g. the scene.
+    """
+
+    def __init__(self, *ignored: Any) -> None:
+        self._visited: dict[int, int] = {}
+        # Objects created while hashing must outlive the hasher, otherwise
+        # their id could be reused for a different object.
+        self._keep_alive: list[Any] = []
+        for obj in ignored:
+            self._first_visit(obj)
+
+    def hexdigest(self, obj: Any) -> str:
+        """Return the digest of ``obj`` as a string of hexadecimal digits."""
+        digest = hashlib.blake2b(digest_size=8)
+        self._feed(digest, obj)
+        return digest.hexdigest()
+
+    def _first_visit(self, obj: Any) -> bool:
+        """Remember ``obj`` and return whether it is visited for the first time."""
+        if id(obj) in self._visited:
+            return False
+        self._visited[id(obj)] = len(self._visited)
+        self._keep_alive.append(obj)
+        if (
+            not config.disable_caching_warning
+            and len(self._visited) == _Memoizer.THRESHOLD_WARNING
+        ):
+            logger.warning(
+                "It looks like the scene contains a lot of sub-mobjects. Caching "
+                "is sometimes not suited to handle such large scenes, you might "
+                "consider disabling caching with --disable_caching to potentially "
+                "speed up the rendering process.",
+            )
+            logger.warning(
+                "You can disable this warning by setting disable_caching_warning "
+                "to True in your config file.",
+            )
+        return True
+
+    def _feed(self, digest: Any, obj: Any) -> None:
+        if isinstance(obj, str):
+            _update(digest, b"s", obj.encode("utf-8", "surrogatepass"))
+        elif isinstance(obj, _IMMUTABLE_TYPES):
+            _update(digest, type(obj).__name__.encode(), repr(obj).encode())
+        elif isinstance(obj, np.ndarray):
+            self._feed_array(digest, obj)
+        elif isinstance(obj, np.generic):
+            _update(digest, obj.dtype.str.encode(), obj.tobytes())
+        elif isinstance(obj, (type, ModuleType, BuiltinFunctionType, np.ufunc)):
+            module = getattr(obj, "__module__", None)
+            name = getattr(obj, "__qualname__", obj.__name__)
+            _update(digest, b"name", f"{module}.{name}".encode())
+        elif not self._first_visit(obj):
+            _update(digest, b"ref", str(self._visited[id(obj)]).encode())
+        elif isinstance(obj, (list, tuple)):
+            _update(digest, b"list", str(len(obj)).encode())
+            for el in obj:
+                self._feed(digest, el)
+        elif isinstance(obj, dict):
+            self._feed_dict(digest, obj)
+        elif isinstance(obj, (set, frozenset)):
+            # The iteration order of a set changes between interpreter runs.
+            digests = []
+            for el in obj:
+                el_digest = hashlib.blake2b(digest_size=16)
+                self._feed(el_digest, el)
+                digests.append(el_digest.digest())
+            _update(digest, b"set", b"".join(sorted(digests)))
+        elif isinstance(obj, (FunctionType, MethodType)):
+            self._feed_function(digest, obj)
+        elif isinstance(obj, functools.partial):
+            _update(digest, b"partial")
+            self._feed(digest, [obj.func, obj.args, obj.keywords])
+        elif hasattr(obj, "__dict__"):
+            _update(digest, type(obj).__qualname__.encode())
+            self._feed_dict(digest, obj.__dict__)
+        else:
+            _update(digest, b"type", str(type(obj)).encode())
+
+    def _feed_array(self, digest: Any, array: np.ndarray) -> None:
+        _update(digest, array.dtype.str.encode(), str(array.shape).encode())
+        if array.dtype.hasobject:
+            for el in array.flat:
+                self._feed(digest, el)
+        else:
+            digest.update(np.ascontiguousarray(array).data)
+
+    def _feed_dict(self, digest: Any, dct: dict[Any, Any]) -> None:
+        _update(digest, b"dict", str(len(dct)).encode())
+        for k, v in dct.items():
+            if k in KEYS_TO_FILTER_OUT:
+                continue
+            self._feed(digest, k)
+            self._feed(digest, v)
+
+    def _feed_function(self, digest: Any, obj: FunctionType | MethodType) -> None:
+        func = obj.__func__ if isinstance(obj, MethodType) else obj
+        if not isinstance(func, FunctionType):
+            _update(digest, b"type", str(type(func)).encode())
+            return
+        _update(digest, b"function", _get_source(func))
+        cvars = inspect.getclosurevars(func)
+        closure = {
+            name: value
+            for name, value in {**cvars.globals, **cvars.nonlocals}.items()
+            if not isinstance(value, ModuleType)
+        }
+        self._feed(digest, [closure, func.__defaults__, func.__kwdefaults__])
+
+
 def get_hash_from_play_call(
     scene_object: Scene,
     camera_object: Camera | OpenGLCamera,
@@ -359,18 +529,16 @@ def get_hash_from_play_call(
     """
     logger.debug("Hashing ...")
     t_start = perf_counter()
-    _Memoizer.mark_as_processed(scene_object)
-    camera_json = get_json(camera_object)
-    animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_camera, hash_animations, hash_current_mobjects = (
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
-    )
+    # The scene is referenced by many objects, but its state is already
+    # covered by the camera, the animations and the mobjects.
+    hasher = _StructuralHasher(scene_object)
+    hash_camera = hasher.hexdigest(camera_object)
+    hash_animations = hasher.hexdigest(sorted(animations_list, key=str))
+    hash_current_mobjects = hasher.hexdigest(list(current_mobjects_list))
     hash_complete = f"{hash_camera}_{hash_animations}_{hash_current_mobjects}"
     t_end = perf_counter()
+    if profiler.enabled:
+        profiler.add_span("hash play", "scene", t_start, t_end - t_start)
     logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
-    # End of the hashing for the animation, reset all the memoize.
-    _Memoizer.reset_already_processed()
     logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
     return hash_complete
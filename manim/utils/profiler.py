@@ -0,0 +1,349 @@
+"""Record where a render spends its time.
+
+With ``--profile`` (``config.profile``), every render records how long the
+plays and their frames take, split into the evaluation of animations and
+updaters, the rasterization by the camera (per display function, and for
+vectorized mobjects into path building, filling and stroking), copying the
+frames for the encoder, waiting for the encoder and encoding.
+
+At the end of a scene, the recording is written to the log directory as a
+Chrome trace, ``<Scene>_profile.json``, which can be opened with
+``chrome://tracing`` or https://ui.perfetto.dev, together with a summary
+``<Scene>_profile_summary.json``, and the summary is printed as a table.
+
+Hot paths which run for every mobject of every frame are not recorded as
+individual events: their time is accumulated and recorded once per frame,
+as a counter in the trace.
+
+The recording is also available from Python, e.g. to fail a CI job when a
+scene became slower::
+
+    from manim.utils.profiler import find_regressions, load_summary, profile
+
+    with profile() as profiler:
+        MyScene().render()
+    regressions = find_regressions(
+        load_summary("baseline_summary.json"), profiler.summary(), threshold=0.2
+    )
+    assert not regressions, regressions
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from rich.table import Table
+
+from .._config import config, console, logger
+
+if TYPE_CHECKING:
+    from manim.typing import StrPath
+
+__all__ = [
+    "SpanStats",
+    "RenderProfiler",
+    "profiler",
+    "profile",
+    "load_summary",
+    "find_regressions",
+]
+
+_NO_SPAN = nullcontext()
+
+
+@dataclass
+class SpanStats:
+    """The aggregated durations of a recorded name, in seconds.
+
+    For accumulated hot paths, ``count`` is the number of calls and ``max``
+    the largest total of a single frame.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, duration: float, count: int = 1) -> None:
+        self.count += count
+        self.total += duration
+        self.max = max(self.max, duration)
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "category", "args", "start")
+
+    def __init__(
+        self, profiler: RenderProfiler, name: str, category: str, args: dict[str, Any]
+    ) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.profiler.add_span(
+            self.name,
+            self.category,
+            self.start,
+            perf_counter() - self.start,
+            self.args,
+        )
+
+
+class _Accumulator:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: RenderProfiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        duration = perf_counter() - self.start
+        accumulated = self.profiler.accumulated
+        total, count = accumulated.get(self.name, (0.0, 0))
+        accumulated[self.name] = (total + duration, count + 1)
+
+
+class RenderProfiler:
+    """Records spans of time as Chrome trace events and aggregates them.
+
+    Manim records into the instance :data:`profiler`, which does nothing
+    until it is enabled, either by ``config.profile`` or by :func:`profile`.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.origin = perf_counter()
+        self.events: list[dict[str, Any]] = []
+        self.stats: dict[str, SpanStats] = {}
+        self.accumulated: dict[str, tuple[float, int]] = {}
+        self.thread_names: dict[int, str] = {}
+        # Spans are also recorded by the thread encoding the frames.
+        self.lock = threading.Lock()
+
+    def span(
+        self, name: str, category: str = "render", **args: Any
+    ) -> AbstractContextManager[None]:
+        """Record the time spent in a ``with`` block.
+
+        Parameters
+        ----------
+        name
+            The name of the span in the trace and in the summary.
+        category
+            The category of the span in the trace.
+        args
+            Details shown with the span in the trace.
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, category, args)
+
+    def accumulate(self, name: str) -> AbstractContextManager[None]:
+        """Add the time spent in a ``with`` block to the total of this frame.
+
+        Used for hot paths, which would bloat the trace with an event per call.
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return _Accumulator(self, name)
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        duration: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a span which started at ``start`` (a :func:`~time.perf_counter` value)."""
+        thread_id = threading.get_ident()
+        with self.lock:
+            if thread_id not in self.thread_names:
+                self.thread_names[thread_id] = threading.current_thread().name
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self.origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": thread_id,
+                    "args": args or {},
+                }
+            )
+            self.stats.setdefault(name, SpanStats()).add(duration)
+
+    def flush_accumulated(self) -> None:
+        """Record the time accumulated by the hot paths since the last call."""
+        if not self.accumulated:
+            return
+        with self.lock:
+            self.events.append(
+                {
+                    "name": "hot paths (ms)",
+                    "ph": "C",
+                    "ts": (perf_counter() - self.origin) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {
+                        name: total * 1e3
+                        for name, (total, _) in self.accumulated.items()
+                    },
+                }
+            )
+            for name, (total, count) in self.accumulated.items():
+                self.stats.setdefault(name, SpanStats()).add(total, count)
+        self.accumulated = {}
+
+    def summary(self) -> dict[str, SpanStats]:
+        """The aggregated durations of every recorded name."""
+        self.flush_accumulated()
+        with self.lock:
+            return {
+                name: SpanStats(**asdict(stats)) for name, stats in self.stats.items()
+            }
+
+    def summary_table(self) -> Table:
+        """The summary as a table, sorted by total time."""
+        table = Table("Name", "Calls", "Total (s)", "Mean (ms)", "Max (ms)")
+        stats = sorted(self.summary().items(), key=lambda item: -item[1].total)
+        for name, span in stats:
+            table.add_row(
+                name,
+                str(span.count),
+                f"{span.total:.3f}",
+                f"{span.mean * 1e3:.3f}",
+                f"{span.max * 1e3:.3f}",
+            )
+        return table
+
+    def write_chrome_trace(self, path: StrPath) -> None:
+        """Write the recorded events in the Chrome trace event format."""
+        self.flush_accumulated()
+        with self.lock:
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": thread_id,
+                    "args": {"name": name},
+                }
+                for thread_id, name in self.thread_names.items()
+            ]
+            events = metadata + self.events
+        with Path(path).open("w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    def write_summary(self, path: StrPath) -> None:
+        """Write the summary as JSON, see :func:`load_summary`."""
+        summary = {name: asdict(stats) for name, stats in self.summary().items()}
+        with Path(path).open("w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2, sort_keys=True)
+
+    def report(self, scene_name: str) -> None:
+        """Write the trace and the summary of a scene and print the summary."""
+        log_dir = Path(config.get_dir("log_dir"))
+        log_dir.mkdir(parents=True, exist_ok=True)
+        trace_path = log_dir / f"{scene_name}_profile.json"
+        self.write_chrome_trace(trace_path)
+        self.write_summary(log_dir / f"{scene_name}_profile_summary.json")
+        console.print(self.summary_table())
+        logger.info("Profile written to %(path)s", {"path": f"'{trace_path}'"})
+
+
+profiler = RenderProfiler()
+
+
+@contextmanager
+def profile() -> Iterator[RenderProfiler]:
+    """Record the renders within a ``with`` block.
+
+    Yields
+    ------
+    :class:`RenderProfiler`
+        The profiler, reset when entering the block.
+    """
+    enabled = profiler.enabled
+    profiler.reset()
+    profiler.enabled = True
+    try:
+        yield profiler
+    finally:
+        profiler.enabled = enabled
+
+
+def load_summary(path: StrPath) -> dict[str, SpanStats]:
+    """Load a summary written by :meth:`RenderProfiler.write_summary`."""
+    with Path(path).open(encoding="utf-8") as file:
+        return {name: SpanStats(**stats) for name, stats in json.load(file).items()}
+
+
+def find_regressions(
+    baseline: dict[str, SpanStats],
+    current: dict[str, SpanStats],
+    threshold: float = 0.1,
+    min_total: float = 0.01,
+) -> list[tuple[str, float, float]]:
+    """Compare two summaries.
+
+    Parameters
+    ----------
+    baseline
+        The summary of a reference render.
+    current
+        The summary of the render to check.
+    threshold
+        The relative increase of the total time above which a name regressed.
+    min_total
+        Names taking less seconds in both renders are ignored, their timings
+        are dominated by noise.
+
+    Returns
+    -------
+    list[tuple[str, float, float]]
+        The name, the baseline total and the current total of every
+        regression.
+
+    Examples
+    --------
+    ::
+
+        >>> find_regressions(
+        ...     {"frame": SpanStats(10, 1.0, 0.2)}, {"frame": SpanStats(10, 1.5, 0.3)}
+        ... )
+        [('frame', 1.0, 1.5)]
+    """
+    regressions = []
+    for name, stats in current.items():
+        reference = baseline.get(name)
+        if reference is None or max(reference.total, stats.total) < min_total:
+            continue
+        if stats.total > reference.total * (1 + threshold):
+            regressions.append((name, reference.total, stats.total))
+    return regressions
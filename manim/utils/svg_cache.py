@@ -0,0 +1,252 @@
+"""A cache of the mobjects imported from SVG files, shared between renders.
+
+Importing an SVG file means parsing its XML, its paths and its styles, which
+dominates the startup of scenes using many :class:`~.Text`, :class:`~.Tex`
+or :class:`~.SVGMobject` instances. The points and the style arrays of the
+submobjects of an imported :class:`~.SVGMobject` are therefore saved in the
+``svg_cache_dir`` of the config, packed in one ``.npy`` file per SVG, which
+later imports -- by the same process or by any other render -- memory-map
+instead of parsing the SVG file again. Every submobject then copies its own
+slices of the mapped file. Only SVG files whose submobjects are all plain
+vectorized mobjects are saved, since the points and the style don't describe
+the state of the other classes, like the radius of a :class:`~.Circle`.
+
+Entries are addressed by a digest of the inputs of the import and of the
+version of Manim, so that entries written by another version are never
+used. Every hit refreshes the modification time of its file, and at the end
+of every scene the least recently used entries are evicted once the
+directory is larger than ``config.svg_cache_max_size``. The number of hits
+and misses of the scene is logged at that point.
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from manim import __version__
+
+from .. import config, logger
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from manim.typing import StrPath
+
+__all__ = ["SVGCache"]
+
+MIB = 1024 * 1024
+
+# Bumped whenever the layout of the entries changes.
+FORMAT_VERSION = 4
+
+
+class SVGCache:
+    """A directory of imported SVG files, shared by all renders.
+
+    Every entry is a one-dimensional ``.npy`` array holding the number of
+    submobjects, the number of style attributes of every submobject, the
+    index after the last point of every submobject, the index after the last
+    value of every style attribute of every submobject, the points of all
+    submobjects and the values of all style attributes.
+
+    Parameters
+    ----------
+    directory
+        The directory holding the entries.
+    max_size
+        The size in bytes above which the least recently used entries are
+        evicted by :meth:`prune`. ``None`` for no limit.
+
+    Attributes
+    ----------
+    hits : int
+        The number of entries found since the last :meth:`report`.
+    misses : int
+        The number of entries missing since the last :meth:`report`.
+    """
+
+    _current: SVGCache | None = None
+
+    def __init__(self, directory: StrPath, max_size: int | None = None) -> None:
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls) -> Self | None:
+        """The cache configured by ``config.svg_cache_dir``.
+
+        The same instance is returned as long as the configuration doesn't
+        change, so that its counters cover all imports.
+
+        Returns
+        -------
+        :class:`SVGCache` | None
+            The cache, or ``None`` if ``svg_cache_dir`` is empty.
+        """
+        directory = config.get_dir("svg_cache_dir")
+        if directory is None:
+            return None
+        max_size = config.svg_cache_max_size
+        budget: int | None = None if max_size == float("inf") else int(max_size * MIB)
+        current = cls._current
+        if (
+            not isinstance(current, cls)
+            or current.directory != directory.expanduser()
+            or current.max_size != budget
+        ):
+            current = cls._current = cls(directory, budget)
+        return current
+
+    @staticmethod
+    def make_key(seed: bytes) -> str:
+        """Compute the address of an entry from the inputs of the import."""
+        digest = hashlib.blake2b(seed, digest_size=16)
+        digest.update(f"{__version__}/{FORMAT_VERSION}".encode())
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+
+    def load(
+        self, key: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """Read an entry.
+
+        The points and the style values are read-only views of the mapped
+        file, which only pages in the parts that are copied from them.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None
+            The points of all submobjects, the index after the last point of
+            every submobject, the values of the style attributes of all
+            submobjects, and the index after the last value of every style
+            attribute of every submobject, with one row per submobject. ``None``
+            if there is no valid entry for ``key``.
+        """
+        path = self._path_for(key)
+        try:
+            entry = self._unpack(np.asarray(np.load(path, mmap_mode="r")))
+        except (OSError, ValueError):
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # The modification time tells the least recently used entries.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    @staticmethod
+    def _unpack(
+        data: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        if data.ndim != 1 or len(data) < 2:
+            return None
+        n_mobjects = int(data[0])
+        n_attributes = int(data[1])
+        ends_end = 2 + n_mobjects
+        points_start = ends_end + n_mobjects * n_attributes
+        if n_mobjects < 0 or n_attributes < 0 or len(data) < points_start:
+            return None
+        ends = data[2:ends_end].astype(int)
+        style_ends = data[ends_end:points_start].astype(int)
+        n_points = int(ends[-1]) if n_mobjects else 0
+        n_values = int(style_ends[-1]) if len(style_ends) else 0
+        styles_start = points_start + 3 * n_points
+        if len(data) != styles_start + n_values:
+            return None
+        return (
+            data[points_start:styles_start].reshape(-1, 3),
+            ends,
+            data[styles_start:],
+            style_ends.reshape(n_mobjects, n_attributes),
+        )
+
+    def store(
+        self,
+        key: str,
+        points: np.ndarray,
+        ends: np.ndarray,
+        styles: np.ndarray,
+        style_ends: np.ndarray,
+    ) -> None:
+        """Add an entry, see :meth:`load` for the arrays."""
+        data = np.concatenate(
+            [
+                style_ends.shape,
+                ends,
+                style_ends.ravel(),
+                points.ravel(),
+                styles,
+            ]
+        )
+        path = self._path_for(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Renders running at the same time may write the same entry, so it
+        # is only moved into place once complete.
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as file:
+            np.save(file, data.astype(float))
+        os.replace(tmp, path)
+
+    def prune(self, max_size: int | None = None) -> tuple[int, int]:
+        """Evict the least recently used entries until the cache fits the budget.
+
+        Parameters
+        ----------
+        max_size
+            The budget in bytes, defaults to the one of the cache.
+
+        Returns
+        -------
+        tuple[int, int]
+            The number of evicted entries and the number of freed bytes.
+        """
+        if max_size is None:
+            max_size = self.max_size
+        if max_size is None:
+            return 0, 0
+        entries = []
+        for path in self.directory.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                # Evicted by another render.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        excess = sum(size for _, size, _ in entries) - max_size
+        evicted = freed = 0
+        for _, size, path in sorted(entries):
+            if freed >= excess:
+                break
+            path.unlink(missing_ok=True)
+            evicted += 1
+            freed += size
+        return evicted, freed
+
+    def report(self) -> None:
+        """Log the hits and misses since the last call and prune the cache."""
+        if self.hits or self.misses:
+            logger.info(
+                "SVG cache: %(hits)s hit(s), %(misses)s miss(es)",
+                {"hits": self.hits, "misses": self.misses},
+            )
+        self.hits = self.misses = 0
+        evicted, freed = self.prune()
+        if evicted:
+            logger.info(
+                "The SVG cache exceeded its budget. Therefore, manim has removed "
+                "%(n)s least recently used imported SVG file(s) (%(size)s MiB).",
+                {"n": evicted, "size": f"{freed / MIB:.1f}"},
+            )
@@ -54,6 +54,11 @@ class TexTemplate:
     post_doc_commands: str = ""
     r"""Text (definitions, commands) to be inserted at right after ``\begin{document}``, e.g. ``\boldmath``."""
 
+    precompile_preamble: bool = True
+    r"""Whether the preamble is compiled once into a format file, which later compilations load instead of
+    processing the preamble again. Only used with ``latex`` and ``pdflatex``, and if the ``mylatexformat`` package
+    is installed."""
+
     @property
     def body(self) -> str:
         """The entire TeX template."""
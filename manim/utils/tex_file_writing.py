@@ -9,19 +9,35 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 import subprocess
+import threading
 import unicodedata
 from collections.abc import Generator, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from re import Match
 from typing import Any
 
-from manim.utils.tex import TexTemplate
+from manim.utils.tex import _BEGIN_DOCUMENT, _END_DOCUMENT, TexTemplate
 
 from .. import config, logger
 
-__all__ = ["tex_to_svg_file"]
+__all__ = ["tex_to_svg_file", "tex_to_svg_files"]
+
+# The environment turned into a page of the document typesetting a batch.
+_BATCH_PAGE_ENVIRONMENT = "manimbatchpage"
+
+# The smallest number of expressions worth a LaTeX run of its own.
+_MIN_BATCH_SIZE = 16
+
+# The compilers whose preamble can be dumped into a format file.
+_FORMAT_COMPILERS = {"latex", "pdflatex"}
+
+# The format files which were built, None for those which could not be.
+_tex_formats: dict[Path, Path | None] = {}
+_tex_formats_lock = threading.Lock()
 
 
 def tex_hash(expression: Any) -> str:
@@ -66,6 +82,7 @@ def tex_to_svg_file(
         tex_file,
         tex_template.tex_compiler,
         tex_template.output_format,
+        get_tex_format(tex_template),
     )
     svg_file = convert_to_svg(dvi_file, tex_template.output_format)
     if not config["no_latex_cleanup"]:
@@ -73,6 +90,177 @@ def tex_to_svg_file(
     return svg_file
 
 
+def tex_to_svg_files(
+    expressions: Iterable[str],
+    environment: str | None = None,
+    tex_template: TexTemplate | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    r"""Takes several tex expressions and returns the svg versions of the compiled tex,
+    like :func:`tex_to_svg_file` does for one expression.
+
+    Instead of starting LaTeX and dvisvgm for every expression, the expressions
+    which have not been compiled yet are typeset as the pages of one document,
+    which is compiled by a single LaTeX run and converted by a single dvisvgm
+    call. Large batches are split between several runs working in parallel.
+
+    Batching requires a template using the ``standalone`` document class with
+    the ``preview`` option, like the default one. Otherwise, or if the batch
+    fails to compile, the expressions are compiled one by one, so that errors
+    are reported for the expression causing them.
+
+    Parameters
+    ----------
+    expressions
+        Strings containing the TeX expressions to be rendered, e.g. ``\\sqrt{2}`` or ``foo``
+    environment
+        The string containing the environment in which the expressions should be typeset, e.g. ``align*``
+    tex_template
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+    max_workers
+        The maximal number of LaTeX runs working in parallel, defaults to the number of CPUs.
+
+    Returns
+    -------
+    list[:class:`Path`]
+        Paths to generated SVG files, in the order of ``expressions``.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    expressions = list(expressions)
+    tex_files = [
+        generate_tex_file(expression, environment, tex_template)
+        for expression in expressions
+    ]
+    pending = [
+        tex_file
+        for tex_file in dict.fromkeys(tex_files)
+        if not tex_file.with_suffix(".svg").exists()
+    ]
+    if len(pending) > 1 and _supports_batching(tex_template):
+        n_batches = min(
+            max_workers or os.cpu_count() or 1, len(pending) // _MIN_BATCH_SIZE
+        )
+        if n_batches > 1:
+            batches = [pending[i::n_batches] for i in range(n_batches)]
+            with ThreadPoolExecutor(max_workers=n_batches) as pool:
+                # The work is done by the LaTeX and dvisvgm processes, so
+                # threads are enough to run the batches in parallel.
+                list(pool.map(_compile_batch, batches, [tex_template] * n_batches))
+        else:
+            _compile_batch(pending, tex_template)
+        if not config["no_latex_cleanup"]:
+            delete_nonsvg_files()
+
+    # Whatever was not compiled by a batch is compiled on its own.
+    return [
+        tex_to_svg_file(expression, environment, tex_template)
+        for expression in expressions
+    ]
+
+
+def _supports_batching(tex_template: TexTemplate) -> bool:
+    preamble, begin, document = tex_template.body.partition(_BEGIN_DOCUMENT)
+    return (
+        bool(begin)
+        and tex_template.placeholder_text not in preamble
+        and tex_template.placeholder_text in document
+        and re.search(
+            r"\\documentclass\[[^\]]*\bpreview\b[^\]]*\]\{standalone\}", preamble
+        )
+        is not None
+    )
+
+
+def _compile_batch(tex_files: Sequence[Path], tex_template: TexTemplate) -> None:
+    """Compiles the expressions of ``tex_files`` as the pages of one document,
+    and moves the SVG file of every page where :func:`tex_to_svg_file` expects it.
+
+    Nothing is raised if the batch fails, its expressions are left uncompiled.
+    """
+    preamble = tex_template.body.partition(_BEGIN_DOCUMENT)[0]
+    pages = []
+    for tex_file in tex_files:
+        document = tex_file.read_text(encoding="utf-8")[len(preamble) :]
+        content = document.removeprefix(_BEGIN_DOCUMENT).rpartition(_END_DOCUMENT)[0]
+        pages.append(
+            f"\\begin{{{_BATCH_PAGE_ENVIRONMENT}}}{content}"
+            f"\\end{{{_BATCH_PAGE_ENVIRONMENT}}}"
+        )
+    # Every page environment is a page of its own, cropped like the document
+    # of a single expression.
+    batch_code = "\n".join(
+        [
+            preamble.rstrip(),
+            # Ends the part of the preamble skipped when using a format file.
+            r"\csname endofdump\endcsname",
+            f"\\newenvironment{{{_BATCH_PAGE_ENVIRONMENT}}}{{}}{{}}",
+            f"\\standaloneenv{{{_BATCH_PAGE_ENVIRONMENT}}}",
+            _BEGIN_DOCUMENT,
+            *pages,
+            _END_DOCUMENT,
+        ]
+    )
+    tex_dir = config.get_dir("tex_dir")
+    batch_file = tex_dir / f"{tex_hash(batch_code)}.tex"
+    batch_file.write_text(batch_code, encoding="utf-8")
+    logger.info(
+        "Compiling %(n)s expressions in one batch %(path)s",
+        {"n": len(tex_files), "path": f"{batch_file}"},
+    )
+
+    try:
+        _typeset_batch(batch_file, tex_files, tex_template)
+    finally:
+        if not config["no_latex_cleanup"]:
+            batch_file.unlink()
+
+
+def _typeset_batch(
+    batch_file: Path, tex_files: Sequence[Path], tex_template: TexTemplate
+) -> None:
+    tex_dir = batch_file.parent
+    output_format = tex_template.output_format
+    command = make_tex_compilation_command(
+        tex_template.tex_compiler,
+        output_format,
+        batch_file,
+        tex_dir,
+        get_tex_format(tex_template),
+    )
+    if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+        logger.debug(
+            "Batch %(path)s failed, compiling its expressions one by one.",
+            {"path": f"{batch_file}"},
+        )
+        return
+    command = [
+        "dvisvgm",
+        *(["--pdf"] if output_format == ".pdf" else []),
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={(tex_dir / f'{batch_file.stem}-%p.svg').as_posix()}",
+        f"{batch_file.with_suffix(output_format).as_posix()}",
+    ]
+    subprocess.run(command, stdout=subprocess.DEVNULL)
+
+    svg_pages = sorted(
+        tex_dir.glob(f"{batch_file.stem}-*.svg"),
+        key=lambda path: int(path.stem.rpartition("-")[2]),
+    )
+    if len(svg_pages) != len(tex_files):
+        logger.debug(
+            "Batch %(path)s produced %(pages)s pages for %(n)s expressions.",
+            {"path": f"{batch_file}", "pages": len(svg_pages), "n": len(tex_files)},
+        )
+        for svg_page in svg_pages:
+            svg_page.unlink()
+        return
+    for svg_page, tex_file in zip(svg_pages, tex_files, strict=True):
+        os.replace(svg_page, tex_file.with_suffix(".svg"))
+
+
 def generate_tex_file(
     expression: str,
     environment: str | None = None,
@@ -117,7 +305,11 @@ def generate_tex_file(
 
 
 def make_tex_compilation_command(
-    tex_compiler: str, output_format: str, tex_file: Path, tex_dir: Path
+    tex_compiler: str,
+    output_format: str,
+    tex_file: Path,
+    tex_dir: Path,
+    tex_format: Path | None = None,
 ) -> list[str]:
     """Prepares the TeX compilation command, i.e. the TeX compiler name
     and all necessary CLI flags.
@@ -132,6 +324,8 @@ def make_tex_compilation_command(
         File name of TeX file to be typeset.
     tex_dir
         Path to the directory where compiler output will be stored.
+    tex_format
+        Path to a format file with the precompiled preamble of the TeX file, see :func:`get_tex_format`.
 
     Returns
     -------
@@ -141,6 +335,7 @@ def make_tex_compilation_command(
     if tex_compiler in {"latex", "pdflatex", "luatex", "lualatex"}:
         command = [
             tex_compiler,
+            *([f"-fmt={tex_format.as_posix()}"] if tex_format is not None else []),
             "-interaction=batchmode",
             f"-output-format={output_format[1:]}",
             "-halt-on-error",
@@ -167,6 +362,101 @@ def make_tex_compilation_command(
     return command
 
 
+def get_tex_format(tex_template: TexTemplate) -> Path | None:
+    """Returns a format file with the precompiled preamble of a template,
+    building it on first use.
+
+    Loading the format file instead of processing the preamble, with all its
+    packages, takes a fraction of the time of the compilation of a short
+    expression. The format file is built with the ``mylatexformat`` package and
+    kept in the ``tex_dir``, addressed by the compiler and the preamble.
+
+    Parameters
+    ----------
+    tex_template
+        The template whose preamble is precompiled.
+
+    Returns
+    -------
+    :class:`Path` | None
+        Path to the format file, or ``None`` if the template does not use one,
+        because :attr:`.TexTemplate.precompile_preamble` is disabled or the
+        compiler can't dump formats, or if it could not be built.
+    """
+    preamble, begin, document = tex_template.body.partition(_BEGIN_DOCUMENT)
+    if (
+        not tex_template.precompile_preamble
+        or tex_template.tex_compiler not in _FORMAT_COMPILERS
+        or not begin
+        or tex_template.placeholder_text in preamble
+    ):
+        return None
+    tex_dir = config.get_dir("tex_dir")
+    result = tex_dir / (tex_hash(f"{tex_template.tex_compiler}\n{preamble}") + ".fmt")
+    with _tex_formats_lock:
+        if result.exists():
+            return result
+        if result not in _tex_formats:
+            _tex_formats[result] = _build_tex_format(
+                result, preamble, tex_template.tex_compiler
+            )
+        return _tex_formats[result]
+
+
+def _build_tex_format(result: Path, preamble: str, tex_compiler: str) -> Path | None:
+    tex_dir = result.parent
+    if not tex_dir.exists():
+        tex_dir.mkdir()
+
+    # Renders running at the same time may build the same format, so it is
+    # only moved into place once complete.
+    job_name = f"{result.stem}-{os.getpid()}"
+    source = tex_dir / f"{job_name}.tex"
+    source.write_text(
+        "\n".join([preamble.rstrip(), _BEGIN_DOCUMENT, _END_DOCUMENT]),
+        encoding="utf-8",
+    )
+    logger.info(
+        "Precompiling the preamble of %(path)s",
+        {"path": f"{source}"},
+    )
+    command = [
+        tex_compiler,
+        "-ini",
+        f"-jobname={job_name}",
+        "-interaction=batchmode",
+        "-halt-on-error",
+        f"-output-directory={tex_dir.as_posix()}",
+        f"&{tex_compiler}",
+        "mylatexformat.ltx",
+        f"{source.as_posix()}",
+    ]
+    cp = subprocess.run(command, stdout=subprocess.DEVNULL)
+    dump = source.with_suffix(".fmt")
+    if not config["no_latex_cleanup"]:
+        source.unlink()
+    if cp.returncode != 0 or not dump.exists():
+        logger.debug(
+            "Could not precompile the preamble with %(compiler)s, "
+            "compiling it with every expression instead.",
+            {"compiler": tex_compiler},
+        )
+        dump.unlink(missing_ok=True)
+        return None
+    os.replace(dump, result)
+    return result
+
+
+def _discard_tex_format(tex_format: Path) -> None:
+    logger.debug(
+        "Discarding the format file %(path)s, which failed to compile.",
+        {"path": f"{tex_format}"},
+    )
+    with _tex_formats_lock:
+        _tex_formats[tex_format] = None
+        tex_format.unlink(missing_ok=True)
+
+
 def insight_inputenc_error(matching: Match[str]) -> Generator[str]:
     code_point = chr(int(matching[1], 16))
     name = unicodedata.name(code_point)
@@ -179,7 +469,12 @@ def insight_package_not_found_error(matching: Match[str]) -> Generator[str]:
     yield f"Install {matching[1]} it using your LaTeX package manager, or check for typos."
 
 
-def compile_tex(tex_file: Path, tex_compiler: str, output_format: str) -> Path:
+def compile_tex(
+    tex_file: Path,
+    tex_compiler: str,
+    output_format: str,
+    tex_format: Path | None = None,
+) -> Path:
     """Compiles a tex_file into a .dvi or a .xdv or a .pdf
 
     Parameters
@@ -190,6 +485,9 @@ def compile_tex(tex_file: Path, tex_compiler: str, output_format: str) -> Path:
         String containing the compiler to be used, e.g. ``pdflatex`` or ``lualatex``
     output_format
         String containing the output format generated by the compiler, e.g. ``.dvi`` or ``.pdf``
+    tex_format
+        Path to a format file with the precompiled preamble of the TeX file, see :func:`get_tex_format`.
+        If the compilation fails with the format file but succeeds without it, the format file is discarded.
 
     Returns
     -------
@@ -204,8 +502,20 @@ def compile_tex(tex_file: Path, tex_compiler: str, output_format: str) -> Path:
             output_format,
             tex_file,
             tex_dir,
+            tex_format,
         )
         cp = subprocess.run(command, stdout=subprocess.DEVNULL)
+        if cp.returncode != 0 and tex_format is not None:
+            command = make_tex_compilation_command(
+                tex_compiler,
+                output_format,
+                tex_file,
+                tex_dir,
+            )
+            cp = subprocess.run(command, stdout=subprocess.DEVNULL)
+            if cp.returncode == 0:
+                # The error came from the format file, not from the TeX file.
+                _discard_tex_format(tex_format)
         if cp.returncode != 0:
             log_file = tex_file.with_suffix(".log")
             print_all_tex_errors(log_file, tex_compiler, tex_file)
@@ -261,7 +571,7 @@ def convert_to_svg(dvi_file: Path, extension: str, page: int = 1) -> Path:
 
 
 def delete_nonsvg_files(additional_endings: Iterable[str] = ()) -> None:
-    """Deletes every file that does not have a suffix in ``(".svg", ".tex", *additional_endings)``
+    """Deletes every file that does not have a suffix in ``(".svg", ".tex", ".fmt", *additional_endings)``
 
     Parameters
     ----------
@@ -269,7 +579,7 @@ def delete_nonsvg_files(additional_endings: Iterable[str] = ()) -> None:
         Additional endings to whitelist
     """
     tex_dir = config.get_dir("tex_dir")
-    file_suffix_whitelist = {".svg", ".tex", *additional_endings}
+    file_suffix_whitelist = {".svg", ".tex", ".fmt", *additional_endings}
 
     for f in tex_dir.iterdir():
         if f.suffix not in file_suffix_whitelist:
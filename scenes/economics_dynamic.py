@@ -38,7 +38,7 @@ class MicroOptimization(Scene):
             x2 = budget_func(x1)
             return axes.c2p(x1, x2)
 
-        probe_dot = always_redraw(lambda: Dot(get_probe_coords(), color=YELLOW, radius=0.12))
+        probe_dot = always_redraw(lambda: Dot(get_probe_coords(), color=YELLOW, radius=0.12), memoize=True)
 
         # Dynamic Indifference Curve passing through the probe
         def get_ic_graph():
@@ -52,7 +52,7 @@ class MicroOptimization(Scene):
                 color=BLUE_C
             )
         
-        ic_curve = always_redraw(get_ic_graph)
+        ic_curve = always_redraw(get_ic_graph, memoize=True)
 
         # --- 4. Gradient Engines (The Vectors) ---
         
@@ -62,7 +62,7 @@ class MicroOptimization(Scene):
             start=get_probe_coords(),
             end=get_probe_coords() + np.array([0.5, 0.5, 0]) * 1.5, # Scale for visibility
             color=GREEN, buff=0, tip_length=0.2
-        ))
+        ), memoize=True)
         
         # Utility Gradient Vector (MRS direction)
         # Gradient of U=xy is (y, x). At (x1, x2), vector points (x2, x1).
@@ -70,7 +70,7 @@ class MicroOptimization(Scene):
             start=get_probe_coords(),
             end=get_probe_coords() + self.get_gradient_vec(t_tracker.get_value()) * 0.8, # Scale
             color=RED, buff=0, tip_length=0.2
-        ))
+        ), memoize=True)
 
         self.play(Create(ic_curve), FadeIn(probe_dot))
         self.play(GrowArrow(price_vector), GrowArrow(util_vector))
@@ -267,15 +267,15 @@ class SurplusDynamics(Scene):
         # --- 3. Dynamic Visuals ---
         
         # Curves
-        demand_curve = always_redraw(lambda: axes.plot(
+        demand_curve = axes.plot(
             lambda q: a.get_value() - b * q, 
-            x_range=[0, 10], color=BLUE
-        ))
+            x_range=[0, 10], color=BLUE, use_vectorized=True
+        ).add_updater(lambda g: g.replot())
         
-        supply_curve = always_redraw(lambda: axes.plot(
+        supply_curve = axes.plot(
             lambda q: c.get_value() + d * q, 
-            x_range=[0, 10], color=RED
-        ))
+            x_range=[0, 10], color=RED, use_vectorized=True
+        ).add_updater(lambda g: g.replot())
 
         # Equilibrium Dot & Dashed Lines
         def get_eq_group():
@@ -293,7 +293,7 @@ class SurplusDynamics(Scene):
             
             return VGroup(dot, line_h, line_v, lbl_p, lbl_q)
 
-        eq_group = always_redraw(get_eq_group)
+        eq_group = always_redraw(get_eq_group, memoize=True)
 
         # Surplus Areas (Polygons)
         # CS: Triangle (0, a), (Q*, P*), (0, P*)
@@ -320,18 +320,18 @@ class SurplusDynamics(Scene):
             ]
             return Polygon(*points, color=RED, fill_opacity=0.3, stroke_width=0)
             
-        cs_poly = always_redraw(get_cs_area)
-        ps_poly = always_redraw(get_ps_area)
+        cs_poly = always_redraw(get_cs_area, memoize=True)
+        ps_poly = always_redraw(get_ps_area, memoize=True)
         
         # Labels for Areas
         cs_label = always_redraw(lambda: Text("CS", font_size=20, color=BLUE).move_to(
             axes.c2p(get_eq()[0]/3, (a.get_value() + get_eq()[1])/2) 
             # Simple heuristic position
-        ))
+        ), memoize=True)
         
         ps_label = always_redraw(lambda: Text("PS", font_size=20, color=RED).move_to(
             axes.c2p(get_eq()[0]/3, (c.get_value() + get_eq()[1])/2)
-        ))
+        ), memoize=True)
 
         # --- 4. Animation Sequence ---
         self.play(Create(axes), Write(labels))
@@ -405,10 +405,10 @@ class TaxWelfareScene(Scene):
         supply_curve = axes.plot(lambda q: c + d*q, x_range=[0, 9], color=GREY, stroke_opacity=0.5)
         
         # Dynamic Effective Supply Curve (S + Tax)
-        eff_supply_curve = always_redraw(lambda: axes.plot(
+        eff_supply_curve = axes.plot(
             lambda q: c + d*q + tax.get_value(),
-            x_range=[0, 9], color=RED
-        ))
+            x_range=[0, 9], color=RED, use_vectorized=True
+        ).add_updater(lambda g: g.replot())
         
         # Indicators
         def get_indicators():
@@ -430,7 +430,7 @@ class TaxWelfareScene(Scene):
             
             return VGroup(wedge, dash_c, dash_p, dash_q, lbl_pc, lbl_pp)
             
-        indicators = always_redraw(get_indicators)
+        indicators = always_redraw(get_indicators, memoize=True)
 
         # Areas (DWL & Revenue)
         
@@ -448,7 +448,7 @@ class TaxWelfareScene(Scene):
             ]
             return Polygon(*points, color=GREY, fill_opacity=0.5, stroke_width=0)
             
-        dwl_poly = always_redraw(get_dwl)
+        dwl_poly = always_redraw(get_dwl, memoize=True)
         
         # Tax Revenue Rectangle
         # (0, Pc) -> (Q, Pc) -> (Q, Pp) -> (0, Pp)
@@ -462,7 +462,7 @@ class TaxWelfareScene(Scene):
             ]
             return Polygon(*points, color=GREEN, fill_opacity=0.3, stroke_width=0)
             
-        revenue_poly = always_redraw(get_revenue)
+        revenue_poly = always_redraw(get_revenue, memoize=True)
         
         # Text Labels for Areas
         dwl_text = always_redraw(lambda: Text("DWL", font_size=16, color=WHITE).move_to(
@@ -470,11 +470,11 @@ class TaxWelfareScene(Scene):
                 (get_state()[0] + 4)/2 + 0.3, # Slightly right of center of Q space
                 5 # Center P
             )
-        ))
+        ), memoize=True)
         
         rev_text = always_redraw(lambda: Text("Tax Revenue", font_size=20, color=GREEN).move_to(
             axes.c2p(get_state()[0]/2, (get_state()[1] + get_state()[2])/2)
-        ))
+        ), memoize=True)
 
         # 4. Animation
         self.play(Create(axes), Write(labels))
@@ -23,8 +23,9 @@ class QuadraticScene(Scene):
             return a.get_value() * x**2
 
         # 3. Create Curve
-        # plot uses the tracker value dynamically
-        graph = always_redraw(lambda: axes.plot(quad_func, color=BLUE, x_range=[-3, 3]))
+        # replot evaluates quad_func again, using the current tracker value
+        graph = axes.plot(quad_func, color=BLUE, x_range=[-3, 3], use_vectorized=True)
+        graph.add_updater(lambda g: g.replot())
         
         # 4. Labels
         func_label = always_redraw(lambda: Text(
@@ -0,0 +1,85 @@
+"""Compare copying mobjects which share their arrays with eager copies.
+
+Both are measured once with only the copy made, and once with the original
+and the copy shifted afterwards, which accesses the arrays of both.
+
+usage: python scripts/benchmark_copy.py [number_of_glyphs]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+from timeit import default_timer
+
+from manim import RIGHT, Circle, SVGMobject, Text, VGroup, tempconfig
+
+SVG_FILE = Path(__file__).parents[1] / "logo" / "dark" / "dark_background.svg"
+
+
+def eager_copy(mobject):
+    """Copy ``mobject`` and access all its arrays, as before they were shared."""
+    result = mobject.copy()
+    for mob in result.get_family():
+        for attr in ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            getattr(mob, attr, None)
+    return result
+
+
+def copy_and_shift_both(copy_func, mobject):
+    """Copy ``mobject`` with ``copy_func`` and modify both the copy and ``mobject``."""
+    result = copy_func(mobject)
+    mobject.shift(RIGHT)
+    result.shift(RIGHT)
+    return result
+
+
+def shared_copy(mobject):
+    return mobject.copy()
+
+
+def measure(func, *args, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        func(*args)
+        times.append(default_timer() - start)
+    return min(times)
+
+
+def measure_memory(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempconfig({"disable_caching_warning": True}):
+        mobjects = {
+            f"Text, {n} glyphs": Text("manim " * (n // 5)),
+            "SVGMobject": SVGMobject(SVG_FILE),
+            f"VGroup of {n} circles": VGroup(*(Circle() for _ in range(n))),
+        }
+
+    scenarios = {
+        "copy": lambda copy_func, mobject: copy_func(mobject),
+        "copy, shift both": copy_and_shift_both,
+    }
+    print(f"{'':40}{'shared':>20}{'eager':>20}")
+    for name, mobject in mobjects.items():
+        for label, scenario in scenarios.items():
+            row = f"{name + ', ' + label:40}"
+            for copy_func in (shared_copy, eager_copy):
+                time = measure(scenario, copy_func, mobject)
+                memory = measure_memory(scenario, copy_func, mobject)
+                row += f"{time * 1000:9.1f} ms{memory / 2**20:7.1f} MiB"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare the speed of the play-call hashing with the former JSON encoder.
+
+usage: python scripts/benchmark_hashing.py [number_of_arrows]
+"""
+
+from __future__ import annotations
+
+import sys
+import zlib
+from timeit import default_timer
+
+import numpy as np
+
+from manim import ArrowVectorField, Camera, Create, Square, tempconfig
+from manim.utils import hashing
+
+
+def json_hash(camera, animations, mobjects):
+    """The play-call hashing before the structural hasher."""
+    hashing._Memoizer.reset_already_processed()
+    hashes = [
+        zlib.crc32(repr(json_val).encode())
+        for json_val in [
+            hashing.get_json(camera),
+            [hashing.get_json(x) for x in animations],
+            [hashing.get_json(x) for x in mobjects],
+        ]
+    ]
+    hashing._Memoizer.reset_already_processed()
+    return "_".join(map(str, hashes))
+
+
+def structural_hash(camera, animations, mobjects):
+    hasher = hashing._StructuralHasher()
+    return "_".join(
+        hasher.hexdigest(obj) for obj in [camera, list(animations), list(mobjects)]
+    )
+
+
+def measure(func, *args, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        func(*args)
+        times.append(default_timer() - start)
+    return min(times)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    with tempconfig({"disable_caching_warning": True}):
+        camera = Camera()
+        # A dense field like in MacroSaddlePath, plus a small animated mobject.
+        field = ArrowVectorField(
+            lambda p: np.array([p[1], -p[0], 0]),
+            x_range=[-7, 7, 14 / n],
+            y_range=[-4, 4, 8 / n],
+        )
+        square = Square()
+        animations = [Create(square)]
+        mobjects = [field, square]
+        n_family = len(field.get_family())
+
+        json_time = measure(json_hash, camera, animations, mobjects)
+        structural_time = measure(structural_hash, camera, animations, mobjects)
+
+    print(f"Hashing a play with {n_family} mobjects:")
+    print(f"  JSON encoder:      {json_time * 1000:9.1f} ms")
+    print(f"  structural hasher: {structural_time * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
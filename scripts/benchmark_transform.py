@@ -0,0 +1,44 @@
+"""Compare interpolating the families of a Transform at once with interpolating
+them submobject by submobject.
+
+usage: python scripts/benchmark_transform.py [number_of_submobjects]
+"""
+
+from __future__ import annotations
+
+import sys
+from timeit import default_timer
+
+import numpy as np
+
+from manim import Circle, Square, Transform, VGroup, tempconfig
+
+
+def measure(batch, n, lag_ratio, frames=60):
+    Transform._batch_interpolation = batch
+    source = VGroup(*(Circle() for _ in range(n))).arrange_in_grid()
+    target = VGroup(*(Square() for _ in range(n))).arrange_in_grid()
+    anim = Transform(source, target, lag_ratio=lag_ratio)
+    anim.begin()
+    start = default_timer()
+    for alpha in np.linspace(0, 1, frames, endpoint=False):
+        anim.interpolate(alpha)
+    return (default_timer() - start) / frames
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{'':24}{'packed':>12}{'per submobject':>18}")
+    with tempconfig({"disable_caching_warning": True}):
+        for lag_ratio in (0, 0.1):
+            packed = measure(True, n, lag_ratio)
+            loop = measure(False, n, lag_ratio)
+            print(
+                f"{n} circles, lag {lag_ratio:<5}{packed * 1000:9.2f} ms"
+                f"{loop * 1000:15.2f} ms"
+            )
+    Transform._batch_interpolation = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare creating the vectors of an ArrowVectorField at once with creating
+them one by one.
+
+usage: python scripts/benchmark_vector_field.py [step]
+"""
+
+from __future__ import annotations
+
+import sys
+from timeit import default_timer
+
+import numpy as np
+
+from manim import LEFT, UR, ArrowVectorField, tempconfig
+
+
+def func(pos):
+    return ((pos[0] * UR + pos[1] * LEFT) - pos) / 3
+
+
+def main():
+    step = float(sys.argv[1]) if len(sys.argv) > 1 else 0.25
+    with tempconfig({"disable_caching_warning": True}):
+        vector_field = ArrowVectorField(func, x_range=[-1, 1, 1])
+        x_range = np.arange(-7, 7 + step, step)
+        y_range = np.arange(-4, 4 + step, step)
+        points = np.array([[x, y, 0] for x in x_range for y in y_range])
+
+        start = default_timer()
+        vector_field.get_vectors(points)
+        at_once = default_timer() - start
+        start = default_timer()
+        [vector_field.get_vector(point) for point in points]
+        one_by_one = default_timer() - start
+    print(
+        f"{len(points)} vectors: {at_once * 1000:.0f} ms at once, "
+        f"{one_by_one * 1000:.0f} ms one by one"
+    )
+
+
+if __name__ == "__main__":
+    main()
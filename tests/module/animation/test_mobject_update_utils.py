@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import Circle, Dot, Square, ValueTracker, VGroup, always_redraw
+
+
+def test_always_redraw_memoize_skips_unchanged_inputs():
+    tracker = ValueTracker(1)
+    calls = []
+
+    def build():
+        calls.append(tracker.get_value())
+        return Circle(radius=tracker.get_value())
+
+    circle = always_redraw(build, memoize=True)
+    circle.update()
+    assert calls == [1]
+
+    tracker.set_value(2)
+    circle.update()
+    circle.update()
+    assert calls == [1, 2]
+    assert np.isclose(circle.width, 4)
+
+
+def test_always_redraw_memoize_reuses_cached_mobjects():
+    tracker = ValueTracker(1)
+    calls = []
+
+    def build():
+        calls.append(tracker.get_value())
+        return Circle(radius=tracker.get_value())
+
+    circle = always_redraw(build, memoize=True)
+    for value in (2, 3, 2, 3, 1):
+        tracker.set_value(value)
+        circle.update()
+    assert calls == [1, 2, 3]
+    assert np.isclose(circle.width, 2)
+
+
+def test_always_redraw_memoize_keeps_cached_families():
+    tracker = ValueTracker(1)
+    dots = always_redraw(
+        lambda: VGroup(*(Dot() for _ in range(int(tracker.get_value())))),
+        memoize=True,
+    )
+    redraw = dots.get_updaters()[0].__self__
+    for value in (3, 1, 3, 1):
+        tracker.set_value(value)
+        dots.update()
+    # The cached mobjects are not aligned with the redrawn one.
+    families = sorted(len(mob.get_family()) for mob in redraw.cache.values())
+    assert families == [2, 4]
+
+
+def test_always_redraw_memoize_tracks_referenced_mobjects():
+    square = Square()
+    dot = always_redraw(lambda: Dot(square.get_center()), memoize=True)
+    square.shift([1, 0, 0])
+    dot.update()
+    np.testing.assert_allclose(dot.get_center(), [1, 0, 0])
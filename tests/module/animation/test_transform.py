@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from manim import Circle, ReplacementTransform, Scene, Square, VGroup
+import numpy as np
+
+from manim import (
+    RED,
+    RIGHT,
+    Circle,
+    ReplacementTransform,
+    Scene,
+    Square,
+    Transform,
+    VGroup,
+    VMobject,
+)
+from manim.animation.transform import _is_pointwise_path_func
+from manim.utils.bezier import interpolate
 
 
 def test_no_duplicate_references():
@@ -25,3 +39,75 @@ def test_duplicate_references_in_group():
     submobs = vg.submobjects
     assert len(submobs) == 1
     assert submobs[0] is sq
+
+
+def test_transform_interpolates_packed_families():
+    source = VGroup(*(Circle(radius=r) for r in (1, 2, 3)))
+    target = VGroup(*(Square(side_length=r).set_fill(RED, 0.5) for r in (1, 2, 3)))
+    anim = Transform(source, target, lag_ratio=0.5)
+    anim.begin()
+    families = list(anim.get_all_families_zipped())
+    expected = VMobject()
+    for alpha in (0.3, 0.7):
+        anim.interpolate(alpha)
+        for i, (mob, start, end) in enumerate(families):
+            expected.interpolate(
+                start, end, anim.get_sub_alpha(alpha, i, len(families))
+            )
+            np.testing.assert_allclose(mob.points, expected.points)
+            np.testing.assert_allclose(mob.fill_rgbas, expected.fill_rgbas)
+            assert mob.stroke_width == expected.stroke_width
+
+    anim.finish()
+    for mob, target_mob in zip(source, anim.target_copy, strict=True):
+        np.testing.assert_allclose(mob.points, target_mob.points)
+        assert not np.shares_memory(mob.points, anim._packed_families.points.current)
+
+
+def test_transform_packed_families_survive_copies():
+    source = VGroup(Circle(), Circle(radius=2))
+    target = VGroup(Square(), Square(side_length=3))
+    anim = Transform(source, target)
+    anim.begin()
+    anim.interpolate(0.3)
+    copy = source.copy()
+    points = source[1].points.copy()
+
+    anim.interpolate(0.6)
+    assert not np.allclose(source[1].points, points)
+    np.testing.assert_allclose(copy[1].points, points)
+    expected = VMobject().interpolate(
+        anim.starting_mobject[1], anim.target_copy[1], anim.rate_func(0.6)
+    )
+    np.testing.assert_allclose(source[1].points, expected.points)
+
+
+def test_transform_rebinds_replaced_arrays():
+    source = VGroup(Circle(), Circle(radius=2))
+    anim = Transform(source, VGroup(Square(), Square(side_length=3)))
+    anim.begin()
+    anim.interpolate(0.3)
+    source[0].set_points(source[0].points.copy())
+
+    anim.interpolate(0.6)
+    expected = VMobject().interpolate(
+        anim.starting_mobject[0], anim.target_copy[0], anim.rate_func(0.6)
+    )
+    np.testing.assert_allclose(source[0].points, expected.points)
+
+
+def test_transform_packs_only_pointwise_path_funcs():
+    def centered_path(start_points, end_points, alpha):
+        center = start_points.mean(axis=0)
+        return center + interpolate(start_points - center, end_points - center, alpha)
+
+    assert _is_pointwise_path_func(Transform(Circle(), Square(), path_arc=1).path_func)
+    assert not _is_pointwise_path_func(centered_path)
+    source = VGroup(Circle(), Circle(radius=2).shift(RIGHT))
+    anim = Transform(source, VGroup(Square(), Square()), path_func=centered_path)
+    anim.begin()
+    anim.interpolate(0.5)
+    assert anim._packed_families is None
+    for mob, start, end in anim.get_all_families_zipped():
+        expected = centered_path(start.points, end.points, anim.rate_func(0.5))
+        np.testing.assert_allclose(mob.points, expected)
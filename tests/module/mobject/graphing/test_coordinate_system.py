@@ -15,8 +15,12 @@ from manim import (
     ComplexPlane,
     Dot,
     NumberPlane,
+    ParametricFunction,
     PolarPlane,
+    Rectangle,
     ThreeDAxes,
+    VectorizedPoint,
+    VGroup,
     config,
     tempconfig,
 )
@@ -192,3 +196,140 @@ def test_input_to_graph_point():
     # test the line_graph implementation
     position = np.around(ax.input_to_graph_point(x=PI, graph=line_graph), decimals=4)
     np.testing.assert_array_equal(position, (2.6928, 1.2876, 0))
+
+
+def test_get_riemann_rectangles():
+    ax = Axes(x_range=[0, 4], y_range=[-2, 2])
+    curve = ax.plot(lambda x: np.sin(2 * x))
+    rects = ax.get_riemann_rectangles(curve, x_range=[0, 3], dx=0.5, color="#58C4DD")
+
+    assert len(rects) == 6
+    for x, rect in zip(np.arange(0, 3, 0.5), rects, strict=True):
+        corners = VGroup(
+            VectorizedPoint(ax.c2p(x, 0)),
+            VectorizedPoint(ax.c2p(x + 1.001 * 0.5, 0)),
+            VectorizedPoint(ax.i2gp(x, curve)),
+        )
+        expected = Rectangle().replace(corners, stretch=True)
+        np.testing.assert_allclose(rect.points, expected.points, atol=1e-12)
+    # sin(2x) is negative from x = pi / 2, so the color of the last two
+    # rectangles is inverted.
+    assert rects[3].get_fill_color() == rects[0].get_fill_color()
+    assert rects[4].get_fill_color() != rects[0].get_fill_color()
+
+
+def test_get_riemann_rectangles_of_scalar_functions():
+    ax = Axes(x_range=[0, 4], y_range=[-2, 2])
+    # Neither function supports arrays.
+    curve = ax.plot(lambda x: x / 2 if x < 2 else 1.0)
+    bound = ax.plot(lambda x: max(x - 3, -1.0))
+    rects = ax.get_riemann_rectangles(
+        curve, x_range=[0, 3], dx=0.5, bounded_graph=bound
+    )
+
+    assert len(rects) == 6
+    for x, rect in zip(np.arange(0, 3, 0.5), rects, strict=True):
+        y = max(x - 3, -1.0)
+        corners = VGroup(
+            VectorizedPoint(ax.c2p(x, y)),
+            VectorizedPoint(ax.c2p(x + 1.001 * 0.5, y)),
+            VectorizedPoint(ax.i2gp(x, curve)),
+        )
+        expected = Rectangle().replace(corners, stretch=True)
+        np.testing.assert_allclose(rect.points, expected.points, atol=1e-12)
+
+
+def test_get_riemann_rectangles_in_place():
+    ax = Axes(x_range=[0, 4], y_range=[-2, 2])
+    curve = ax.plot(lambda x: x / 2)
+    other_curve = ax.plot(lambda x: 1 - x / 4)
+    rects = ax.get_riemann_rectangles(curve, x_range=[0, 3], dx=0.5)
+    first_rect = rects[0]
+
+    expected = ax.get_riemann_rectangles(other_curve, x_range=[0, 2], dx=0.5)
+    updated = ax.get_riemann_rectangles(
+        other_curve, x_range=[0, 2], dx=0.5, rectangles=rects
+    )
+    assert updated is rects
+    assert updated[0] is first_rect
+    assert len(updated) == len(expected) == 4
+    for rect, expected_rect in zip(updated, expected, strict=True):
+        np.testing.assert_allclose(rect.points, expected_rect.points)
+
+
+def test_get_area_in_place():
+    ax = Axes(x_range=[0, 4], y_range=[-2, 2])
+    curve = ax.plot(lambda x: x / 2)
+    other_curve = ax.plot(lambda x: np.sin(x))
+    area = ax.get_area(curve, x_range=[0.5, 3])
+
+    expected = ax.get_area(other_curve, x_range=[1, 2], bounded_graph=curve)
+    updated = ax.get_area(other_curve, x_range=[1, 2], bounded_graph=curve, area=area)
+    assert updated is area
+    np.testing.assert_allclose(updated.points, expected.points)
+    np.testing.assert_allclose(updated.points[0], ax.i2gp(1, other_curve))
+
+
+@pytest.mark.parametrize("use_vectorized", [False, True])
+def test_replot(use_vectorized):
+    ax = Axes()
+    k = 1
+
+    def function(x):
+        return np.sin(k * x)
+
+    graph = ax.plot(function, use_vectorized=use_vectorized)
+    points = graph.points
+    k = 2
+    graph.replot()
+
+    expected = ax.plot(function, use_vectorized=use_vectorized)
+    assert graph.points is points
+    np.testing.assert_allclose(graph.points, expected.points)
+
+    graph.replot(np.cos)
+    expected = ax.plot(np.cos, use_vectorized=use_vectorized)
+    np.testing.assert_allclose(graph.points, expected.points)
+    assert graph.underlying_function is np.cos
+    np.testing.assert_allclose(ax.i2gp(1, graph), ax.c2p(1, np.cos(1)))
+
+
+def test_replot_parametric_function():
+    graph = ParametricFunction(lambda t: [t, t, 0], t_range=[0, 1])
+    graph.replot(lambda t: [t, 2 * t, 0])
+    np.testing.assert_allclose(graph.get_end(), [1, 2, 0])
+
+
+def test_replot_with_discontinuities():
+    ax = Axes()
+    graph = ax.plot(lambda x: 1 / x, discontinuities=[0], x_range=[-2, 2, 0.1])
+    points = graph.points.copy()
+    graph.points[:] = 0
+    graph.replot()
+    np.testing.assert_allclose(graph.points, points)
+
+
+def test_replot_after_changing_discontinuities_in_place():
+    ax = Axes()
+    discontinuities = [0]
+    graph = ax.plot(lambda x: 1 / x, discontinuities=discontinuities)
+    discontinuities.append(1)
+    graph.replot()
+    expected = ax.plot(lambda x: 1 / x, discontinuities=[0, 1])
+    np.testing.assert_allclose(graph.points, expected.points)
+
+
+def test_plot_adaptive_sampling():
+    ax = Axes()
+    graph = ax.plot(lambda x: abs(x), x_range=[-3, 3, 1])
+    adaptive_graph = ax.plot(
+        lambda x: abs(x),
+        x_range=[-3, 3, 1],
+        use_smoothing=False,
+        use_adaptive_sampling=True,
+    )
+    # The kink at 0 is sampled, so none of the straight pieces is refined.
+    assert graph.get_num_curves() == 6
+    assert adaptive_graph.get_num_curves() == 6
+    curve = ax.plot(np.sin, x_range=[-3, 3, 1], use_adaptive_sampling=True)
+    assert curve.get_num_curves() > 6
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from manim import BraceLabel, Mobject
+import numpy as np
+
+from manim import RIGHT, BraceLabel, Mobject, Square
 
 
 def test_mobject_copy():
@@ -18,6 +20,56 @@ def test_mobject_copy():
         assert orig.submobjects[i] is not copy.submobjects[i]
 
 
+def test_copy_shares_points_until_accessed():
+    orig = Square()
+    copy = orig.copy()
+    points = orig.__dict__["points"]
+
+    assert copy.__dict__["points"].base is points
+    np.testing.assert_array_equal(copy.points, points)
+    # Only the copy copies the shared array.
+    assert copy.__dict__["points"].base is None
+    assert orig.points is points
+    assert points.flags.writeable
+
+
+def test_original_access_copies_for_the_copy():
+    orig = Square()
+    expected = orig.__dict__["points"].copy()
+    copy = orig.copy()
+
+    points = orig.points
+    points[0] = RIGHT
+    assert orig.__dict__["points"] is points
+    np.testing.assert_array_equal(copy.points, expected)
+
+
+def test_references_obtained_before_copying_stay_writable():
+    orig = Square()
+    points = orig.points
+    copy = orig.copy()
+
+    points[0] = RIGHT
+    np.testing.assert_array_equal(orig.points[0], RIGHT)
+    assert not np.array_equal(copy.points[0], RIGHT)
+
+
+def test_copy_is_independent_of_original():
+    orig = Square()
+    expected = orig.points.copy()
+    copy = orig.copy()
+
+    copy.shift(RIGHT)
+    copy.points[0] = 2 * RIGHT
+    copy.set_fill(opacity=1)
+    np.testing.assert_array_equal(orig.points, expected)
+    assert orig.get_fill_opacity() == 0
+
+    orig.shift(RIGHT)
+    np.testing.assert_array_equal(copy.points[0], 2 * RIGHT)
+    np.testing.assert_array_equal(copy.points[1:], expected[1:] + RIGHT)
+
+
 def test_bracelabel_copy(tmp_path, config):
     """Test that a copy is a deepcopy."""
     # For this test to work, we need to tweak some folders temporarily
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from manim import *
 from tests.helpers.path_utils import get_svg_resource
 
@@ -202,3 +204,73 @@ def test_close_command_closes_last_move_not_the_starting_one():
         ),
         decimal=5,
     )
+
+
+POLYLINES_SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">
+<polyline points="0,0 5,5 10,0" fill="#FF0000" stroke="#0000FF" />
+<polyline points="0,10 5,5 10,10" stroke="#00FF00" stroke-width="2" />
+</svg>
+"""
+
+
+def write_polylines_svg(directory: Path) -> Path:
+    file_name = directory / "polylines.svg"
+    file_name.write_text(POLYLINES_SVG)
+    return file_name
+
+
+def test_svg_cache_file(config, monkeypatch, tmp_path):
+    file_name = write_polylines_svg(tmp_path)
+    svg = SVGMobject(file_name, use_svg_cache=False)
+    assert len(list(config.get_dir("svg_cache_dir").glob("*.npy"))) == 1
+
+    def generate_mobject(self):
+        raise AssertionError("The cache file was not used.")
+
+    monkeypatch.setattr(SVGMobject, "generate_mobject", generate_mobject)
+    cached = SVGMobject(file_name, use_svg_cache=False)
+    assert len(cached) == len(svg) == 2
+    for mob, cached_mob in zip(svg, cached, strict=True):
+        assert type(cached_mob) is type(mob)
+        np.testing.assert_array_equal(mob.points, cached_mob.points)
+        assert mob.get_fill_color() == cached_mob.get_fill_color()
+        assert mob.get_stroke_width() == cached_mob.get_stroke_width()
+
+
+def test_svg_cache_file_skips_other_classes(config):
+    svg = SVGMobject(get_svg_resource("manim-logo-sidebar.svg"), use_svg_cache=False)
+    assert VMobjectFromSVGPath in {type(mob) for mob in svg}
+    assert VMobject not in {type(mob) for mob in svg}
+    assert not list(config.get_dir("svg_cache_dir").glob("*.npy"))
+
+
+def test_svg_cache_file_keeps_gradients(config, monkeypatch, tmp_path):
+    file_name = write_polylines_svg(tmp_path)
+    get_mobjects_from = SVGMobject.get_mobjects_from
+    monkeypatch.setattr(
+        SVGMobject,
+        "get_mobjects_from",
+        lambda self, svg: [
+            mob.set_fill([RED, BLUE], opacity=1).set_sheen(0.5, DR)
+            for mob in get_mobjects_from(self, svg)
+        ],
+    )
+    svg = SVGMobject(file_name, use_svg_cache=False)
+    monkeypatch.undo()
+
+    def generate_mobject(self):
+        raise AssertionError("The cache file was not used.")
+
+    monkeypatch.setattr(SVGMobject, "generate_mobject", generate_mobject)
+    cached = SVGMobject(file_name, use_svg_cache=False)
+    for mob, cached_mob in zip(svg, cached, strict=True):
+        np.testing.assert_array_equal(mob.fill_rgbas, cached_mob.fill_rgbas)
+        np.testing.assert_array_equal(mob.stroke_rgbas, cached_mob.stroke_rgbas)
+        assert cached_mob.get_sheen_factor() == 0.5
+
+
+def test_svg_cache_file_disabled(config):
+    config.svg_cache_dir = ""
+    SVGMobject(get_svg_resource("heart.svg"), use_svg_cache=False)
+    assert config.get_dir("svg_cache_dir") is None
+    assert not list(Path(config.media_dir).rglob("*.npy"))
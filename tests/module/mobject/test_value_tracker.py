@@ -148,3 +148,16 @@ def test_complex_value_tracker_get_value():
     """Test ComplexValueTracker.get_value()"""
     tracker = ComplexValueTracker(2.0 - 3.0j)
     assert tracker.get_value() == 2.0 - 3.0j
+
+
+def test_record_value_tracker_reads():
+    """Test that reading the value of a tracker is recorded."""
+    from manim.mobject.value_tracker import record_value_tracker_reads
+
+    read, unread = ValueTracker(1.0), ComplexValueTracker(1j)
+    with record_value_tracker_reads() as outer:
+        with record_value_tracker_reads() as inner:
+            read.get_value()
+        unread.set_value(2j)
+    assert list(inner.values()) == [read]
+    assert list(outer.values()) == [read]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from manim import (
+    DOWN,
+    LEFT,
+    RIGHT,
+    UP,
+    UR,
+    WHITE,
+    ArrowVectorField,
+    StreamLines,
+    Vector,
+)
+from manim.mobject.vector_field import _map_rows, _rows_function
+
+
+def assert_same_vectors(vectors, expected_vectors):
+    assert len(vectors) == len(expected_vectors)
+    for vector, expected in zip(vectors, expected_vectors, strict=True):
+        members = vector.family_members_with_points()
+        expected_members = expected.family_members_with_points()
+        assert len(members) == len(expected_members)
+        for member, expected_member in zip(members, expected_members, strict=True):
+            np.testing.assert_allclose(member.points, expected_member.points, atol=1e-9)
+        assert vector.get_color() == expected.get_color()
+        assert vector.get_stroke_width() == pytest.approx(expected.get_stroke_width())
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda pos: ((pos[0] * UR + pos[1] * LEFT) - pos) / 3,
+        lambda pos: pos - LEFT * 5,
+        lambda pos: np.zeros(3) if pos[0] == 0 else 3 * pos,
+        lambda pos: np.array([pos[1], -pos[0]]),
+    ],
+)
+def test_arrow_vector_field_matches_single_vectors(func):
+    vector_field = ArrowVectorField(func, x_range=[-2, 2, 1], y_range=[-2, 2, 1])
+    points = [vector.get_start() for vector in vector_field]
+    assert_same_vectors(vector_field, [vector_field.get_vector(p) for p in points])
+    assert all(isinstance(vector, Vector) for vector in vector_field)
+
+
+def test_arrow_vector_field_update_vectors():
+    vector_field = ArrowVectorField(lambda pos: pos, x_range=[-2, 2, 1])
+    vector_field.set_opacity(0.5)
+    expected = ArrowVectorField(lambda pos: pos[1] * RIGHT, x_range=[-2, 2, 1])
+    vectors = vector_field.submobjects.copy()
+
+    vector_field.func = expected.func
+    vector_field.update_vectors()
+    assert vector_field.submobjects == vectors
+    assert_same_vectors(vector_field, expected)
+    assert vector_field[0].get_stroke_opacity() == 0.5
+
+
+def test_map_rows_detects_scalar_functions():
+    points = np.array([RIGHT, UP, DOWN, LEFT])
+    # Indexing the coordinates doesn't work on arrays of points.
+    np.testing.assert_array_equal(
+        _map_rows(lambda pos: pos[0] * UP, points), [UP, [0, 0, 0], [0, 0, 0], -UP]
+    )
+    np.testing.assert_array_equal(_map_rows(lambda pos: 2 * pos, points), 2 * points)
+
+
+def test_stream_lines_accept_vectorized_func():
+    def func(pos):
+        return np.array([-pos[1], pos[0], 0]) / 3
+
+    def vectorized_func(points):
+        return np.stack([-points[:, 1], points[:, 0], np.zeros(len(points))], 1) / 3
+
+    ranges = {"x_range": [-2, 2, 1], "y_range": [-2, 2, 1], "padding": 0}
+    stream_lines = StreamLines(func, **ranges)
+    vectorized_stream_lines = StreamLines(vectorized_func, **ranges)
+    assert ranges["x_range"] == [-2, 2, 1]
+    assert len(stream_lines) == len(vectorized_stream_lines) > 0
+    for line, vectorized_line in zip(
+        stream_lines, vectorized_stream_lines, strict=True
+    ):
+        np.testing.assert_allclose(line.points, vectorized_line.points)
+
+
+def test_stream_lines_runge_kutta():
+    def func(pos):
+        return np.array([-pos[1], pos[0], 0])
+
+    def radii(line):
+        return np.linalg.norm(line.get_anchors(), axis=1)
+
+    ranges = {"x_range": [1, 2, 1], "y_range": [0, 1, 1], "noise_factor": 0}
+    euler = StreamLines(func, color=WHITE, dt=0.1, **ranges)[0]
+    runge_kutta = StreamLines(func, color=WHITE, dt=0.1, runge_kutta=True, **ranges)[0]
+    # The agents circle around the origin, from which Euler steps drift away.
+    assert np.ptp(radii(runge_kutta)) < 1e-3 < np.ptp(radii(euler))
+
+
+def test_rows_function_of_vectorized_only_function():
+    points = np.arange(12.0).reshape(4, 3)
+    func = _rows_function(lambda rows: rows[:, ::-1], points)
+    np.testing.assert_array_equal(func(points), points[:, ::-1])
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 
 import numpy as np
 import pytest
 
-from manim import MathTex, SingleStringMathTex, Tex, TexTemplate, tempconfig
+from manim import (
+    MathTex,
+    SingleStringMathTex,
+    Tex,
+    TexTemplate,
+    prefetch_tex,
+    tempconfig,
+)
 
 
 def test_MathTex(config):
@@ -226,3 +234,31 @@ def test_tex_garbage_collection(tmpdir, monkeypatch, config):
 
     tex_with_log = Tex("Hello World, again!")  # da27670a37b08799.tex
     assert Path("media", "Tex", "da27670a37b08799.log").exists()
+
+
+def test_prefetch_tex_compiles_once(config, monkeypatch):
+    compilers = []
+    run = subprocess.run
+
+    def spy(command, *args, **kwargs):
+        # Ignore building the format file of the preamble.
+        if "-ini" not in command:
+            compilers.append(command[0])
+        return run(command, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", spy)
+    prefetch_tex("a_1", "a_2", "a_3")
+    assert compilers == ["latex", "dvisvgm"]
+
+    compilers.clear()
+    MathTex("a_1")
+    MathTex("{{ a_2 }} + {{ a_3 }}")
+    assert compilers.count("latex") == 1
+
+
+def test_prefetch_tex_reports_failing_expression(config, capsys):
+    with pytest.raises(ValueError):
+        prefetch_tex("a", r"\notacontrolsequence", "b")
+
+    assert "Undefined control sequence" in str(capsys.readouterr().out)
+    assert len(list(Path(config.media_dir, "Tex").glob("*.svg"))) == 1
@@ -3,7 +3,9 @@ from __future__ import annotations
 from contextlib import redirect_stdout
 from io import StringIO
 
-from manim.mobject.text.text_mobject import MarkupText, Text
+import numpy as np
+
+from manim.mobject.text.text_mobject import GLYPH_OUTLINE_CACHE, MarkupText, Text
 
 
 def test_font_size():
@@ -17,6 +19,19 @@ def test_font_size():
     assert round(markuptext_string.font_size, 5) == 14.4
 
 
+def test_glyph_outlines_are_reused():
+    GLYPH_OUTLINE_CACHE.clear()
+    a1, b1 = Text("ab")
+    n_outlines = len(GLYPH_OUTLINE_CACHE)
+    b2, a2 = Text("ba")
+    assert len(GLYPH_OUTLINE_CACHE) == n_outlines
+
+    for first, second in [(a1, a2), (b1, b2)]:
+        np.testing.assert_allclose(
+            first.points - first.points[0], second.points - second.points[0], atol=1e-8
+        )
+
+
 def test_font_warnings():
     def warning_printed(font: str, **kwargs) -> bool:
         io = StringIO()
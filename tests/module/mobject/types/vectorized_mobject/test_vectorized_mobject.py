@@ -15,7 +15,7 @@ from manim import (
     VGroup,
     VMobject,
 )
-from manim.constants import PI
+from manim.constants import ORIGIN, PI, RIGHT, UP
 
 
 def test_vmobject_add():
@@ -120,6 +120,40 @@ def test_vmobject_point_from_proportion():
         obj.point_from_proportion(0)
 
 
+def test_vmobject_point_from_proportion_array():
+    obj = VMobject()
+    obj.set_points_as_corners(
+        [
+            np.array([0, 0, 0]),
+            np.array([4, 0, 0]),
+            np.array([4, 2, 0]),
+        ],
+    )
+
+    alphas = np.linspace(0, 1, 7)
+    expected = [obj.point_from_proportion(alpha) for alpha in alphas]
+    np.testing.assert_allclose(obj.point_from_proportion(alphas), expected)
+    np.testing.assert_allclose(expected[-1], [4, 2, 0])
+    np.testing.assert_allclose(obj.get_cumulative_curve_lengths(), [0, 4, 6])
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        obj.point_from_proportion(np.array([0.5, 1.5]))
+
+
+def test_vmobject_arc_length_table_follows_points():
+    obj = Line(ORIGIN, 2 * RIGHT)
+    assert obj.get_arc_length() == pytest.approx(2)
+    np.testing.assert_allclose(obj.point_from_proportion(0.5), RIGHT)
+
+    obj.scale(2, about_point=ORIGIN)
+    assert obj.get_arc_length() == pytest.approx(4)
+    np.testing.assert_allclose(obj.point_from_proportion(0.5), 2 * RIGHT)
+
+    # In-place modifications of the points are noticed as well.
+    obj.points[:, 1] += 1
+    np.testing.assert_allclose(obj.point_from_proportion(0.5), 2 * RIGHT + UP)
+
+
 def test_curves_as_submobjects_point_from_proportion():
     obj = CurvesAsSubmobjects(VGroup())
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from manim import tempconfig
+from manim.utils.cache_store import PartialMovieCache
+
+
+def _write_partial_movie(path: Path, size: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+    return path
+
+
+def test_store_and_fetch(tmp_path: Path):
+    store = PartialMovieCache(tmp_path / "cache")
+    source = _write_partial_movie(tmp_path / "first" / "abc.mp4", 100)
+    store.store("abc", source, "FirstScene")
+
+    destination = tmp_path / "second" / "abc.mp4"
+    destination.parent.mkdir()
+    assert store.fetch("abc", destination)
+    assert destination.read_bytes() == source.read_bytes()
+    assert not store.fetch("def", tmp_path / "second" / "def.mp4")
+
+    summary = store.stats()
+    assert summary["files"] == 1
+    assert summary["size"] == 100
+    assert summary["hits"] == 1
+    assert summary["scenes"][0]["scene"] == "FirstScene"
+
+
+def test_render_settings_are_part_of_the_key(tmp_path: Path):
+    store = PartialMovieCache(tmp_path / "cache")
+    source = _write_partial_movie(tmp_path / "abc.mp4", 100)
+    with tempconfig({"pixel_height": 480, "pixel_width": 854}):
+        store.store("abc", source, "Scene")
+    with tempconfig({"pixel_height": 1080, "pixel_width": 1920}):
+        assert not store.fetch("abc", tmp_path / "fetched.mp4")
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path):
+    store = PartialMovieCache(tmp_path / "cache", max_size=250)
+    for name in ["a", "b", "c"]:
+        store.store(name, _write_partial_movie(tmp_path / f"{name}.mp4", 100), "S")
+    # Accessing "a" makes "b" the least recently used file.
+    assert store.fetch("a", tmp_path / "a_copy.mp4")
+
+    assert store.prune() == (1, 100)
+    assert not store.fetch("b", tmp_path / "b_copy.mp4")
+    assert store.fetch("a", tmp_path / "a_copy.mp4")
+    assert store.fetch("c", tmp_path / "c_copy.mp4")
+
+
+def test_verify(tmp_path: Path):
+    store = PartialMovieCache(tmp_path / "cache")
+    for name in ["a", "b"]:
+        store.store(name, _write_partial_movie(tmp_path / f"{name}.mp4", 100), "S")
+    path = next(store.directory.glob("??/*.mp4"))
+    path.unlink()
+    orphan = _write_partial_movie(store.directory / "00" / "orphan.mp4", 10)
+
+    problems = store.verify(fix=False)
+    assert sorted(problem for _, problem in problems) == ["missing", "not indexed"]
+    assert orphan.exists()
+
+    store.verify()
+    assert store.verify() == []
+    assert store.stats()["files"] == 1
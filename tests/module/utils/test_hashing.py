@@ -159,3 +159,42 @@ def test_hash_consistency():
     assert_two_objects_produce_same_hash(Square(), Square())
     s = Square()
     assert_two_objects_produce_same_hash(s, s.copy())
+
+
+def test_structural_hash_consistency():
+    def digest(obj):
+        return hashing._StructuralHasher().hexdigest(obj)
+
+    assert digest(Square()) == digest(Square())
+    s = Square()
+    assert digest(s) == digest(s.copy())
+    assert digest(s) != digest(Square(side_length=3))
+
+
+def test_structural_hash_detects_changes():
+    s = Square()
+    initial = hashing._StructuralHasher().hexdigest(s)
+
+    s.set_stroke(width=10)
+    assert hashing._StructuralHasher().hexdigest(s) != initial
+    s.set_stroke(width=4)
+    assert hashing._StructuralHasher().hexdigest(s) == initial
+
+    # In-place changes are detected too.
+    s.points[0, 0] += 1
+    assert hashing._StructuralHasher().hexdigest(s) != initial
+
+
+def test_structural_hash_with_updater_closure():
+    value = [0]
+    s = Square()
+    s.add_updater(lambda mob: mob.set_x(value[0]))
+    initial = hashing._StructuralHasher().hexdigest(s)
+    value[0] = 1
+    assert hashing._StructuralHasher().hexdigest(s) != initial
+
+
+def test_structural_hash_with_circular_references():
+    s = Square()
+    s.self_reference = s
+    hashing._StructuralHasher().hexdigest(s)
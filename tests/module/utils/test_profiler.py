@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from manim import Scene
+from manim.utils.profiler import (
+    RenderProfiler,
+    SpanStats,
+    find_regressions,
+    load_summary,
+    profile,
+    profiler,
+)
+
+
+def test_disabled_profiler_records_nothing():
+    recorder = RenderProfiler()
+    with recorder.span("frame"), recorder.accumulate("path"):
+        pass
+    assert recorder.events == []
+    assert recorder.summary() == {}
+
+
+def test_spans_and_accumulated_hot_paths():
+    recorder = RenderProfiler()
+    recorder.enabled = True
+    for _ in range(2):
+        with recorder.span("frame", "scene", t=0.5):
+            for _ in range(3):
+                with recorder.accumulate("path"):
+                    pass
+        recorder.flush_accumulated()
+
+    summary = recorder.summary()
+    assert summary["frame"].count == 2
+    assert summary["path"].count == 6
+    assert [event["ph"] for event in recorder.events] == ["X", "C", "X", "C"]
+    assert recorder.events[0]["args"] == {"t": 0.5}
+
+
+def test_chrome_trace_and_summary_files(tmp_path: Path):
+    with profile() as recorder, profiler.span("play", "scene", index=0):
+        pass
+    assert not profiler.enabled
+
+    recorder.write_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert {event["ph"] for event in trace["traceEvents"]} == {"M", "X"}
+
+    recorder.write_summary(tmp_path / "summary.json")
+    assert load_summary(tmp_path / "summary.json")["play"].count == 1
+
+
+def test_profiler_disabled_when_scene_raises(config):
+    class FailingScene(Scene):
+        def construct(self):
+            raise ValueError
+
+    config.profile = True
+    with pytest.raises(ValueError):
+        FailingScene().render()
+    assert not profiler.enabled
+
+
+def test_find_regressions():
+    baseline = {
+        "frame": SpanStats(10, 1.0, 0.2),
+        "updaters": SpanStats(10, 0.5, 0.1),
+        "path": SpanStats(100, 0.001, 0.0001),
+    }
+    current = {
+        "frame": SpanStats(10, 1.05, 0.2),
+        "updaters": SpanStats(10, 1.0, 0.2),
+        "path": SpanStats(100, 0.005, 0.0001),
+        "encode": SpanStats(10, 1.0, 0.2),
+    }
+    assert find_regressions(baseline, current, threshold=0.1) == [
+        ("updaters", 0.5, 1.0)
+    ]
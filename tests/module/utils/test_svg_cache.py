@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from manim.utils import svg_cache
+from manim.utils.svg_cache import SVGCache
+
+
+def _arrays(n_points: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    points = np.arange(3 * n_points, dtype=float).reshape(-1, 3)
+    ends = np.array([n_points // 2, n_points])
+    # Two submobjects with a gradient of 2 colors and a width each.
+    styles = np.arange(18, dtype=float)
+    style_ends = np.array([[8, 9], [17, 18]])
+    return points, ends, styles, style_ends
+
+
+def test_store_and_load(tmp_path: Path):
+    cache = SVGCache(tmp_path)
+    key = SVGCache.make_key(b"seed")
+    assert cache.load(key) is None
+
+    cache.store(key, *_arrays(8))
+    for loaded, expected in zip(cache.load(key), _arrays(8), strict=True):
+        np.testing.assert_array_equal(loaded, expected)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_depends_on_manim_version(monkeypatch):
+    key = SVGCache.make_key(b"seed")
+    monkeypatch.setattr(svg_cache, "__version__", "0.0.0+other")
+    assert SVGCache.make_key(b"seed") != key
+
+
+def test_key_depends_on_format_version(monkeypatch):
+    key = SVGCache.make_key(b"seed")
+    monkeypatch.setattr(svg_cache, "FORMAT_VERSION", svg_cache.FORMAT_VERSION + 1)
+    assert SVGCache.make_key(b"seed") != key
+
+
+def test_truncated_entry_is_a_miss(tmp_path: Path):
+    cache = SVGCache(tmp_path)
+    key = SVGCache.make_key(b"seed")
+    points, ends, styles, style_ends = _arrays(8)
+    cache.store(key, points[:-1], ends, styles, style_ends)
+    assert cache.load(key) is None
+    assert cache.misses == 1
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path):
+    cache = SVGCache(tmp_path)
+    keys = [SVGCache.make_key(name.encode()) for name in "abc"]
+    for age, key in enumerate(reversed(keys)):
+        cache.store(key, *_arrays(8))
+        timestamp = 1_000_000 - age
+        os.utime(tmp_path / f"{key}.npy", (timestamp, timestamp))
+    size = (tmp_path / f"{keys[0]}.npy").stat().st_size
+    # Loading "a" makes "b" the least recently used entry.
+    assert cache.load(keys[0]) is not None
+
+    assert cache.prune(2 * size) == (1, size)
+    assert cache.load(keys[1]) is None
+    assert cache.load(keys[0]) is not None
+    assert cache.load(keys[2]) is not None
+
+
+def test_report_logs_hits_and_misses(tmp_path: Path, manim_caplog):
+    cache = SVGCache(tmp_path)
+    key = SVGCache.make_key(b"seed")
+    cache.load(key)
+    cache.store(key, *_arrays(8))
+    cache.load(key)
+    cache.report()
+    assert "SVG cache: 1 hit(s), 1 miss(es)" in manim_caplog.text
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_from_config(config, tmp_path: Path):
+    config.svg_cache_dir = tmp_path
+    config.svg_cache_max_size = 1
+    cache = SVGCache.from_config()
+    assert cache.directory == tmp_path
+    assert cache.max_size == 1024 * 1024
+    assert SVGCache.from_config() is cache
+
+    config.svg_cache_dir = ""
+    assert SVGCache.from_config() is None
@@ -1,6 +1,11 @@
+import subprocess
+from pathlib import Path
+
 import pytest
 
+from manim.utils import tex_file_writing
 from manim.utils.tex import TexTemplate, _texcode_for_environment
+from manim.utils.tex_file_writing import get_tex_format, make_tex_compilation_command
 
 DEFAULT_BODY = r"""\documentclass[preview]{standalone}
 \usepackage[english]{babel}
@@ -140,3 +145,59 @@ def test_texcode_for_environment():
         r"\begin{tabular}[t]{cccl}",
         r"\end{tabular}",
     )
+
+
+def test_tex_compilation_command_with_format():
+    command = make_tex_compilation_command(
+        "latex", ".dvi", Path("a.tex"), Path("tex"), Path("tex/preamble.fmt")
+    )
+    assert command[:2] == ["latex", "-fmt=tex/preamble.fmt"]
+    assert command[-1] == "a.tex"
+
+
+def test_tex_format_is_built_once(config, monkeypatch):
+    commands = []
+
+    def fake_run(command, **kwargs):
+        commands.append(command)
+        job_name = command[2].removeprefix("-jobname=")
+        (config.get_dir("tex_dir") / f"{job_name}.fmt").write_bytes(b"format")
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr(tex_file_writing, "_tex_formats", {})
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    tex_format = get_tex_format(TexTemplate())
+    assert tex_format.parent == config.get_dir("tex_dir")
+    assert tex_format.read_bytes() == b"format"
+    assert commands[0][:2] == ["latex", "-ini"]
+
+    assert get_tex_format(TexTemplate()) == tex_format
+    assert get_tex_format(TexTemplate(preamble="")) != tex_format
+    assert len(commands) == 2
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        TexTemplate(tex_compiler="xelatex", output_format=".xdv"),
+        TexTemplate(precompile_preamble=False),
+        TexTemplate(preamble="YourTextHere"),
+    ],
+)
+def test_tex_format_unsupported(template, monkeypatch):
+    def fake_run(command, **kwargs):
+        raise AssertionError("no format should be built")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    assert get_tex_format(template) is None
+
+
+def test_tex_format_build_failure(config, monkeypatch):
+    monkeypatch.setattr(tex_file_writing, "_tex_formats", {})
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda command, **kwargs: subprocess.CompletedProcess(command, 1),
+    )
+    assert get_tex_format(TexTemplate()) is None
+    assert not list(config.get_dir("tex_dir").glob("*.fmt"))
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import numpy as np
 import pytest
 
-from manim import Circle, Line, Square, VDict, VGroup, VMobject
+from manim import RIGHT, Circle, Line, Square, VDict, VGroup, VMobject
+from manim.mobject.opengl import opengl_vectorized_mobject
 from manim.mobject.opengl.opengl_mobject import OpenGLMobject
 from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
 
@@ -372,3 +375,46 @@ def test_vgroup_item_assignment_only_allows_vmobjects(using_opengl_renderer):
         "Only values of type OpenGLVMobject can be added as submobjects of "
         "VGroup, but the value invalid object (at index 0) is of type str."
     )
+
+
+@pytest.fixture
+def earclip_calls(monkeypatch):
+    calls = []
+
+    def earclip_triangulation(verts, rings):
+        calls.append(len(verts))
+        return original(verts, rings)
+
+    original = opengl_vectorized_mobject.earclip_triangulation
+    monkeypatch.setattr(
+        opengl_vectorized_mobject, "earclip_triangulation", earclip_triangulation
+    )
+    monkeypatch.setattr(
+        opengl_vectorized_mobject, "_triangulation_cache", OrderedDict()
+    )
+    return calls
+
+
+def test_triangulation_kept_by_affine_transforms(using_opengl_renderer, earclip_calls):
+    mob = OpenGLVMobject().set_points_as_corners(
+        [[0, 0, 0], [2, 0, 0], [1, 1, 0], [2, 2, 0], [0, 2, 0], [0, 0, 0]]
+    )
+    triangulation = mob.get_triangulation()
+    assert len(earclip_calls) == 1
+
+    mob.shift(RIGHT).rotate(1).scale(3).stretch(2, 0)
+    np.testing.assert_array_equal(mob.get_triangulation(), triangulation)
+    assert len(earclip_calls) == 1
+
+    # A reflection reverses the orientation of the curves.
+    mob.stretch(-1, 0)
+    mob.get_triangulation()
+    assert len(earclip_calls) == 2
+
+
+def test_triangulation_shared_by_identical_shapes(using_opengl_renderer, earclip_calls):
+    squares = [Square().shift(i * RIGHT) for i in range(3)]
+    triangulations = [square.get_triangulation() for square in squares]
+    assert len(earclip_calls) == 1
+    for triangulation in triangulations[1:]:
+        np.testing.assert_array_equal(triangulation, triangulations[0])
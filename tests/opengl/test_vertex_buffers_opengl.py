@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import moderngl
+import numpy as np
+import pytest
+
+from manim.mobject.opengl.opengl_geometry import OpenGLSquare
+from manim.renderer.opengl_renderer import OpenGLRenderer
+from manim.renderer.shader import Shader, VertexBuffers
+
+SHADER_SOURCE = {
+    "vertex_shader": """
+    #version 330
+    in vec2 point;
+    in float value;
+    out float v_value;
+    void main() {
+        v_value = value;
+        gl_Position = vec4(point, 0.0, 1.0);
+    }
+    """,
+    "fragment_shader": """
+    #version 330
+    in float v_value;
+    out vec4 color;
+    void main() {
+        color = vec4(v_value, 0.0, 0.0, 1.0);
+    }
+    """,
+}
+
+
+@pytest.fixture
+def context():
+    try:
+        ctx = moderngl.create_standalone_context()
+    except Exception:
+        try:
+            ctx = moderngl.create_standalone_context(backend="egl")
+        except Exception:
+            pytest.skip("No OpenGL context available")
+    yield ctx
+    ctx.release()
+
+
+def full_screen_triangle(value, extra_vertices=0):
+    points = [(-1, -1), (3, -1), (-1, 3)] + [(-1, -1)] * extra_vertices
+    data = np.zeros(
+        len(points),
+        dtype=[("point", np.float32, (2,)), ("value", np.float32, (1,))],
+    )
+    data["point"] = points
+    data["value"] = value
+    return data
+
+
+def draw(context, buffers):
+    framebuffer = context.simple_framebuffer((4, 4))
+    framebuffer.use()
+    framebuffer.clear()
+    buffers.render(moderngl.TRIANGLES)
+    red = np.frombuffer(framebuffer.read(components=4), dtype=np.uint8)[0]
+    framebuffer.release()
+    return red
+
+
+def test_vertex_buffers_upload_only_changed_data(context):
+    shader = Shader(context, source=SHADER_SOURCE)
+    buffers = VertexBuffers(context)
+
+    buffers.write(shader, full_screen_triangle(1.0))
+    vertex_buffer_object = buffers.vertex_buffer_object
+    assert draw(context, buffers) == 255
+
+    buffers.write(shader, full_screen_triangle(1.0))
+    assert buffers.uploads == 1
+
+    data = full_screen_triangle(0.0)
+    buffers.write(shader, data)
+    assert buffers.uploads == 2
+    assert draw(context, buffers) == 0
+
+    # Changes in place are detected as well.
+    data["value"] = 1.0
+    buffers.write(shader, data)
+    assert buffers.uploads == 3
+    assert draw(context, buffers) == 255
+
+    # Growing data orphans the storage of the same buffer.
+    buffers.write(shader, full_screen_triangle(1.0, extra_vertices=3))
+    assert buffers.vertex_buffer_object is vertex_buffer_object
+    assert draw(context, buffers) == 255
+
+    buffers.write(shader, full_screen_triangle(0.0), indices=np.arange(3))
+    assert buffers.index_buffer_object is not None
+    assert draw(context, buffers) == 0
+
+    buffers.release()
+    assert buffers.vertex_buffer_object is None
+
+
+def test_renderer_releases_buffers_of_undrawn_mobjects(context, using_opengl_renderer):
+    renderer = OpenGLRenderer()
+    renderer.context = context
+    square = OpenGLSquare()
+    shader_wrapper = square.get_shader_wrapper_list()[0]
+
+    buffers = renderer.get_vertex_buffers(square, shader_wrapper)
+    renderer.release_unused_vertex_buffers()
+    assert renderer.get_vertex_buffers(square, shader_wrapper) is buffers
+
+    renderer.release_unused_vertex_buffers()
+    renderer.release_unused_vertex_buffers()
+    assert renderer.vertex_buffers == {}
+
+
+def test_renderer_releases_all_buffers(context, using_opengl_renderer):
+    renderer = OpenGLRenderer()
+    renderer.context = context
+    square = OpenGLSquare()
+    shader_wrapper = square.get_shader_wrapper_list()[0]
+
+    buffers = renderer.get_vertex_buffers(square, shader_wrapper)
+    buffers.write(Shader(context, source=SHADER_SOURCE), full_screen_triangle(1.0))
+    renderer.release_vertex_buffers()
+    assert renderer.vertex_buffers == {}
+    assert buffers.vertex_buffer_object is None
+    assert renderer.get_vertex_buffers(square, shader_wrapper) is not buffers
+
+
+def test_renderer_reuses_shaders(context, using_opengl_renderer):
+    renderer = OpenGLRenderer()
+    renderer.context = context
+    shader_folder = OpenGLSquare().get_shader_wrapper_list()[0].shader_folder
+    shader = renderer.get_shader(shader_folder)
+    assert renderer.get_shader(shader_folder) is shader
@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from manim import MovingCamera, Square
+import numpy as np
+
+from manim import (
+    ORIGIN,
+    RIGHT,
+    Camera,
+    Circle,
+    ImageMobject,
+    Line,
+    MovingCamera,
+    Square,
+    Text,
+    VGroup,
+)
 
 
 def test_movingcamera_auto_zoom():
@@ -9,3 +22,79 @@ def test_movingcamera_auto_zoom():
     margin = 0.5
     camera.auto_zoom([square], margin=margin, animate=False)
     assert camera.frame.height == square.height + margin
+
+
+class _RecordingContext:
+    """Records the path building calls of a Cairo context."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, *args))
+
+
+def _reference_path_calls(vmobject, points):
+    ctx = _RecordingContext()
+    for subpath in vmobject.gen_subpaths_from_points_2d(points):
+        ctx.new_sub_path()
+        ctx.move_to(*subpath[0][:2])
+        for _p0, p1, p2, p3 in vmobject.gen_cubic_bezier_tuples_from_points(subpath):
+            ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+        if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.close_path()
+    return ctx.calls
+
+
+def test_cairo_path_matches_curve_by_curve_emission():
+    mobjects = [
+        Square(),
+        VGroup(Circle(), Square().shift(RIGHT)),
+        Text("Manim"),
+        Line(ORIGIN, RIGHT),
+    ]
+    camera = Camera()
+    for mobject in mobjects:
+        for vmobject in mobject.family_members_with_points():
+            # An incomplete curve at the end is ignored.
+            points = np.vstack([vmobject.points, vmobject.points[:2]])
+            ctx = _RecordingContext()
+            camera._emit_cairo_path(ctx, vmobject, points)
+            assert ctx.calls == _reference_path_calls(vmobject, points)
+
+
+def test_image_mobject_is_resampled_once():
+    image = ImageMobject(np.full((4, 4, 4), 255, dtype=np.uint8))
+    image.height = 2
+    camera = Camera()
+    camera.capture_mobject(image)
+    first_frame = camera.pixel_array.copy()
+    sub_image = camera.image_mobject_cache[image][2]
+
+    camera.reset()
+    camera.capture_mobject(image)
+    np.testing.assert_array_equal(camera.pixel_array, first_frame)
+    assert camera.image_mobject_cache[image][2] is sub_image
+
+    # Only the position changed, so the resampled image is moved.
+    camera.reset()
+    image.shift(RIGHT)
+    camera.capture_mobject(image)
+    assert camera.image_mobject_cache[image][2] is sub_image
+    assert np.count_nonzero(camera.pixel_array[..., 0]) == np.count_nonzero(
+        first_frame[..., 0]
+    )
+
+
+def test_image_mobject_is_sheared():
+    image = ImageMobject(np.full((4, 4, 4), 255, dtype=np.uint8))
+    image.height = 2
+    image.apply_matrix([[1, 1, 0], [0, 1, 0], [0, 0, 1]])
+    camera = Camera()
+    camera.capture_mobject(image)
+    rows = np.nonzero(camera.pixel_array[..., 0] == 255)
+    # The top of the sheared square is further right than its bottom.
+    assert (
+        rows[1][rows[0] == rows[0].min()].mean()
+        > rows[1][rows[0] == rows[0].max()].mean()
+    )
@@ -21,6 +21,34 @@ def test_render(using_temp_config, disabling_caching):
     assert_file_exists(config["output_file"])
 
 
+def test_static_layers_are_composited(using_temp_config, disabling_caching):
+    class StaticLayerOnTopOfCurve(Scene):
+        def construct(self):
+            tracker = ValueTracker(1)
+            curve = always_redraw(lambda: Circle(radius=tracker.get_value()))
+            rings = VGroup(*(Circle(radius=0.1 * i) for i in range(1, 41)))
+            self.add(curve, rings)
+            self.play(tracker.animate.set_value(2))
+
+    scene = StaticLayerOnTopOfCurve()
+    renderer = scene.renderer
+    frames = []
+    add_frame = renderer.add_frame
+
+    def record_frame(frame, num_frames=1):
+        frames.append(np.array(frame))
+        add_frame(frame, num_frames)
+
+    renderer.add_frame = record_frame
+    scene.render()
+    assert renderer.layer_compositor.hits > 0
+
+    renderer.static_image = None
+    renderer.update_frame(scene)
+    difference = frames[-1].astype(int) - renderer.camera.pixel_array
+    assert np.abs(difference).max() <= 1
+
+
 def test_skipping_status_with_from_to_and_up_to(using_temp_config, disabling_caching):
     """Test if skip_animations is well updated when -n flag is passed"""
     config.from_animation_number = 2
@@ -38,6 +66,41 @@ def test_skipping_status_with_from_to_and_up_to(using_temp_config, disabling_cac
     SceneWithMultipleCalls().render()
 
 
+def test_skipping_status_with_plays_to_render(using_temp_config, disabling_caching):
+    """Test that a worker of a parallel render only renders its own plays."""
+
+    class SceneWithMultipleCalls(Scene):
+        def construct(self):
+            for i in range(10):
+                self.play(Animation(Square()))
+                assert (i in (3, 4)) != self.renderer.skip_animations
+            raise AssertionError("the worker should stop after its last play")
+
+    scene = SceneWithMultipleCalls()
+    scene.renderer.plays_to_render = {3, 4}
+    scene.render()
+    assert scene.renderer.num_plays == 5
+
+
+def test_split_plays():
+    from manim.renderer.parallel_plays import split_plays
+
+    assert split_plays({}, 4) == []
+    assert split_plays({0: 1.0, 1: 1.0}, 4) == [[0], [1]]
+    assert split_plays({0: 1.0, 1: 1.0, 2: 1.0, 3: 1.0}, 2) == [[0, 1], [2, 3]]
+    assert split_plays({0: 5.0, 1: 1.0, 2: 1.0, 3: 1.0}, 2) == [[0], [1, 2, 3]]
+
+
+def test_parallel_plays_need_the_input_file(using_temp_config, manim_caplog):
+    """Test that scenes which workers can't import are rendered serially."""
+    config.parallel_plays = 2
+    config.input_file = __file__
+    scene = SquareToCircle()
+    scene.render()
+    assert not scene.renderer.plan_plays
+    assert "without worker processes" in manim_caplog.text
+
+
 @pytest.mark.xfail(reason="caching issue")
 def test_when_animation_is_cached(using_temp_config):
     partial_movie_files = []
@@ -84,3 +147,15 @@ def test_hash_logic_is_called_when_caching_is_enabled(using_temp_config):
         scene = SquareToCircle()
         scene.render()
         mocked.assert_called_once()
+
+
+def test_render_is_profiled(using_temp_config, disabling_caching):
+    from manim.utils.profiler import profile
+
+    with profile() as profiler:
+        SquareToCircle().render()
+    summary = profiler.summary()
+    assert summary["play"].count == 1
+    assert summary["frame"].count == config["frame_rate"]
+    assert summary["display VMobject"].count >= config["frame_rate"]
+    assert summary["path"].count >= config["frame_rate"]
@@ -819,3 +819,63 @@ dry_run = true
 
     assert not (tmp_path / "videos").exists(), "videos folder was created in dry_run"
     assert not (tmp_path / "images").exists(), "images folder was created in dry_run"
+
+
+@pytest.mark.slow
+def test_parallel_plays_flag(tmp_path, manim_cfg_file, simple_scenes_path):
+    """Test that rendering the plays in worker processes yields the same video."""
+    scene_name = "SceneWithMultipleCalls"
+    lengths = []
+    for parallel_plays in ("0", "3"):
+        media_dir = tmp_path / parallel_plays
+        command = [
+            sys.executable,
+            "-m",
+            "manim",
+            "-ql",
+            "--media_dir",
+            str(media_dir),
+            "--parallel_plays",
+            parallel_plays,
+            str(simple_scenes_path),
+            scene_name,
+        ]
+        out, err, exit_code = capture(command)
+        assert exit_code == 0, err
+
+        path = media_dir / "videos" / "simple_scenes" / "480p15" / f"{scene_name}.mp4"
+        assert path.exists()
+        lengths.append(get_video_metadata(path)["nb_frames"])
+
+    assert lengths[0] == lengths[1]
+
+
+@pytest.mark.slow
+def test_global_cache_dir_flag(tmp_path, manim_cfg_file, simple_scenes_path):
+    """Test that a second media directory reuses the plays of the global cache."""
+    scene_name = "SquareToCircle"
+    cache_dir = tmp_path / "cache"
+    outputs = []
+    for media_dir in (tmp_path / "first", tmp_path / "second"):
+        command = [
+            sys.executable,
+            "-m",
+            "manim",
+            "-ql",
+            "--media_dir",
+            str(media_dir),
+            "--global_cache_dir",
+            str(cache_dir),
+            str(simple_scenes_path),
+            scene_name,
+        ]
+        out, err, exit_code = capture(command)
+        assert exit_code == 0, err
+        outputs.append(out)
+
+        path = media_dir / "videos" / "simple_scenes" / "480p15" / f"{scene_name}.mp4"
+        assert path.exists()
+
+    assert "Partial movie file written" in outputs[0]
+    assert "Partial movie file written" not in outputs[1]
+    assert (cache_dir / "index.sqlite").exists()
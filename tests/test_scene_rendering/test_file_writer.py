@@ -1,13 +1,14 @@
 import sys
 from fractions import Fraction
 from pathlib import Path
+from threading import Thread
 
 import av
 import numpy as np
 import pytest
 
 from manim import DR, Circle, Create, Scene, Star, tempconfig
-from manim.scene.scene_file_writer import to_av_frame_rate
+from manim.scene.scene_file_writer import FrameRingBuffer, to_av_frame_rate
 from manim.utils.commands import capture, get_video_metadata
 
 
@@ -147,6 +148,57 @@ def test_codecs(config, tmp_path, format, transparent, codec, pixel_format):
     np.testing.assert_allclose(first_frame[-1, -1], target_rgba_center, atol=5)
 
 
+@pytest.mark.slow
+def test_draft_partial_movies_with_final_transcode(config, tmp_path):
+    output_filename = "draft_transcoded"
+    with tempconfig(
+        {
+            "media_dir": tmp_path,
+            "quality": "low_quality",
+            "output_file": output_filename,
+            "partial_movie_preset": "ultrafast",
+            "partial_movie_crf": 0,
+            "partial_movie_intra_only": True,
+            "final_movie_preset": "slow",
+            "encoder_threads": 2,
+        }
+    ):
+        scene = StarScene()
+        scene.render()
+        partial_movie_files = [
+            path
+            for path in scene.renderer.file_writer.partial_movie_files
+            if path is not None
+        ]
+
+    with av.open(partial_movie_files[0]) as container:
+        assert all(
+            packet.is_keyframe for packet in container.demux(video=0) if packet.size
+        )
+
+    video_path = tmp_path / "videos" / "480p15" / f"{output_filename}.mp4"
+    metadata = get_video_metadata(video_path)
+    assert metadata["codec_name"] == "h264"
+    assert metadata["nb_frames"] == "30"
+    assert metadata["avg_frame_rate"] == "15/1"
+    assert metadata["duration"] == "2.000000"
+
+
+def test_global_cache_closed_after_scene(config, tmp_path, monkeypatch):
+    from manim.utils.cache_store import PartialMovieCache
+
+    closed = []
+    close = PartialMovieCache.close
+    monkeypatch.setattr(
+        PartialMovieCache, "close", lambda self: closed.append(close(self))
+    )
+    config.global_cache_dir = tmp_path
+    scene = StarScene()
+    scene.render()
+    assert len(closed) == 1
+    assert scene.renderer.file_writer.global_cache is None
+
+
 def test_scene_with_non_raw_or_wav_audio(config, manim_caplog):
     class SceneWithMP3(Scene):
         def construct(self):
@@ -185,3 +237,36 @@ def test_frame_rates():
     assert to_av_frame_rate(23.976) == Fraction(24 * 1000, 1001)
     assert to_av_frame_rate(23.98) == Fraction(24 * 1000, 1001)
     assert to_av_frame_rate(59.94) == Fraction(60 * 1000, 1001)
+
+
+def test_frame_ring_buffer_reuses_preallocated_slots():
+    ring = FrameRingBuffer(2)
+    frame = np.zeros((4, 6, 4), dtype=np.uint8)
+    slots = None
+    for value in range(5):
+        frame[:] = value
+        ring.put(frame, num_frames=value + 1)
+        index, num_frames = ring.get()
+        # The ring buffer holds a copy, the renderer may overwrite its frame.
+        frame[:] = 255
+        assert num_frames == value + 1
+        assert np.all(ring.slots[index] == value)
+        ring.release(index)
+        if slots is None:
+            slots = [id(slot) for slot in ring.slots]
+        assert [id(slot) for slot in ring.slots] == slots
+
+    ring.close()
+    assert ring.get() == (-1, 0)
+
+
+def test_frame_ring_buffer_raises_the_error_of_the_consumer():
+    ring = FrameRingBuffer(1)
+    frame = np.zeros((4, 6, 4), dtype=np.uint8)
+    ring.put(frame)
+    # The only slot is never released, the producer waits until the failure.
+    consumer = Thread(target=ring.fail, args=(RuntimeError("encoder failed"),))
+    consumer.start()
+    with pytest.raises(RuntimeError, match="encoder failed"):
+        ring.put(frame)
+    consumer.join()